@@ -1,44 +1,163 @@
-import sqlite3
-import os
+import math
+import time
 import datetime
+from typing import Any, Dict, Optional
+
+from core.memory.memory_storage import MemoryStorage, DEFAULT_DB_PATH
+
+HOUR = 3600.0
+DAY = 86400.0
+_WINDOWS = (("hour", HOUR), ("day", DAY))
+_STATS_COLUMNS = ("emotion", "count", "intensity_sum", "ewma_hour", "ewma_day",
+                  "recent_hour", "recent_day", "updated_at", "last_ts")
+
+
+def update_stats(stats: Optional[Dict[str, Any]], intensity: float, now: float, ts: str) -> Dict[str, Any]:
+    """
+    Στατιστικά ενός συναισθήματος μετά από ένα νέο δείγμα.
+    recent_* = άθροισμα βαρών exp(-ηλικία/τ) (πόσο «παρόν» είναι το συναίσθημα),
+    ewma_*   = σταθμισμένος με τα ίδια βάρη μέσος όρος έντασης.
+    """
+    stats = dict(stats) if stats else {"count": 0, "intensity_sum": 0.0, "updated_at": now,
+                                       "ewma_hour": None, "ewma_day": None,
+                                       "recent_hour": 0.0, "recent_day": 0.0}
+    dt = max(0.0, now - (stats["updated_at"] or now))
+    for window, tau in _WINDOWS:
+        keep = math.exp(-dt / tau)
+        weight = stats[f"recent_{window}"] * keep
+        mean = stats[f"ewma_{window}"]
+        total = (mean * weight if mean is not None else 0.0) + intensity
+        stats[f"recent_{window}"] = weight + 1.0
+        stats[f"ewma_{window}"] = total / (weight + 1.0)
+    stats["count"] += 1
+    stats["intensity_sum"] += intensity
+    stats["updated_at"] = now
+    stats["last_ts"] = ts
+    return stats
+
 
 class EmotionalMemory:
     """
     Συνδέει γεγονότα με συναισθήματα και μαθαίνει πώς να αντιδρά συναισθηματικά.
+    Τα στατιστικά ανά συναίσθημα (emotion_stats) ενημερώνονται σε κάθε εγγραφή,
+    στο ίδιο transaction· τα ερωτήματα διάθεσης διαβάζουν αυτόν τον μικρό πίνακα
+    (μία γραμμή ανά συναίσθημα), οπότε βλέπουν και όσα έγραψαν άλλα EmotionalMemory.
     """
-    def __init__(self, db_path="data/memory_system.db3"):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
-        self._init_db()
-
-    def _init_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS emotional_memory (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            event_ref TEXT,
-            emotion TEXT,
-            intensity REAL,
-            timestamp TEXT
-        );
-        """)
-        self.conn.commit()
+    def __init__(self, db_path=DEFAULT_DB_PATH, storage: Optional[MemoryStorage] = None):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open(db_path)
+        if (not self.storage.query_one("SELECT 1 FROM emotion_stats LIMIT 1")
+                and self.storage.query_one("SELECT 1 FROM emotional_memory LIMIT 1")):
+            self.rebuild_stats()
+
+    def _load_stats(self, emotion: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        sql = f"SELECT {', '.join(_STATS_COLUMNS)} FROM emotion_stats"
+        rows = self.storage.query(sql + " WHERE emotion=?", (emotion,)) if emotion else self.storage.query(sql)
+        return {r[0]: dict(zip(_STATS_COLUMNS[1:], r[1:])) for r in rows}
+
+    @staticmethod
+    def _save_stats(conn, emotion: str, stats: Dict[str, Any]):
+        conn.execute(f"""
+            INSERT OR REPLACE INTO emotion_stats ({', '.join(_STATS_COLUMNS)})
+            VALUES ({', '.join('?' * len(_STATS_COLUMNS))})
+        """, (emotion,) + tuple(stats[c] for c in _STATS_COLUMNS[1:]))
 
     def record_emotion(self, event_ref, emotion, intensity=0.5):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        INSERT INTO emotional_memory (event_ref, emotion, intensity, timestamp)
-        VALUES (?, ?, ?, ?)
-        """, (event_ref, emotion, intensity, datetime.datetime.now().isoformat()))
-        self.conn.commit()
+        now = time.time()
+        ts = datetime.datetime.fromtimestamp(now).isoformat()
+        intensity = 0.5 if intensity is None else float(intensity)
+        # Το emotion είναι το primary key του emotion_stats: NULL θα έγραφε νέα γραμμή κάθε φορά
+        emotion = emotion or "neutral"
+
+        # Εκτελείται στο writer thread: οι ενημερώσεις του ίδιου συναισθήματος σειριοποιούνται.
+        # Η βάση είναι η τρέχουσα γραμμή του emotion_stats, γιατί μπορεί να την έχει
+        # ενημερώσει κι άλλο EmotionalMemory του process (π.χ. του consolidator).
+        def work(conn):
+            row_id = conn.execute("""
+            INSERT INTO emotional_memory (event_ref, emotion, intensity, timestamp)
+            VALUES (?, ?, ?, ?)
+            """, (event_ref, emotion, intensity, ts)).lastrowid
+            row = conn.execute(f"SELECT {', '.join(_STATS_COLUMNS[1:])} FROM emotion_stats WHERE emotion=?",
+                               (emotion,)).fetchone()
+            current = dict(zip(_STATS_COLUMNS[1:], row)) if row else None
+            stats = update_stats(current, intensity, now, ts)
+            self._save_stats(conn, emotion, stats)
+            return row_id
+
+        return self.storage.run(work)
 
     def recall_emotions(self, emotion=None):
-        cursor = self.conn.cursor()
         if emotion:
-            cursor.execute("SELECT * FROM emotional_memory WHERE emotion=?", (emotion,))
-        else:
-            cursor.execute("SELECT * FROM emotional_memory ORDER BY id DESC LIMIT 10")
-        return cursor.fetchall()
+            return self.storage.query("SELECT * FROM emotional_memory WHERE emotion=?", (emotion,))
+        return self.storage.query("SELECT * FROM emotional_memory ORDER BY id DESC LIMIT 10")
+
+    # ------------- Στατιστικά / διάθεση -------------
+    def emotion_stats(self, emotion, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """count, μέση ένταση, EWMA ώρας/ημέρας και βάρος πρόσφατης εμφάνισης (φθαρμένο ως τώρα)."""
+        stats = self._load_stats(emotion).get(emotion)
+        if not stats:
+            return None
+        return self._summary(emotion, stats, now or time.time())
+
+    @staticmethod
+    def _summary(emotion: str, stats: Dict[str, Any], now: float) -> Dict[str, Any]:
+        dt = max(0.0, now - (stats["updated_at"] or 0.0))
+        return {
+            "emotion": emotion,
+            "count": stats["count"],
+            "mean_intensity": stats["intensity_sum"] / stats["count"] if stats["count"] else 0.0,
+            "ewma_hour": stats["ewma_hour"],
+            "ewma_day": stats["ewma_day"],
+            "recent_hour": stats["recent_hour"] * math.exp(-dt / HOUR),
+            "recent_day": stats["recent_day"] * math.exp(-dt / DAY),
+            "last_ts": stats["last_ts"],
+        }
+
+    def mood_trend(self, window="day") -> Dict[str, Any]:
+        """
+        Η τάση διάθεσης χωρίς σάρωση του πίνακα: το κυρίαρχο συναίσθημα της
+        περιόδου (hour / day) και η κατανομή των πρόσφατων βαρών.
+        """
+        now = time.time()
+        all_stats = [self._summary(e, s, now) for e, s in self._load_stats().items()]
+        weights = {s["emotion"]: s[f"recent_{window}"] for s in all_stats}
+        total = sum(weights.values())
+        if not total:
+            return {"window": window, "dominant": None, "intensity": None, "distribution": {}}
+        dominant = max(weights, key=weights.get)
+        return {
+            "window": window,
+            "dominant": dominant,
+            "intensity": next(s[f"ewma_{window}"] for s in all_stats if s["emotion"] == dominant),
+            "distribution": {e: w / total for e, w in sorted(weights.items(), key=lambda kv: -kv[1])},
+        }
+
+    def rebuild_stats(self, batch=5000):
+        """Ξαναϋπολογίζει τα στατιστικά από το ιστορικό (μία σάρωση, σε σειρά id)."""
+        def work(conn):
+            stats: Dict[str, Dict[str, Any]] = {}
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    "SELECT id, emotion, intensity, timestamp FROM emotional_memory WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch),
+                ).fetchall()
+                if not rows:
+                    break
+                for _id, emotion, intensity, ts in rows:
+                    emotion = emotion or "neutral"
+                    try:
+                        at = datetime.datetime.fromisoformat(ts).timestamp()
+                    except (TypeError, ValueError):
+                        continue
+                    stats[emotion] = update_stats(stats.get(emotion), 0.5 if intensity is None else intensity, at, ts)
+                last_id = rows[-1][0]
+            conn.execute("DELETE FROM emotion_stats")
+            for emotion, s in stats.items():
+                self._save_stats(conn, emotion, s)
+
+        self.storage.run(work)
 
     def close(self):
-        self.conn.close()
+        if self._owns_storage:
+            self.storage.close()
@@ -1,31 +1,69 @@
 # core/adaptive_learner.py
-import json
-import difflib
+import os
+import threading
 from pathlib import Path
 
+from core.learning.example_index import ExampleIndex
+from core.learning.learning_journal import JournalStore, load_json, save_json
+
+class _Examples(list):
+    """Λίστα παραδειγμάτων με set για O(1) έλεγχο διπλοτύπων στο replay (σειριοποιείται ως list)."""
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self._seen = set(self)
+
+    def add(self, text):
+        if text not in self._seen:
+            self._seen.add(text)
+            self.append(text)
+
+
 class AdaptiveLearner:
     """
     Μαθαίνει αυτόματα συνδέσεις μεταξύ λέξεων, ενεργειών και αποτελεσμάτων.
     Βασική offline “λογική μάθηση” χωρίς μοντέλο.
+    Τα παραδείγματα κρατιούνται χωρίς διπλότυπα και ευρετηριάζονται με
+    τριγράμματα (ExampleIndex), ώστε το suggest_intent να μη συγκρίνει με όλα.
+    Κάθε learn() γράφει μία γραμμή σε append-only journal (learning_journal.py)·
+    το learning_memory.json ξαναγράφεται μόνο στο compaction.
+    Ένα κοινό αντικείμενο ανά αρχείο (shared_learner()), ώστε ό,τι μαθαίνει ο
+    ReasoningManager να το βλέπει και ο IntentClassifier· το `version` αυξάνεται
+    σε κάθε νέο παράδειγμα.
     """
 
-    def __init__(self, memory_file="core/learning_memory.json"):
+    def __init__(self, memory_file="core/learning_memory.json", compact_every=500):
         self.memory_path = Path(memory_file)
+        self.journal = JournalStore(self.memory_path, load_json, save_json, self._apply, compact_every)
         self.memory = self._load_memory()
+        self.index = ExampleIndex()
+        self.version = 0
+        self._lock = threading.Lock()
+        for intent, data in self.memory.items():
+            # Παλιά αρχεία μπορεί να έχουν διπλότυπα παραδείγματα
+            data["examples"] = list(dict.fromkeys(data.get("examples", [])))
+            for example in data["examples"]:
+                self.index.add(example, intent)
 
     # -----------------------------------------------------------
     def _load_memory(self):
-        if self.memory_path.exists():
-            try:
-                with open(self.memory_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        """Snapshot + replay του journal (ανάκτηση μετά από διακοπή)."""
+        return self.journal.load()
 
     def _save_memory(self):
-        with open(self.memory_path, "w", encoding="utf-8") as f:
-            json.dump(self.memory, f, ensure_ascii=False, indent=2)
+        """Γράφει τα πάντα στο snapshot και αδειάζει το journal."""
+        self.journal.compact()
+
+    @staticmethod
+    def _apply(memory, record):
+        """Replay μιας εγγραφής {"intent", "text", "success", "fails"} του journal."""
+        data = memory.setdefault(record["intent"], {"examples": [], "success": 0, "fails": 0})
+        examples = data["examples"]
+        if not isinstance(examples, _Examples):
+            examples = data["examples"] = _Examples(examples)
+        examples.add(record["text"])
+        data["success"] = data.get("success", 0) + record.get("success", 0)
+        data["fails"] = data.get("fails", 0) + record.get("fails", 0)
 
     # -----------------------------------------------------------
     def learn(self, text, intent, result):
@@ -33,27 +71,50 @@ class AdaptiveLearner:
         t = text.lower().strip()
         intent = intent or "unknown"
 
-        if intent not in self.memory:
-            self.memory[intent] = {"examples": [], "success": 0, "fails": 0}
+        record = {
+            "intent": intent,
+            "text": t,
+            "success": 1 if "άνοιξα" in result or "έπαιξα" in result else 0,
+            "fails": 1 if "δεν" in result or "σφάλμα" in result else 0,
+        }
+        with self._lock:
+            data = self.memory.setdefault(intent, {"examples": [], "success": 0, "fails": 0})
+            if self.index.add(t, intent):
+                data["examples"].append(t)
+                self.version += 1
+            data["success"] = data.get("success", 0) + record["success"]
+            data["fails"] = data.get("fails", 0) + record["fails"]
+            self.journal.append(record)
 
-        self.memory[intent]["examples"].append(t)
-        self.memory[intent]["success"] += 1 if "άνοιξα" in result or "έπαιξα" in result else 0
-        self.memory[intent]["fails"] += 1 if "δεν" in result or "σφάλμα" in result else 0
+    def examples(self):
+        """Αντίγραφο intent → {"examples": [...]} (π.χ. για εκπαίδευση σε άλλο thread)."""
+        with self._lock:
+            return {intent: {"examples": list(data.get("examples", []))} for intent, data in self.memory.items()}
 
+    def close(self):
         self._save_memory()
 
     # -----------------------------------------------------------
     def suggest_intent(self, text):
         """Προσπαθεί να μαντέψει την πρόθεση από παλιές εμπειρίες."""
         t = text.lower().strip()
-        best_intent = None
-        best_score = 0
-        for intent, data in self.memory.items():
-            for example in data.get("examples", []):
-                score = difflib.SequenceMatcher(None, example, t).ratio()
-                if score > best_score:
-                    best_intent = intent
-                    best_score = score
+        # Υποψήφιοι από το ευρετήριο τριγραμμάτων, ακριβής σύγκριση (difflib) μόνο σε αυτούς
+        best_intent, best_score = self.index.best(t)
         if best_score > 0.6:
             return best_intent, best_score
         return None, 0
+
+
+# ------------- Κοινόχρηστοι learners -------------
+_learners = {}
+_learners_lock = threading.Lock()
+
+
+def shared_learner(memory_file="core/learning_memory.json") -> AdaptiveLearner:
+    """Ο μοναδικός AdaptiveLearner του process για αυτό το αρχείο."""
+    key = os.path.abspath(memory_file)
+    with _learners_lock:
+        learner = _learners.get(key)
+        if learner is None:
+            learner = _learners[key] = AdaptiveLearner(memory_file)
+        return learner
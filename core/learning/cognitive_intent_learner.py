@@ -1,8 +1,9 @@
 # core/cognitive_intent_learner.py
 import re
-import yaml
 from pathlib import Path
 
+from core.learning.intent_registry import intent_registry
+
 
 class CognitiveIntentLearner:
     """
@@ -13,17 +14,16 @@ class CognitiveIntentLearner:
 
     def __init__(self, yaml_path="core/intents.yaml"):
         self.yaml_path = Path(yaml_path)
-        self.intents = self._load_yaml()
+        # Κοινό μητρώο του process: το YAML δεν ξαναδιαβάζεται σε κάθε κλήση και
+        # τα νέα intents γράφονται στο journal του, όχι με ολόκληρο rewrite
+        self.registry = intent_registry(self.yaml_path)
 
-    def _load_yaml(self):
-        if not self.yaml_path.exists():
-            return {}
-        with open(self.yaml_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+    @property
+    def intents(self):
+        return self.registry.snapshot().intents
 
     def _save_yaml(self):
-        with open(self.yaml_path, "w", encoding="utf-8") as f:
-            yaml.dump(self.intents, f, allow_unicode=True)
+        self.registry.compact()
 
     def analyze_and_learn(self, text: str):
         """Αναλύει φράση και δημιουργεί νέο intent με βάση τη δομή της."""
@@ -45,8 +45,8 @@ class CognitiveIntentLearner:
         if intent_name in self.intents:
             return intent_name, "Το ήξερα ήδη αυτό."
 
-        # 4️⃣ Πρόσθεσε το στο YAML
-        self.intents[intent_name] = {"examples": [text]}
-        self._save_yaml()
+        # 4️⃣ Πρόσθεσε το στο YAML (μία γραμμή στο journal)
+        if not self.registry.add_intent(intent_name, [text]):
+            return intent_name, "Το ήξερα ήδη αυτό."
 
         return intent_name, f"Το έμαθα! Από εδώ και πέρα η φράση «{text}» σημαίνει {intent_name}."
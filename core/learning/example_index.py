@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+core/learning/example_index.py
+------------------------------
+Ανεστραμμένο ευρετήριο τριγραμμάτων για τα παραδείγματα που έχει μάθει ο AdaptiveLearner.
+• add(): O(μήκος φράσης), χωρίς διπλότυπα (ίδια φράση στο ίδιο intent = μία εγγραφή)
+• candidates(): οι φράσεις με τα περισσότερα κοινά τριγράμματα (Dice), χωρίς
+  σύγκριση με όλες τις αποθηκευμένες
+• best(): ακριβής επαναβαθμολόγηση (difflib) μόνο των κορυφαίων υποψηφίων
+"""
+
+import difflib
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.utils.pattern_matcher import normalize
+
+
+def trigrams(text: str) -> Set[str]:
+    t = f" {' '.join(normalize(text).split())} "
+    return {t[i:i + 3] for i in range(len(t) - 2)}
+
+
+class ExampleIndex:
+    """Τριγράμματα → ids παραδειγμάτων· κάθε παράδειγμα είναι (φράση, intent)."""
+
+    def __init__(self):
+        self.examples: List[Tuple[str, str]] = []
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+
+    def __len__(self):
+        return len(self.examples)
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        return item in self._ids
+
+    def add(self, text: str, intent: str) -> bool:
+        """Προσθέτει το παράδειγμα· False αν υπήρχε ήδη."""
+        key = (text, intent)
+        if key in self._ids:
+            return False
+        example_id = len(self.examples)
+        self._ids[key] = example_id
+        self.examples.append(key)
+        grams = trigrams(text)
+        self._sizes.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(example_id)
+        return True
+
+    def candidates(self, text: str, k: int = 20) -> List[Tuple[int, float]]:
+        """[(id, Dice ομοιότητα τριγραμμάτων)] για τους k καλύτερους υποψηφίους."""
+        grams = trigrams(text)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for example_id in self._postings.get(gram, ()):
+                shared[example_id] = shared.get(example_id, 0) + 1
+        scored = [(i, 2.0 * n / (len(grams) + self._sizes[i])) for i, n in shared.items()]
+        scored.sort(key=lambda x: -x[1])
+        return scored[:k]
+
+    def best(self, text: str, k: int = 20) -> Tuple[Optional[str], float]:
+        """(intent, difflib ratio) του πιο κοντινού παραδείγματος ανάμεσα στους k υποψηφίους."""
+        best_intent, best_score = None, 0.0
+        for example_id, _ in self.candidates(text, k):
+            example, intent = self.examples[example_id]
+            score = difflib.SequenceMatcher(None, example, text).ratio()
+            if score > best_score:
+                best_intent, best_score = intent, score
+        return best_intent, best_score
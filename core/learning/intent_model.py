@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+core/learning/intent_model.py
+-----------------------------
+Εκπαιδεύσιμο μοντέλο προθέσεων (intents) σε NumPy, χωρίς εξωτερικά ML πακέτα.
+• Χαρακτηριστικά: n-grams χαρακτήρων (2..4, χωρίς τόνους) με hashing σε
+  σταθερό πλήθος στηλών, κανονικοποιημένα (L2) — αντέχει ορθογραφικά λάθη.
+• Μοντέλο: γραμμικό softmax (multinomial logistic regression). Αρχικοποιείται
+  από τα κέντρα των κλάσεων και βελτιώνεται με λίγες εποχές mini-batch SGD·
+  με πολλές κλάσεις το softmax κάθε παραδείγματος περιορίζεται στη σωστή
+  κλάση + τις `negatives` πιο «μπερδεμένες» (hard negatives του αρχικού μοντέλου).
+• Πρόβλεψη: για κάθε φράση αθροίζονται μόνο οι γραμμές του W που αντιστοιχούν
+  στα n-grams της (~100), οπότε το κόστος δεν εξαρτάται από το πλήθος των
+  παραδειγμάτων· batch predict(texts) με confidence (πιθανότητα softmax).
+• Εκτός πεδίου: το softmax διαλέγει πάντα κάποια κλάση, οπότε η πρόβλεψη
+  γίνεται "unknown" όταν η φράση απέχει από τα παραδείγματα της νικήτριας
+  κλάσης — π.χ. ένα μοντέλο μίας κλάσης δεν δίνει 1.0 σε όλα. Κάθε κλάση έχει
+  ένα αραιό max-pooled διάνυσμα (μέγιστο κάθε n-gram στα τελευταία `pool_size`
+  παραδείγματά της, ώστε να μην «κορεστεί» σε πολύ μεγάλες κλάσεις), οπότε ο
+  έλεγχος είναι ένα γινόμενο ~100 στοιχείων, όσα παραδείγματα κι αν έχει.
+Δεδομένα: intents.yaml (intent → λίστα ή {"examples": [...]}) και η μνήμη του AdaptiveLearner.
+"""
+
+import os
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+from core.utils.pattern_matcher import normalize
+
+DEFAULT_INTENTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "utils", "intents.yaml")
+
+Prediction = Tuple[str, float]
+
+UNKNOWN = "unknown"
+
+
+# ------------- Δεδομένα εκπαίδευσης -------------
+def _examples_of(data: Any) -> List[str]:
+    if isinstance(data, dict):
+        data = data.get("examples", [])
+    if isinstance(data, str):
+        data = [data]
+    return [str(x) for x in (data or []) if x]
+
+
+def load_intents_yaml(yaml_path: Optional[str] = DEFAULT_INTENTS_PATH) -> Dict[str, Any]:
+    if not yaml_path or not os.path.exists(yaml_path):
+        return {}
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def collect_examples(*sources: Optional[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+    """
+    (κείμενα, intents) από dicts intent → παραδείγματα (YAML, μνήμη AdaptiveLearner), χωρίς "unknown".
+    Οι πηγές έχουν σειρά προτεραιότητας: ένα intent μεταγενέστερης πηγής που τα
+    περισσότερα παραδείγματά του ανήκουν ήδη σε intent προηγούμενης (π.χ. "time"
+    του learner και "ask_time" του YAML) συγχωνεύεται σε εκείνο, ώστε η ίδια
+    φράση να μη μοιράζει την πιθανότητα σε δύο ονόματα.
+    """
+    texts: List[str] = []
+    labels: List[str] = []
+    label_of: Dict[str, str] = {}
+    for source in sources:
+        added: Dict[str, str] = {}
+        for intent, data in (source or {}).items():
+            if not intent or intent == UNKNOWN:
+                continue
+            examples = _examples_of(data)
+            known = [label_of[normalize(e)] for e in examples if normalize(e) in label_of]
+            intent = str(intent)
+            if known:
+                alias = max(set(known), key=known.count)
+                if known.count(alias) * 2 > len(examples):
+                    intent = alias
+            for example in examples:
+                key = normalize(example)
+                if key in label_of or key in added:
+                    continue
+                added[key] = intent
+                texts.append(example)
+                labels.append(intent)
+        label_of.update(added)
+    return texts, labels
+
+
+# ------------- Χαρακτηριστικά -------------
+def _hash(gram: str, n_features: int) -> int:
+    # crc32: σταθερό ανάμεσα σε εκτελέσεις (το hash() της Python αλλάζει ανά process)
+    return zlib.crc32(gram.encode("utf-8")) % n_features
+
+
+class IntentModel:
+    """Γραμμικός softmax ταξινομητής πάνω σε hashed n-grams χαρακτήρων."""
+
+    def __init__(self, n_features: int = 1 << 14, ngram_range: Tuple[int, int] = (2, 4),
+                 min_similarity: float = 0.3, pool_size: int = 64):
+        self.n_features = int(n_features)
+        self.ngram_range = ngram_range
+        self.min_similarity = min_similarity
+        self.pool_size = pool_size
+        self.classes: List[str] = []
+        self.W: Optional[np.ndarray] = None      # (n_features, n_classes)
+        self.b: Optional[np.ndarray] = None      # (n_classes,)
+        # Max-pooled διανύσματα κλάσεων (CSR: γραμμή c = pool_ptr[c]:pool_ptr[c+1]) για τον έλεγχο «εκτός πεδίου»
+        self._pool_ptr: Optional[np.ndarray] = None
+        self._pool_idx: Optional[np.ndarray] = None
+        self._pool_val: Optional[np.ndarray] = None
+
+    @property
+    def trained(self) -> bool:
+        return self.W is not None
+
+    def _features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        t = f" {' '.join(normalize(text).split())} "
+        lo, hi = self.ngram_range
+        counts: Dict[int, int] = {}
+        for n in range(lo, hi + 1):
+            for i in range(len(t) - n + 1):
+                h = _hash(t[i:i + n], self.n_features)
+                counts[h] = counts.get(h, 0) + 1
+        if not counts:
+            counts[0] = 1
+        idx = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        val = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        return idx, val / np.linalg.norm(val)
+
+    def transform(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Αραιή αναπαράσταση: (indices, τιμές, offsets) — η γραμμή i είναι offsets[i]:offsets[i+1]."""
+        feats = [self._features(t) for t in texts]
+        offsets = np.zeros(len(feats) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(i) for i, _ in feats])
+        if not feats:
+            return np.zeros(0, np.int64), np.zeros(0, np.float32), offsets
+        return (np.concatenate([i for i, _ in feats]), np.concatenate([v for _, v in feats]), offsets)
+
+    # ------------- Εκπαίδευση -------------
+    def fit(self, texts: Sequence[str], labels: Sequence[str], epochs: int = 5, lr: float = 1.0,
+            batch_size: int = 256, negatives: int = 32, scale: float = 20.0, seed: int = 0) -> "IntentModel":
+        """
+        scale: κλίμακα των αρχικών (cosine) scores — όσο μεγαλύτερη, τόσο πιο
+        «σίγουρες» οι πιθανότητες πριν από το SGD.
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts και labels πρέπει να έχουν το ίδιο μήκος")
+        self.classes = sorted(set(labels))
+        if not self.classes:
+            self.W = self.b = None
+            return self
+        class_index = {c: i for i, c in enumerate(self.classes)}
+        y = np.array([class_index[l] for l in labels], dtype=np.int64)
+        idx, val, offsets = self.transform(texts)
+        n, C = len(texts), len(self.classes)
+        self._build_pools(idx, val, offsets, y)
+
+        # Αρχικοποίηση: κανονικοποιημένα κέντρα κλάσεων (≈ nearest centroid)
+        self.W = np.zeros((self.n_features, C), dtype=np.float32)
+        lengths = np.diff(offsets)
+        np.add.at(self.W, (idx, np.repeat(y, lengths)), val)
+        norms = np.linalg.norm(self.W, axis=0)
+        self.W /= np.where(norms > 0, norms, 1.0)
+        self.W *= scale
+        self.b = np.zeros(C, dtype=np.float32)
+
+        if C > 1 and epochs > 0:
+            # Υποψήφιες κλάσεις ανά παράδειγμα: η σωστή (στήλη 0) + οι hard negatives
+            if C <= negatives + 1:
+                others = np.array([[c for c in range(C) if c != t] for t in range(C)], dtype=np.int64)
+                cand = np.concatenate([y[:, None], others[y]], axis=1)
+            else:
+                hard = np.empty((n, negatives), dtype=np.int64)
+                for start in range(0, n, 1024):
+                    stop = min(start + 1024, n)
+                    scores = self._scores(idx, val, offsets[start:stop + 1])
+                    scores[np.arange(stop - start), y[start:stop]] = -np.inf
+                    hard[start:stop] = np.argpartition(-scores, negatives, axis=1)[:, :negatives]
+                cand = np.concatenate([y[:, None], hard], axis=1)
+            self._sgd(idx, val, offsets, cand, epochs, lr, batch_size, seed)
+        return self
+
+    def _sgd(self, idx, val, offsets, cand, epochs, lr, batch_size, seed):
+        """Mini-batch SGD του softmax πάνω στις υποψήφιες κλάσεις κάθε παραδείγματος."""
+        rng = np.random.default_rng(seed)
+        n, C = len(cand), len(self.classes)
+        Wf = self.W.reshape(-1)                                # view: W[f, c] == Wf[f * C + c]
+        for _ in range(epochs):
+            order = rng.permutation(n)
+            for start in range(0, n, batch_size):
+                rows = order[start:start + batch_size]
+                lengths = offsets[rows + 1] - offsets[rows]
+                pos = np.concatenate([np.arange(offsets[r], offsets[r + 1]) for r in rows])
+                row_of = np.repeat(np.arange(len(rows)), lengths)
+                # flat[p, j] = θέση του W[n-gram p, υποψήφια κλάση j της φράσης του p]
+                flat = idx[pos][:, None] * C + cand[rows][row_of]
+                contrib = Wf[flat] * val[pos, None]
+                starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+                G = self._softmax(np.add.reduceat(contrib, starts, axis=0) + self.b[cand[rows]])
+                G[:, 0] -= 1.0
+                G *= lr
+                np.add.at(Wf, flat.ravel(), (-G[row_of] * val[pos, None]).ravel())
+                np.add.at(self.b, cand[rows], -G)
+
+    def _build_pools(self, idx: np.ndarray, val: np.ndarray, offsets: np.ndarray, y: np.ndarray):
+        """Για κάθε (κλάση, n-gram) η μέγιστη τιμή στα τελευταία pool_size παραδείγματα της κλάσης."""
+        # Θέση κάθε παραδείγματος μετρώντας από το τέλος της κλάσης του (0 = το πιο πρόσφατο)
+        from_end = np.empty(len(y), dtype=np.int64)
+        for c, rows in enumerate(np.split(np.argsort(y, kind="stable"),
+                                          np.cumsum(np.bincount(y, minlength=len(self.classes)))[:-1])):
+            from_end[rows] = np.arange(len(rows))[::-1]
+        keep = np.repeat(from_end < self.pool_size, np.diff(offsets))
+        keys = (np.repeat(y, np.diff(offsets)) * self.n_features + idx)[keep]
+        val = val[keep]
+        order = np.argsort(keys, kind="stable")
+        keys, vals = keys[order], val[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.zeros(0, np.int64)
+        unique = keys[starts]
+        self._pool_val = np.maximum.reduceat(vals, starts) if len(keys) else np.zeros(0, np.float32)
+        self._pool_idx = unique % self.n_features
+        self._pool_ptr = np.searchsorted(unique // self.n_features, np.arange(len(self.classes) + 1))
+
+    def similarity(self, q_idx: np.ndarray, q_val: np.ndarray, c: int) -> float:
+        """
+        Γινόμενο της φράσης (αραιό διάνυσμα) με το max-pooled διάνυσμα της κλάσης c:
+        άνω φράγμα του cosine με οποιοδήποτε παράδειγμά της (ίσο για ένα παράδειγμα).
+        """
+        lo, hi = self._pool_ptr[c], self._pool_ptr[c + 1]
+        if lo == hi:
+            return 0.0
+        pool = self._pool_idx[lo:hi]
+        pos = np.minimum(np.searchsorted(pool, q_idx), len(pool) - 1)
+        hit = pool[pos] == q_idx
+        return float(q_val[hit] @ self._pool_val[lo + pos[hit]])
+
+    @staticmethod
+    def _softmax(scores: np.ndarray) -> np.ndarray:
+        scores = scores - scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    # ------------- Πρόβλεψη -------------
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """(len(texts), n_classes) πιθανότητες."""
+        if not self.trained:
+            raise RuntimeError("Το IntentModel δεν έχει εκπαιδευτεί")
+        return self._softmax(self._scores(*self.transform(texts)))
+
+    def _scores(self, idx: np.ndarray, val: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        out = np.empty((len(offsets) - 1, len(self.classes)), dtype=np.float32)
+        W = self.W
+        for i in range(len(out)):
+            lo, hi = offsets[i], offsets[i + 1]
+            # Μόνο οι γραμμές του W για τα n-grams της φράσης (~100 × κλάσεις)
+            np.dot(val[lo:hi], W[idx[lo:hi]], out=out[i])
+        out += self.b
+        return out
+
+    def predict(self, texts: Sequence[str]) -> List[Prediction]:
+        """[(intent, confidence)] για κάθε φράση· ("unknown", 0.0) αν είναι εκτός πεδίου."""
+        if not texts:
+            return []
+        if not self.trained:
+            raise RuntimeError("Το IntentModel δεν έχει εκπαιδευτεί")
+        idx, val, offsets = self.transform(texts)
+        proba = self._softmax(self._scores(idx, val, offsets))
+        best = proba.argmax(axis=1)
+        out: List[Prediction] = []
+        for i, c in enumerate(best):
+            lo, hi = offsets[i], offsets[i + 1]
+            if self.min_similarity and self.similarity(idx[lo:hi], val[lo:hi], c) < self.min_similarity:
+                out.append((UNKNOWN, 0.0))
+            else:
+                out.append((self.classes[c], float(proba[i, c])))
+        return out
+
+    def predict_one(self, text: str) -> Prediction:
+        return self.predict([text])[0]
+
+    def top_k(self, text: str, k: int = 3) -> List[Prediction]:
+        proba = self.predict_proba([text])[0]
+        best = np.argsort(-proba)[:k]
+        return [(self.classes[c], float(proba[c])) for c in best]
+
+    # ------------- Αποθήκευση -------------
+    def save(self, path: str):
+        if not self.trained:
+            raise RuntimeError("Το IntentModel δεν έχει εκπαιδευτεί")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, W=self.W, b=self.b, classes=np.array(self.classes, dtype=str),
+                            n_features=self.n_features, ngram_range=np.array(self.ngram_range),
+                            min_similarity=self.min_similarity,
+                            pool_ptr=self._pool_ptr, pool_idx=self._pool_idx, pool_val=self._pool_val)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IntentModel":
+        with np.load(path) as data:
+            model = cls(int(data["n_features"]), tuple(int(x) for x in data["ngram_range"]),
+                        float(data["min_similarity"]))
+            model.W = data["W"]
+            model.b = data["b"]
+            model.classes = [str(c) for c in data["classes"]]
+            model._pool_ptr = data["pool_ptr"]
+            model._pool_idx = data["pool_idx"]
+            model._pool_val = data["pool_val"]
+        return model
+
+    @classmethod
+    def from_sources(cls, yaml_path: Optional[str] = DEFAULT_INTENTS_PATH,
+                     learner_memory: Optional[Dict[str, Any]] = None, **fit_kwargs) -> "IntentModel":
+        """Εκπαιδεύει ένα μοντέλο από το intents.yaml και τη μνήμη του AdaptiveLearner."""
+        texts, labels = collect_examples(load_intents_yaml(yaml_path), learner_memory)
+        return cls().fit(texts, labels, **fit_kwargs)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+core/learning/intent_registry.py
+--------------------------------
+Κοινό (ανά process) μητρώο προθέσεων για ένα intents.yaml.
+• Ένα IntentRegistry ανά αρχείο (intent_registry(path)), κοινό για
+  IntentClassifier και CognitiveIntentLearner — το YAML διαβάζεται μία φορά.
+• snapshot(): αμετάβλητο IntentSnapshot (version, intents) — οι αναγνώστες
+  παίρνουν απλώς την τρέχουσα αναφορά, χωρίς lock.
+• Hot reload μόνο όταν αλλάξει το mtime/μέγεθος του YAML ή του journal του
+  (έλεγχος το πολύ κάθε `check_interval` δευτερόλεπτα).
+• add_intent(): μία γραμμή στο journal (learning_journal.py) και νέο snapshot
+  (copy-on-write) με version + 1.
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from core.learning.learning_journal import intents_journal
+
+
+def _examples_of(data: Any) -> Tuple[str, ...]:
+    if isinstance(data, dict):
+        data = data.get("examples", [])
+    if isinstance(data, str):
+        data = [data]
+    return tuple(str(x) for x in (data or []) if x)
+
+
+class IntentSnapshot:
+    """Αμετάβλητη εικόνα των intents: intent → πλειάδα παραδειγμάτων."""
+
+    __slots__ = ("version", "intents")
+
+    def __init__(self, version: int, intents: Dict[str, Tuple[str, ...]]):
+        self.version = version
+        self.intents: Mapping[str, Tuple[str, ...]] = MappingProxyType(intents)
+
+    def __contains__(self, intent: str) -> bool:
+        return intent in self.intents
+
+    def __len__(self):
+        return len(self.intents)
+
+    def examples(self, intent: str) -> Tuple[str, ...]:
+        return self.intents.get(intent, ())
+
+
+class IntentRegistry:
+    """Κάτοχος των parsed intents ενός YAML (βλ. intent_registry())."""
+
+    def __init__(self, yaml_path, check_interval: float = 1.0):
+        self.yaml_path = Path(yaml_path)
+        self.journal = intents_journal(self.yaml_path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple] = None
+        self._next_check = 0.0
+        self._snapshot = IntentSnapshot(0, {})
+        self.reload()
+
+    # ------------- Ανάγνωση -------------
+    def snapshot(self) -> IntentSnapshot:
+        """Η τρέχουσα εικόνα (ξαναφορτώνεται μόνο αν άλλαξαν τα αρχεία στον δίσκο)."""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            if self._file_stamp() != self._stamp:
+                self.reload()
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self.snapshot().version
+
+    def _file_stamp(self) -> Tuple:
+        stamp = []
+        for path in (self.yaml_path, self.journal.journal_path):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def reload(self):
+        """Διαβάζει YAML + journal και δημοσιεύει νέο snapshot."""
+        with self._lock:
+            stamp = self._file_stamp()
+            raw = self.journal.load()
+            intents = {str(name): _examples_of(data) for name, data in raw.items()}
+            self._snapshot = IntentSnapshot(self._snapshot.version + 1, intents)
+            self._stamp = stamp
+
+    # ------------- Εγγραφή -------------
+    def add_intent(self, intent: str, examples: Iterable[str]) -> bool:
+        """Νέο intent (False αν υπάρχει ήδη): append στο journal, νέο snapshot."""
+        examples = tuple(examples)
+        self.snapshot()
+        with self._lock:
+            current = self._snapshot
+            if intent in current:
+                return False
+            self.journal.append({"op": "add_intent", "intent": intent, "examples": list(examples)})
+            intents = dict(current.intents)
+            intents[intent] = examples
+            self._snapshot = IntentSnapshot(current.version + 1, intents)
+            # Η δική μας εγγραφή δεν χρειάζεται reload
+            self._stamp = self._file_stamp()
+            return True
+
+    def compact(self):
+        with self._lock:
+            self.journal.compact()
+            self._stamp = self._file_stamp()
+
+
+# ------------- Κοινόχρηστα μητρώα -------------
+_registries: Dict[str, IntentRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def intent_registry(yaml_path) -> IntentRegistry:
+    """Το μοναδικό IntentRegistry του process για αυτό το αρχείο."""
+    key = os.path.abspath(yaml_path)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                registry = _registries[key] = IntentRegistry(yaml_path)
+    return registry
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+core/learning/learning_journal.py
+---------------------------------
+Append-only ημερολόγιο (JSONL) για ό,τι μαθαίνει η Ζένια.
+• Κάθε αλλαγή γράφεται ως μία γραμμή JSON στο <snapshot>.journal.jsonl —
+  κόστος O(1) ανά εγγραφή, ανεξάρτητα από το πόσα έχουν ήδη μαθευτεί.
+• Φόρτωση = snapshot (learning_memory.json / intents.yaml) + replay του journal·
+  μια μισογραμμένη τελευταία γραμμή (crash) κόβεται στο άνοιγμα και κάθε
+  άλλη χαλασμένη γραμμή απλώς παραλείπεται.
+• Compaction (κάθε `compact_every` εγγραφές ή στο close): replay από τον δίσκο,
+  ατομική εγγραφή νέου snapshot (tmp + fsync + os.replace), άδειασμα του journal.
+  Γίνεται από τα αρχεία και όχι από την κατάσταση στη μνήμη, οπότε δεν χάνονται
+  εγγραφές άλλων αντικειμένων που μοιράζονται τα ίδια αρχεία.
+• Το compaction είναι ασφαλές σε crash σε κάθε βήμα: το journal μετονομάζεται σε
+  .compacting, το νέο snapshot γράφεται ως .next, το .compacting σβήνεται και μόνο
+  μετά το .next παίρνει τη θέση του snapshot. Στο άνοιγμα ένα .next σημαίνει ότι
+  το .compacting έχει ήδη μετρηθεί, οπότε καμία εγγραφή δεν εφαρμόζεται δύο φορές.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import yaml
+
+Record = Dict[str, Any]
+
+_locks: Dict[str, threading.RLock] = {}
+_locks_guard = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.RLock:
+    key = os.path.abspath(path)
+    with _locks_guard:
+        return _locks.setdefault(key, threading.RLock())
+
+
+class JournalStore:
+    """Snapshot + append-only journal για μια κατάσταση τύπου dict."""
+
+    def __init__(self, snapshot_path, load_snapshot: Callable[[Path], Dict[str, Any]],
+                 save_snapshot: Callable[[Path, Dict[str, Any]], None],
+                 apply: Callable[[Dict[str, Any], Record], Any], compact_every: int = 500):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_suffix(".journal.jsonl")
+        self._compacting_path = self.journal_path.with_name(self.journal_path.name + ".compacting")
+        self._next_path = self.snapshot_path.with_name(self.snapshot_path.name + ".next")
+        self._load_snapshot = load_snapshot
+        self._save_snapshot = save_snapshot
+        self._apply = apply
+        self.compact_every = compact_every
+        self._lock = _path_lock(self.snapshot_path)
+        with self._lock:
+            self._repair()
+            self._finish_compaction()
+            self._pending = self._count_records()
+
+    def _repair(self):
+        """Κόβει μια μισογραμμένη τελευταία γραμμή, ώστε οι νέες εγγραφές να ξεκινούν καθαρά."""
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    # ------------- Ανάγνωση -------------
+    def _records(self, path: Optional[Path] = None) -> Iterator[Record]:
+        path = path or self.journal_path
+        if not path.exists():
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Χαλασμένη γραμμή: παραλείπεται, οι επόμενες εγγραφές διαβάζονται κανονικά
+                    continue
+                yield record
+
+    def _count_records(self) -> int:
+        return sum(1 for _ in self._records())
+
+    def load(self) -> Dict[str, Any]:
+        """Snapshot + replay του journal."""
+        with self._lock:
+            state = self._read_snapshot()
+            for record in self._records():
+                self._apply(state, record)
+            return state
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        state = self._load_snapshot(self.snapshot_path) if self.snapshot_path.exists() else {}
+        return state if isinstance(state, dict) else {}
+
+    # ------------- Εγγραφή -------------
+    def append(self, record: Record):
+        """Μία γραμμή στο journal· compaction όταν μαζευτούν αρκετές."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._pending += 1
+            if self.compact_every and self._pending >= self.compact_every:
+                self.compact()
+
+    def compact(self):
+        """Νέο snapshot από snapshot + journal του δίσκου, και άδειασμα του journal."""
+        with self._lock:
+            if self.journal_path.exists():
+                os.replace(self.journal_path, self._compacting_path)
+            self._finish_compaction()
+            self._pending = 0
+
+    def _finish_compaction(self):
+        """Ολοκληρώνει (ή συνεχίζει μετά από crash) το compaction του .compacting."""
+        if not self._next_path.exists():
+            if not self._compacting_path.exists():
+                return
+            state = self._read_snapshot()
+            for record in self._records(self._compacting_path):
+                self._apply(state, record)
+            tmp = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            self._save_snapshot(tmp, state)
+            with open(tmp, "rb+") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, self._next_path)
+        # Το .next περιέχει ήδη το .compacting: πρώτα σβήνεται αυτό, μετά αλλάζει το snapshot
+        if self._compacting_path.exists():
+            os.remove(self._compacting_path)
+        os.replace(self._next_path, self.snapshot_path)
+
+    def close(self):
+        self.compact()
+
+
+# ------------- Μορφές snapshot -------------
+def load_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_json(path: Path, state: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def load_yaml(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def save_yaml(path: Path, state: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(state, f, allow_unicode=True)
+
+
+# ------------- intents.yaml -------------
+def apply_intent_record(intents: Dict[str, Any], record: Record):
+    """{"op": "add_intent", "intent", "examples"}: νέο intent (αν δεν υπάρχει ήδη)."""
+    if record.get("op") == "add_intent" and record.get("intent") not in intents:
+        intents[record["intent"]] = {"examples": list(record.get("examples", []))}
+
+
+def intents_journal(yaml_path, compact_every: int = 100) -> JournalStore:
+    """Το journal του intents.yaml (το χρησιμοποιεί το IntentRegistry)."""
+    return JournalStore(yaml_path, load_yaml, save_yaml, apply_intent_record, compact_every)
+
+
+def load_intents(yaml_path) -> Dict[str, Any]:
+    return intents_journal(yaml_path).load()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/async_memory.py
+---------------------------
+Fire-and-forget πρόσοψη μνήμης για τη διαδρομή απάντησης της Ζένιας.
+- Οι εγγραφές (store_event, add_turn, set_state, ensure_entity, learn) μπαίνουν
+  σε deque και εκτελούνται από έναν αποκλειστικό writer thread
+- Μετά το close() οι νέες εγγραφές εκτελούνται αμέσως στο thread του καλούντα
+- Κάθε εγγραφή παίρνει αύξοντα αριθμό (ticket)· το sync(ticket) περιμένει
+  μέχρι να εφαρμοστεί → read-your-writes για όποιον το χρειάζεται
+  (χωρίς όρισμα: το τελευταίο ticket του τρέχοντος thread)
+- Οι αναγνώσεις της πρόσοψης κάνουν sync πρώτα, άρα βλέπουν τις δικές τους εγγραφές
+"""
+
+import itertools
+import threading
+from collections import deque
+from typing import Any, Callable, Optional, Set
+
+
+class AsyncWriter:
+    """Ουρά εργασιών με έναν writer thread και αριθμημένα tickets."""
+
+    def __init__(self, name: str = "AsyncMemoryWriter"):
+        self._queue: deque = deque()
+        self._tickets = itertools.count(1)
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._applied = 0                  # όλα τα tickets ≤ _applied έχουν εκτελεστεί
+        self._done_out_of_order: Set[int] = set()
+        self._applied_cond = threading.Condition()
+        self._running = True
+        # Το submit και το close δεν διασταυρώνονται: ό,τι μπει στην ουρά το βλέπει ο writer
+        self._submit_lock = threading.Lock()
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> int:
+        """
+        Βάζει την εργασία στην ουρά και επιστρέφει αμέσως το ticket της.
+        Μετά το close() την εκτελεί επιτόπου (δεν υπάρχει πια writer να την πάρει).
+        """
+        with self._submit_lock:
+            ticket = next(self._tickets)
+            self._local.last_ticket = ticket
+            if self._running:
+                self._queue.append((ticket, fn, args, kwargs))
+                self._wake.set()
+                return ticket
+        self._run(ticket, fn, args, kwargs)
+        return ticket
+
+    def sync(self, ticket: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Περιμένει να εφαρμοστεί το ticket (default: το τελευταίο αυτού του thread)."""
+        target = getattr(self._local, "last_ticket", 0) if ticket is None else ticket
+        if threading.current_thread() is self._thread:
+            return True
+        if not self._thread.is_alive():
+            # Ο writer έχει σταματήσει: ό,τι έμεινε στην ουρά εκτελείται εδώ
+            self._drain()
+        with self._applied_cond:
+            return self._applied_cond.wait_for(lambda: self._applied >= target, timeout=timeout)
+
+    def _mark_applied(self, ticket: int):
+        with self._applied_cond:
+            self._done_out_of_order.add(ticket)
+            while self._applied + 1 in self._done_out_of_order:
+                self._applied += 1
+                self._done_out_of_order.discard(self._applied)
+            self._applied_cond.notify_all()
+
+    def _run(self, ticket: int, fn: Callable[..., Any], args, kwargs):
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = e
+        finally:
+            self._mark_applied(ticket)
+
+    def _drain(self):
+        while True:
+            try:
+                ticket, fn, args, kwargs = self._queue.popleft()
+            except IndexError:
+                return
+            self._run(ticket, fn, args, kwargs)
+
+    def _loop(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self._drain()
+            if not self._running and not self._queue:
+                break
+
+    def close(self, timeout: float = 5.0):
+        """Σταματά τον writer αφού εκτελέσει ό,τι έχει μείνει στην ουρά."""
+        with self._submit_lock:
+            self._running = False
+        self._wake.set()
+        self._thread.join(timeout=timeout)
+
+
+class AsyncMemory:
+    """
+    Πρόσοψη πάνω σε MemoryManager + WorldModel (+ AdaptiveLearner): οι εγγραφές δεν
+    μπλοκάρουν ποτέ τον καλούντα· οι αναγνώσεις περιμένουν πρώτα τις εκκρεμείς εγγραφές.
+    """
+
+    def __init__(self, memory, world_model=None, learner=None):
+        self.memory = memory
+        self.world_model = world_model
+        self.learner = learner
+        self.writer = AsyncWriter()
+
+    # ------------- Εγγραφές (fire-and-forget) -------------
+    def store_event(self, event_type, content, emotion="neutral", importance=0.5) -> int:
+        return self.writer.submit(self.memory.store_event, event_type=event_type, content=content,
+                                  emotion=emotion, importance=importance)
+
+    def add_turn(self, role, text, meta=None) -> int:
+        return self.writer.submit(self.memory.add_turn, role, text, meta)
+
+    def set_state(self, key, value) -> int:
+        return self.writer.submit(self.world_model.set_state, key, value)
+
+    def ensure_entity(self, name, type_="", attrs_json="{}") -> int:
+        return self.writer.submit(self.world_model.ensure_entity, name, type_, attrs_json)
+
+    def learn(self, text, intent, result) -> int:
+        """Journal append (και compaction, όταν έρθει η ώρα του) στον writer."""
+        return self.writer.submit(self.learner.learn, text, intent, result)
+
+    # ------------- Αναγνώσεις (read-your-writes) -------------
+    def sync(self, ticket: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        return self.writer.sync(ticket, timeout)
+
+    def get_state(self, key):
+        self.sync()
+        return self.world_model.get_state(key)
+
+    def get_entity(self, name):
+        self.sync()
+        return self.world_model.get_entity(name)
+
+    def get_recent(self, limit=20, before_id=None):
+        self.sync()
+        return self.memory.get_recent(limit, before_id)
+
+    def search(self, query, top_k=10):
+        self.sync()
+        return self.memory.search(query, top_k=top_k)
+
+    # ------------- Τερματισμός -------------
+    def flush(self):
+        """Περιμένει την ουρά και γράφει τα buffers της μνήμης στον δίσκο."""
+        self.sync()
+        self.memory.flush()
+
+    def close(self):
+        self.writer.close()
+        self.memory.flush()
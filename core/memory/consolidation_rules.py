@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/consolidation_rules.py
+----------------------------------
+Δηλωτικοί κανόνες ενοποίησης μνήμης (consolidation_rules.yaml).
+Όλα τα patterns όλων των κανόνων μεταγλωττίζονται μία φορά σε έναν
+MultiPatternMatcher, οπότε κάθε γεγονός ελέγχεται σε ένα πέρασμα
+ανεξάρτητα από το πλήθος των κανόνων.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from core.utils.pattern_matcher import MultiPatternMatcher, normalize
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "consolidation_rules.yaml")
+
+Concept = Tuple[str, str, str]
+
+
+def _as_set(value) -> Optional[frozenset]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return frozenset(str(v) for v in value)
+    return frozenset([str(value)])
+
+
+class ConsolidationRules:
+    """Αντιστοιχίζει (περιεχόμενο, συναίσθημα, τύπο γεγονότος) σε σημασιολογικές έννοιες."""
+
+    def __init__(self, rules: Sequence[Dict[str, Any]]):
+        self.rules: List[Dict[str, Any]] = []
+        self._by_pattern: Dict[str, List[int]] = {}
+        for rule in rules:
+            patterns = rule.get("patterns") or []
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            if not patterns or not rule.get("concept"):
+                continue
+            index = len(self.rules)
+            self.rules.append({
+                "name": rule.get("name") or rule["concept"],
+                "emotion": _as_set(rule.get("emotion")),
+                "event_type": _as_set(rule.get("event_type")),
+                "concept": (str(rule["concept"]), str(rule.get("category", "")), str(rule.get("description", ""))),
+            })
+            for pattern in patterns:
+                self._by_pattern.setdefault(normalize(str(pattern)), []).append(index)
+        self.matcher = MultiPatternMatcher(self._by_pattern.keys())
+
+    @classmethod
+    def from_yaml(cls, path: str = DEFAULT_RULES_PATH) -> "ConsolidationRules":
+        if not os.path.exists(path):
+            return cls([])
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        return cls(data.get("rules", []) if isinstance(data, dict) else [])
+
+    def concepts_for(self, content: str, emotion: str = "", event_type: str = "") -> List[Concept]:
+        """Οι έννοιες όλων των κανόνων που ταιριάζουν στο γεγονός."""
+        hits = set()
+        for pattern in self.matcher.matches(content):
+            hits.update(self._by_pattern[pattern])
+        concepts = []
+        for index in sorted(hits):
+            rule = self.rules[index]
+            if rule["emotion"] is not None and emotion not in rule["emotion"]:
+                continue
+            if rule["event_type"] is not None and event_type not in rule["event_type"]:
+                continue
+            concepts.append(rule["concept"])
+        return concepts
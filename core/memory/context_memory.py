@@ -1,11 +1,13 @@
 # core/context_memory.py
 import time
 
+from core.utils.history_buffer import HistoryBuffer
+
 class ContextMemory:
     """Μνήμη λογικής — θυμάται τι έγινε πρόσφατα (apps, intents, δράσεις)."""
 
-    def __init__(self):
-        self.memory = []
+    def __init__(self, max_entries: int = 50):
+        self.memory = HistoryBuffer(max_entries, key=lambda e: f"{e['entity']}\n{e['intent']}")
 
     def remember(self, intent: str, entity: str = None, result: str = None):
         """Αποθηκεύει τι έκανε η Ζένια."""
@@ -15,19 +17,14 @@ class ContextMemory:
             "entity": entity or "",
             "result": result or ""
         })
-        if len(self.memory) > 50:
-            self.memory.pop(0)
 
     def last_action(self):
         """Επιστρέφει την τελευταία ενέργεια."""
-        return self.memory[-1] if self.memory else None
+        return self.memory.last()
 
     def find_recent(self, keyword: str):
         """Βρίσκει πρόσφατη ενέργεια σχετική με λέξη."""
-        for entry in reversed(self.memory):
-            if keyword.lower() in entry["entity"].lower() or keyword.lower() in entry["intent"].lower():
-                return entry
-        return None
+        return self.memory.find_recent(keyword)
 
     def clear(self):
         self.memory.clear()
@@ -1,2 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/conversation_memory.py
+----------------------------------
+Ιστορικό συνομιλίας της Ζένιας (zenia_memory.db → interactions).
+- Append-only: κάθε γύρος παίρνει αύξον id (turn id)
+- get_recent με keyset pagination (before_id) αντί για OFFSET
+- Cache με τους τελευταίους N γύρους: το prompt παίρνει ιστορικό χωρίς βάση
+- export_json γράφει γραμμή-γραμμή, χωρίς να φορτώνει όλο τον πίνακα
+"""
+
+import json
+import datetime
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_schema import ZENIA_MEMORY_MIGRATIONS
+from core.memory.storage_catalog import store_path
+
+DEFAULT_CONVERSATION_DB = store_path("conversation")
+
+
+def stream_json_array(f, items: Iterable[Any], indent: str = "  "):
+    """Γράφει JSON array ένα στοιχείο τη φορά."""
+    f.write("[")
+    first = True
+    for item in items:
+        f.write("\n" if first else ",\n")
+        f.write(indent + json.dumps(item, ensure_ascii=False))
+        first = False
+    f.write("\n]" if not first else "]")
+
+
 class ConversationMemory:
-    pass
+    """Μόνιμο ιστορικό γύρων διαλόγου (role: user / assistant)."""
+
+    def __init__(self, db_path: str = DEFAULT_CONVERSATION_DB, storage: Optional[MemoryStorage] = None,
+                 tail_size: int = 50):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open(db_path, migrations=ZENIA_MEMORY_MIGRATIONS)
+        self.tail_size = tail_size
+        self._tail: deque = deque(maxlen=tail_size)
+        self._tail_loaded = False
+        self._tail_complete = False     # True αν η cache περιέχει ΟΛΟ το ιστορικό
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _row_to_turn(row) -> Dict[str, Any]:
+        turn_id, ts, role, text, meta = row
+        try:
+            meta = json.loads(meta) if meta else {}
+        except (TypeError, ValueError):
+            meta = {"raw": meta}
+        return {"id": turn_id, "ts": ts, "role": role, "text": text, "meta": meta}
+
+    def _load_tail(self):
+        if self._tail_loaded:
+            return
+        rows = self.storage.query(
+            "SELECT id, ts, role, text, meta FROM interactions ORDER BY id DESC LIMIT ?", (self.tail_size,)
+        )
+        self._tail.extend(self._row_to_turn(r) for r in reversed(rows))
+        self._tail_complete = len(rows) < self.tail_size
+        self._tail_loaded = True
+
+    # ------------- Εγγραφή -------------
+    def add_turn(self, role: str, text: str, meta: Optional[Dict[str, Any]] = None) -> int:
+        """Προσθέτει έναν γύρο και επιστρέφει το turn id του."""
+        ts = datetime.datetime.now().isoformat(timespec="seconds")
+        meta_json = json.dumps(meta, ensure_ascii=False) if meta else None
+        with self._lock:
+            self._load_tail()
+            turn_id = self.storage.execute(
+                "INSERT INTO interactions (ts, role, text, meta) VALUES (?, ?, ?, ?)",
+                (ts, role, text, meta_json),
+            )
+            if len(self._tail) == self.tail_size:
+                self._tail_complete = False
+            self._tail.append({"id": turn_id, "ts": ts, "role": role, "text": text, "meta": meta or {}})
+        return turn_id
+
+    # ------------- Ανάγνωση -------------
+    def get_recent(self, limit: int = 20, before_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Οι τελευταίοι `limit` γύροι (πριν το before_id, αν δοθεί), σε χρονολογική σειρά.
+        Για την επόμενη σελίδα: before_id = το id του πρώτου στοιχείου.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            self._load_tail()
+            if before_id is None and (limit <= len(self._tail) or self._tail_complete):
+                return list(self._tail)[-limit:]
+        if before_id is None:
+            rows = self.storage.query(
+                "SELECT id, ts, role, text, meta FROM interactions ORDER BY id DESC LIMIT ?", (limit,)
+            )
+        else:
+            rows = self.storage.query(
+                "SELECT id, ts, role, text, meta FROM interactions WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (before_id, limit),
+            )
+        return [self._row_to_turn(r) for r in reversed(rows)]
+
+    def history(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Ιστορικό για το PromptBuilder (από τη cache όταν χωράει)."""
+        return self.get_recent(limit)
+
+    def iter_turns(self, batch: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Όλοι οι γύροι με τη σειρά, σε σελίδες των `batch` (keyset pagination)."""
+        last_id = 0
+        while True:
+            rows = self.storage.query(
+                "SELECT id, ts, role, text, meta FROM interactions WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch),
+            )
+            if not rows:
+                return
+            for row in rows:
+                yield self._row_to_turn(row)
+            last_id = rows[-1][0]
+
+    def export_json(self, path: str):
+        """Εξάγει όλο το ιστορικό σε JSON, γραμμή-γραμμή."""
+        with open(path, "w", encoding="utf-8") as f:
+            stream_json_array(f, self.iter_turns())
+            f.write("\n")
+
+    def clear(self):
+        """Διαγράφει όλο το ιστορικό (και τη cache)."""
+        with self._lock:
+            self.storage.execute("DELETE FROM interactions")
+            self._tail.clear()
+            self._tail_complete = True
+            self._tail_loaded = True
+
+    def close(self):
+        if self._owns_storage:
+            self.storage.close()
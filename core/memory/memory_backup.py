@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_backup.py
+----------------------------
+Αντίγραφα ασφαλείας των βάσεων της Ζένιας.
+- Online backup με `VACUUM INTO`: ένα συνεπές snapshot σε μία ανάγνωση (WAL),
+  οπότε οι writers δεν μπλοκάρουν και το backup δεν ξαναρχίζει σε κάθε commit
+  (όπως το incremental backup API από ξεχωριστή σύνδεση)
+- Μαζί με κάθε βάση αντιγράφονται και τα αρχεία διανυσμάτων της (<βάση>.vectors.*)
+- Εξαγωγή episodic μνήμης σε στηλοθετημένα chunks NumPy (.npz, συμπιεσμένα):
+  αριθμητικές στήλες ως πίνακες, κείμενα ως utf-8 bytes + offsets (όπως το Arrow)
+- Μαζική επαναφορά των chunks με executemany και ένα ενιαίο ξαναχτίσιμο του FTS
+"""
+
+import os
+import glob
+import json
+import shutil
+import sqlite3
+import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_consolidator import WATERMARK_KEY
+from core.memory.storage_catalog import PROJECT_ROOT, default_catalog
+from core.utils.text_tools import fold_accents, fold_accents_sql
+
+# Οι βάσεις που καλύπτει το backup_all: όλες οι αποθήκες του καταλόγου (storage.yaml)
+DEFAULT_DATABASES = list(default_catalog().stores.values())
+
+EPISODIC_COLUMNS = ["id", "timestamp", "user", "event_type", "content", "emotion", "importance"]
+_TEXT_COLUMNS = ["timestamp", "user", "event_type", "content", "emotion"]
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+
+# ------------- Online backup -------------
+VECTOR_SUFFIXES = (".vectors.f32", ".vectors.ids", ".vectors.json")
+
+
+def _copy_vectors(src_db: str, dest_db: str) -> bool:
+    """
+    Αντιγράφει τα αρχεία διανυσμάτων (VectorStore) της src_db δίπλα στην dest_db.
+    Αν η πηγή δεν έχει, σβήνει όσα έχει ο προορισμός, ώστε να ξαναχτιστούν
+    από τη βάση (MemoryManager._sync_vectors) αντί να μείνουν ασυγχρόνιστα.
+    """
+    src_base, dest_base = os.path.splitext(src_db)[0], os.path.splitext(dest_db)[0]
+    if not os.path.exists(src_base + ".vectors.json"):
+        for suffix in VECTOR_SUFFIXES:
+            if os.path.exists(dest_base + suffix):
+                os.remove(dest_base + suffix)
+        return False
+    # Το meta (count) τελευταίο: δεν δείχνει ποτέ γραμμές που δεν αντιγράφηκαν
+    for suffix in VECTOR_SUFFIXES:
+        tmp = dest_base + suffix + ".tmp"
+        shutil.copyfile(src_base + suffix, tmp)
+        os.replace(tmp, dest_base + suffix)
+    return True
+
+
+def backup_database(src_path: str, dest_path: str) -> str:
+    """
+    Αντιγράφει μια ζωντανή βάση στο dest_path χωρίς να σταματά τους writers
+    (VACUUM INTO: ένα snapshot, ανεξάρτητο από τα commits που γίνονται στο μεταξύ).
+    Γράφει πρώτα σε .tmp και το μετονομάζει στο τέλος (το backup είναι πάντα πλήρες).
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+    tmp = f"{dest_path}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    src = sqlite3.connect(src_path, timeout=30.0)
+    try:
+        src.execute("VACUUM INTO ?", (tmp,))
+    finally:
+        src.close()
+    os.replace(tmp, dest_path)
+    _copy_vectors(src_path, dest_path)
+    return dest_path
+
+
+def backup_all(dest_dir: Optional[str] = None, databases: Optional[Sequence[str]] = None) -> Dict[str, str]:
+    """
+    Online backup όλων των βάσεων σε φάκελο με χρονοσφραγίδα.
+    Επιστρέφει {πηγή: αντίγραφο}· βάσεις που δεν υπάρχουν παραλείπονται.
+    """
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    dest_dir = dest_dir or os.path.join(default_catalog().data_dir, "backups", stamp)
+    done = {}
+    for rel in databases or DEFAULT_DATABASES:
+        src = rel if os.path.isabs(rel) else os.path.join(PROJECT_ROOT, rel)
+        if not os.path.exists(src):
+            continue
+        done[src] = backup_database(src, os.path.join(dest_dir, os.path.basename(src)))
+    return done
+
+
+def restore_database(backup_path: str, dest_path: str) -> str:
+    """
+    Επαναφέρει ένα αντίγραφο πάνω στη βάση, σε ένα βήμα του backup API (pages=-1),
+    ώστε writes άλλων συνδέσεων να μη μπλέκονται με μισοαντιγραμμένες σελίδες.
+    Επαναφέρει και τα αρχεία διανυσμάτων (ή τα σβήνει για να ξαναχτιστούν)·
+    αυτά είναι memory-mapped, οπότε η επαναφορά γίνεται με τη Ζένια σταματημένη.
+    """
+    src = sqlite3.connect(backup_path)
+    dest = sqlite3.connect(dest_path, timeout=30.0)
+    try:
+        src.backup(dest, pages=-1)
+    finally:
+        dest.close()
+        src.close()
+    _copy_vectors(backup_path, dest_path)
+    return dest_path
+
+
+# ------------- Στήλες κειμένου -------------
+def _pack_text(values: Sequence[Optional[str]]) -> Dict[str, np.ndarray]:
+    encoded = [(v or "").encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    return {
+        "data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "offsets": offsets,
+        "nulls": np.fromiter((v is None for v in values), dtype=bool, count=len(values)),
+    }
+
+
+def _unpack_text(data: np.ndarray, offsets: np.ndarray, nulls: np.ndarray) -> List[Optional[str]]:
+    buf = data.tobytes()
+    bounds = offsets.tolist()
+    return [None if null else buf[bounds[i]:bounds[i + 1]].decode("utf-8")
+            for i, null in enumerate(nulls.tolist())]
+
+
+# ------------- Στηλοθετημένη εξαγωγή -------------
+def export_episodic_npz(db_path: str, out_dir: str, chunk_rows: int = 100_000) -> Dict[str, Any]:
+    """
+    Γράφει την episodic_memory σε chunks episodic-NNNNNN.npz + manifest.json.
+    Διαβάζει από read-only σύνδεση σε ένα snapshot (WAL), γραμμή-γραμμή ανά chunk.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    conn = sqlite3.connect(f"file:{os.path.abspath(db_path)}?mode=ro", uri=True, timeout=30.0)
+    manifest = {"table": "episodic_memory", "format": FORMAT_VERSION, "columns": EPISODIC_COLUMNS,
+                "created": datetime.datetime.now().isoformat(timespec="seconds"), "rows": 0, "chunks": []}
+    try:
+        cur = conn.execute(f"SELECT {', '.join(EPISODIC_COLUMNS)} FROM episodic_memory ORDER BY id")
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                break
+            cols = list(zip(*rows))
+            arrays = {
+                "id": np.asarray(cols[0], dtype=np.int64),
+                "importance": np.asarray([np.nan if v is None else v for v in cols[6]], dtype=np.float64),
+            }
+            for name in _TEXT_COLUMNS:
+                for part, arr in _pack_text(cols[EPISODIC_COLUMNS.index(name)]).items():
+                    arrays[f"{name}.{part}"] = arr
+
+            fname = f"episodic-{len(manifest['chunks']):06d}.npz"
+            np.savez_compressed(os.path.join(out_dir, fname), **arrays)
+            manifest["chunks"].append({"file": fname, "rows": len(rows),
+                                       "min_id": int(arrays["id"][0]), "max_id": int(arrays["id"][-1])})
+            manifest["rows"] += len(rows)
+    finally:
+        conn.close()
+
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def _chunk_files(src_dir: str) -> List[str]:
+    manifest_path = os.path.join(src_dir, MANIFEST)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return [os.path.join(src_dir, c["file"]) for c in json.load(f)["chunks"]]
+    files = sorted(glob.glob(os.path.join(src_dir, "episodic-*.npz")))
+    if not files:
+        raise FileNotFoundError(f"Δεν βρέθηκαν episodic chunks (ούτε {MANIFEST}) στο {src_dir}")
+    return files
+
+
+def iter_episodic_npz(src_dir: str) -> Iterator[Dict[str, Any]]:
+    """Διαβάζει τα chunks ως dict στηλών (id/importance: ndarray, κείμενα: λίστες)."""
+    for path in _chunk_files(src_dir):
+        with np.load(path) as npz:
+            chunk: Dict[str, Any] = {"id": npz["id"], "importance": npz["importance"]}
+            for name in _TEXT_COLUMNS:
+                chunk[name] = _unpack_text(npz[f"{name}.data"], npz[f"{name}.offsets"], npz[f"{name}.nulls"])
+        yield chunk
+
+
+# ------------- Μαζική επαναφορά -------------
+def restore_episodic_npz(src_dir: str, db_path: Optional[str] = None,
+                         storage: Optional[MemoryStorage] = None, replace: bool = False,
+                         cache_mb: int = 256) -> int:
+    """
+    Φορτώνει τα chunks στην episodic_memory (κρατά τα αρχικά ids), σε ένα transaction
+    (μαζί με τα DROP/CREATE: αν αποτύχει ένα chunk, triggers και indexes επανέρχονται).
+    Όσο διαρκεί η φόρτωση τα FTS triggers και τα indexes αφαιρούνται και
+    ξαναχτίζονται μία φορά στο τέλος (ταξινόμηση αντί για ενημέρωση ανά γραμμή).
+    Με replace=True αδειάζει πρώτα τον πίνακα· αλλιώς ids που υπάρχουν ήδη αγνοούνται.
+    """
+    _chunk_files(src_dir)           # λάθος φάκελος → σφάλμα πριν αγγίξουμε τη βάση
+    own = storage is None
+    storage = storage or MemoryStorage.open(db_path)
+    insert_sql = (f"INSERT OR IGNORE INTO episodic_memory ({', '.join(EPISODIC_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * len(EPISODIC_COLUMNS))})")
+
+    def work(conn: sqlite3.Connection) -> int:
+        # Ο sqlite3 δεν ανοίγει μόνος του transaction για DDL: χωρίς ρητό BEGIN τα
+        # DROP θα γίνονταν autocommit και δεν θα αναιρούνταν στο rollback
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        ddl = conn.execute("""
+            SELECT type, name, sql FROM sqlite_master
+            WHERE sql IS NOT NULL AND ((type = 'trigger' AND name LIKE 'trg_episodic_fts_%')
+                                       OR (type = 'index' AND tbl_name = 'episodic_memory'))
+        """).fetchall()
+        for kind, name, _sql in ddl:
+            conn.execute(f"DROP {kind.upper()} {name}")
+        cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+        conn.execute(f"PRAGMA cache_size = {-1024 * int(cache_mb)}")
+
+        if replace:
+            conn.execute("DELETE FROM episodic_fts")
+            conn.execute("DELETE FROM episodic_memory")
+            conn.execute("DELETE FROM memory_meta WHERE key = ?", (WATERMARK_KEY,))
+        # Σε άδειο πίνακα το FTS γεμίζει μαζί με τα chunks (fold στην Python)
+        empty = conn.execute("SELECT 1 FROM episodic_memory LIMIT 1").fetchone() is None
+
+        try:
+            loaded = 0
+            for chunk in iter_episodic_npz(src_dir):
+                ids = chunk["id"].tolist()
+                importance = [None if np.isnan(v) else v for v in chunk["importance"].tolist()]
+                conn.executemany(insert_sql, zip(ids, chunk["timestamp"], chunk["user"], chunk["event_type"],
+                                                 chunk["content"], chunk["emotion"], importance))
+                if empty:
+                    conn.executemany("INSERT INTO episodic_fts(rowid, content) VALUES (?, ?)",
+                                     zip(ids, (fold_accents(c or "") for c in chunk["content"])))
+                loaded += len(ids)
+
+            if not empty:
+                conn.execute(f"""
+                    INSERT INTO episodic_fts(rowid, content)
+                    SELECT id, {fold_accents_sql('content')} FROM episodic_memory
+                    WHERE id NOT IN (SELECT rowid FROM episodic_fts)
+                """)
+            for _kind, _name, sql in ddl:
+                conn.execute(sql)
+            return loaded
+        finally:
+            conn.execute(f"PRAGMA cache_size = {cache_size}")
+
+    try:
+        return storage.run(work)
+    finally:
+        if own:
+            storage.close()
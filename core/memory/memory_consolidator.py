@@ -1,26 +1,110 @@
+import threading
+from typing import Iterable, Optional
+
+from core.memory.memory_storage import MemoryStorage
 from core.memory.memory_episodic import EpisodicMemory
 from core.memory.memory_semantic import SemanticMemory
+from core.memory.memory_jobs import PeriodicJob
+from core.memory.consolidation_rules import ConsolidationRules, DEFAULT_RULES_PATH
 from core.emotion.memory_emotional import EmotionalMemory
 
+WATERMARK_KEY = "consolidator.last_id"
+
 class MemoryConsolidator:
     """
     Συνδυάζει τις μνήμες της Ζένιας — μετατρέπει εμπειρίες σε γνώση.
     Π.χ. “Όταν ο Άγγελος είναι κουρασμένος, του αρέσει η ήσυχη μουσική.”
+
+    Κρατά watermark (το τελευταίο id που ενοποιήθηκε) στο memory_meta και
+    διαβάζει μόνο νέα γεγονότα σε batches. Οι έννοιες και το watermark
+    γράφονται στο ίδιο transaction, οπότε κάθε εκτέλεση είναι idempotent.
+    Οι κανόνες έρχονται από το consolidation_rules.yaml (βλ. ConsolidationRules).
     """
-    def __init__(self):
-        self.epi = EpisodicMemory()
-        self.sem = SemanticMemory()
-        self.em = EmotionalMemory()
-
-    def consolidate(self):
-        recent = self.epi.recall_recent(20)
-        for _, t, u, etype, content, emotion, imp in recent:
-            if "μουσική" in content and emotion == "χαρά":
-                self.sem.add_concept("μουσική", "προτίμηση", "Η Ζένια συνδέει τη μουσική με ευχαρίστηση.")
-            if "κουρασμένος" in content:
-                self.sem.add_concept("ξεκούραση", "ανάγκη", "Η Ζένια έμαθε ότι ο Άγγελος χρειάζεται ξεκούραση όταν είναι κουρασμένος.")
+    def __init__(self, storage: Optional[MemoryStorage] = None,
+                 episodic: Optional[EpisodicMemory] = None,
+                 semantic: Optional[SemanticMemory] = None,
+                 emotional: Optional[EmotionalMemory] = None,
+                 batch_size: int = 500, interval: float = 30.0,
+                 rules_path: str = DEFAULT_RULES_PATH):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open()
+        # Υπομνήμες που δίνονται απ' έξω (π.χ. από MemoryManager) δεν κλείνουν εδώ
+        self._owned = []
+        self.epi = episodic or self._own(EpisodicMemory(storage=self.storage))
+        self.sem = semantic or self._own(SemanticMemory(storage=self.storage))
+        self.em = emotional or self._own(EmotionalMemory(storage=self.storage))
+
+        self.rules = ConsolidationRules.from_yaml(rules_path)
+        self.batch_size = batch_size
+        self._run_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.job = PeriodicJob("MemoryConsolidator", self.consolidate, interval)
+
+    def _own(self, memory):
+        self._owned.append(memory)
+        return memory
+
+    # ------------- Watermark -------------
+    @property
+    def watermark(self) -> int:
+        row = self.storage.query_one("SELECT value FROM memory_meta WHERE key=?", (WATERMARK_KEY,))
+        return int(row[0]) if row else 0
+
+    # ------------- Ενοποίηση -------------
+    def consolidate(self, max_batches: Optional[int] = None) -> int:
+        """
+        Ενοποιεί όλα τα γεγονότα μετά το watermark (ή έως max_batches batches).
+        Επιστρέφει πόσα γεγονότα επεξεργάστηκαν.
+        """
+        with self._run_lock:
+            self.epi.flush()
+            processed = 0
+            batches = 0
+            last_id = self.watermark
+            while not self._stopping.is_set() and (max_batches is None or batches < max_batches):
+                rows = self.storage.query(
+                    "SELECT id, content, emotion, event_type FROM episodic_memory WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, self.batch_size),
+                )
+                if not rows:
+                    break
+                concepts = {}
+                for _, content, emotion, event_type in rows:
+                    for concept, category, description in self.rules.concepts_for(
+                            content or "", emotion or "", event_type or ""):
+                        concepts[(concept, category)] = description
+                last_id = rows[-1][0]
+                self.storage.run(lambda conn, c=concepts, wm=last_id: self._commit_batch(conn, c.items(), wm))
+                processed += len(rows)
+                batches += 1
+            return processed
+
+    @staticmethod
+    def _commit_batch(conn, concepts: Iterable, watermark: int):
+        conn.executemany("""
+        INSERT INTO semantic_memory (concept, category, description)
+        VALUES (?, ?, ?)
+        ON CONFLICT(concept, category) DO UPDATE SET description=excluded.description
+        """, [(concept, category, description) for (concept, category), description in concepts])
+        # Το watermark δεν πάει ποτέ πίσω, ακόμη κι αν τρέχουν δύο consolidators
+        conn.execute("""
+        INSERT INTO memory_meta (key, value) VALUES (?, ?)
+        ON CONFLICT(key) DO UPDATE SET value=MAX(CAST(value AS INTEGER), CAST(excluded.value AS INTEGER))
+        """, (WATERMARK_KEY, watermark))
+
+    # ------------- Background -------------
+    def start(self):
+        """Ξεκινά την περιοδική ενοποίηση στο παρασκήνιο."""
+        self._stopping.clear()
+        self.job.start()
+
+    def stop(self):
+        self._stopping.set()
+        self.job.stop()
 
     def shutdown(self):
-        self.epi.close()
-        self.sem.close()
-        self.em.close()
+        self.stop()
+        for memory in self._owned:
+            memory.close()
+        if self._owns_storage:
+            self.storage.close()
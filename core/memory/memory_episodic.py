@@ -1,43 +1,106 @@
-import sqlite3
-import os
 import datetime
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from core.memory.memory_storage import MemoryStorage, DEFAULT_DB_PATH
 
 class EpisodicMemory:
     """
     Καταγράφει εμπειρίες της Ζένιας: γεγονότα, context, συναισθήματα, συμμετέχοντες.
+    Οι εγγραφές μπαίνουν σε write-behind buffer και γράφονται μαζικά σε ένα
+    transaction όταν γεμίσει (batch_size) ή περάσει το flush_interval.
+    Οι listeners (add_listener) ειδοποιούνται με [(id, content)] μετά από κάθε commit.
     """
-    def __init__(self, db_path="data/memory_system.db3"):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
-        self._init_db()
-
-    def _init_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS episodic_memory (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT,
-            user TEXT,
-            event_type TEXT,
-            content TEXT,
-            emotion TEXT,
-            importance REAL
-        );
-        """)
-        self.conn.commit()
+    def __init__(self, db_path=DEFAULT_DB_PATH, storage: Optional[MemoryStorage] = None,
+                 batch_size: int = 256, flush_interval: float = 0.2):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: List[Tuple] = []
+        self._pending_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._listeners: List[Callable[[List[Tuple[int, str]]], None]] = []
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="EpisodicFlusher", daemon=True)
+        self._flusher.start()
 
     def store_event(self, user, event_type, content, emotion="neutral", importance=0.5):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        INSERT INTO episodic_memory (timestamp, user, event_type, content, emotion, importance)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """, (datetime.datetime.now().isoformat(), user, event_type, content, emotion, importance))
-        self.conn.commit()
+        row = (datetime.datetime.now().isoformat(), user, event_type, content, emotion, importance)
+        with self._pending_lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._submit_pending()
+
+    # ------------- Write-behind -------------
+    def _submit_pending(self):
+        """Στέλνει το buffer στον writer (καλείται με το _pending_lock)."""
+        if not self._pending:
+            return None
+        rows, self._pending = self._pending, []
+
+        def write(conn):
+            inserted = []
+            for row in rows:
+                cur = conn.execute("""
+                INSERT INTO episodic_memory (timestamp, user, event_type, content, emotion, importance)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """, row)
+                inserted.append((cur.lastrowid, row[3]))
+            return inserted
+
+        future = self.storage.submit(write)
+        if not self._listeners:
+            return future
+        # Το flush() περιμένει και τους listeners, όχι μόνο το commit
+        notified: Future = Future()
+        future.add_done_callback(lambda f: self._notify(f, notified))
+        return notified
+
+    def add_listener(self, callback: Callable[[List[Tuple[int, str]]], None]):
+        """
+        Καλείται με [(id, content)] για κάθε batch που γράφτηκε.
+        Τρέχει στο thread του writer, άρα πρέπει να είναι σύντομος (π.χ. να βάζει το batch σε ουρά).
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, future, notified: Future):
+        if future.exception() is not None:
+            notified.set_exception(future.exception())
+            return
+        inserted = future.result()
+        for callback in self._listeners:
+            try:
+                callback(inserted)
+            except Exception:
+                pass
+        notified.set_result(inserted)
+
+    def flush(self):
+        """Γράφει ό,τι εκκρεμεί και περιμένει το commit."""
+        with self._pending_lock:
+            future = self._submit_pending()
+        if future is not None:
+            future.result()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                with self._pending_lock:
+                    self._submit_pending()
+            except Exception:
+                pass
 
+    # ------------- Reads -------------
     def recall_recent(self, limit=10):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM episodic_memory ORDER BY id DESC LIMIT ?", (limit,))
-        return cursor.fetchall()
+        self.flush()
+        return self.storage.query("SELECT * FROM episodic_memory ORDER BY id DESC LIMIT ?", (limit,))
 
     def close(self):
-        self.conn.close()
+        self._stop.set()
+        self._flusher.join(timeout=1.0)
+        self.flush()
+        if self._owns_storage:
+            self.storage.close()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_jobs.py
+--------------------------
+Περιοδικές εργασίες παρασκηνίου για τη μνήμη (ενοποίηση, συντήρηση κ.λπ.).
+Τρέχουν σε δικό τους daemon thread ώστε να μη μπλοκάρουν το ReasoningManager.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class PeriodicJob:
+    """Εκτελεί fn() κάθε interval δευτερόλεπτα· το trigger() ξυπνά την εργασία αμέσως."""
+
+    def __init__(self, name: str, fn: Callable[[], Any], interval: float):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.last_error: Optional[BaseException] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def trigger(self):
+        self._wake.set()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.fn()
+                self.last_error = None
+            except Exception as e:
+                # Η εργασία δεν πρέπει να ρίξει το thread — ξαναδοκιμάζει στον επόμενο κύκλο
+                self.last_error = e
@@ -1,18 +1,49 @@
+import os
+import json
 import datetime
+import threading
+from core.memory.memory_storage import MemoryStorage, DEFAULT_DB_PATH
 from core.memory.memory_episodic import EpisodicMemory
 from core.memory.memory_semantic import SemanticMemory
 from core.emotion.memory_emotional import EmotionalMemory
 from core.memory.memory_consolidator import MemoryConsolidator
+from core.memory.memory_vectors import HashingEmbedder, VectorStore, VectorIndexer
+from core.memory.memory_retention import RetentionPolicy
+from core.memory.conversation_memory import ConversationMemory, DEFAULT_CONVERSATION_DB, stream_json_array
+from core.memory.memory_profile import ProfileStore, PROFILE, PREFERENCES
+from core.memory import memory_search, memory_backup
 
 class MemoryManager:
     """
     Κεντρική μονάδα μνήμης — συντονίζει όλες τις υπομνήμες της Ζένιας.
+    Όλες οι υπομνήμες μοιράζονται ένα MemoryStorage (ένα pool, ένας writer).
     """
-    def __init__(self):
-        self.episodic = EpisodicMemory()
-        self.semantic = SemanticMemory()
-        self.emotional = EmotionalMemory()
-        self.consolidator = MemoryConsolidator()
+    SIMILAR_MIN_SCORE = 0.25
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, conversation_db_path=DEFAULT_CONVERSATION_DB):
+        self.storage = MemoryStorage.open(db_path)
+        self.episodic = EpisodicMemory(storage=self.storage)
+        self.semantic = SemanticMemory(storage=self.storage)
+        self.emotional = EmotionalMemory(storage=self.storage)
+
+        # Embeddings δίπλα στη βάση (memory_system.vectors.*), ενημερώνονται σε κάθε flush·
+        # ένα κοινό store ανά αρχείο για όλους τους MemoryManager του process
+        self.embedder = HashingEmbedder()
+        self.vectors = VectorStore.open(os.path.splitext(self.storage.db_path)[0], dim=self.embedder.dim)
+        self.indexer = VectorIndexer(self.vectors, self.embedder)
+        self._sync_vectors()
+        # Ο listener τρέχει στο thread του writer: μόνο βάζει το batch στην ουρά του indexer
+        self.episodic.add_listener(self.indexer.submit)
+
+        # Ενοποίηση και διατήρηση στο παρασκήνιο: μία φορά ανά βάση, όχι ανά MemoryManager
+        self._jobs = _SharedJobs.open(self.storage, self.vectors)
+        self.consolidator = self._jobs.consolidator
+        self.retention = self._jobs.retention
+
+        # Ιστορικό συνομιλίας (zenia_memory.db)
+        self.conversation = ConversationMemory(conversation_db_path)
+        # Προφίλ / προτιμήσεις / facts στην ίδια βάση, με cache στη μνήμη
+        self.profile = ProfileStore(storage=self.conversation.storage)
 
     def store_event(self, event_type, content, emotion="neutral", importance=0.5):
         self.episodic.store_event(
@@ -23,11 +54,232 @@ class MemoryManager:
             importance=importance
         )
 
-    def learn(self):
-        """Εκτελεί ενοποίηση μνήμης (σαν 'ύπνος' για τη Ζένια)."""
-        self.consolidator.consolidate()
+    # ------------- Συνομιλία -------------
+    def add_turn(self, role, text, meta=None):
+        return self.conversation.add_turn(role, text, meta)
+
+    def get_recent(self, limit=20, before_id=None):
+        """Οι τελευταίοι γύροι συνομιλίας (dicts με id, ts, role, text, meta)."""
+        return self.conversation.get_recent(limit, before_id)
+
+    def export_json(self, path):
+        """Backup σε JSON· κάθε ενότητα γράφεται γραμμή-γραμμή."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{\n"interactions": ')
+            stream_json_array(f, self.conversation.iter_turns())
+            f.write(',\n"facts": ')
+            stream_json_array(f, self.profile.list_facts(limit=-1))
+            f.write(',\n"profile": ')
+            f.write(json.dumps(self.profile.items(PROFILE), ensure_ascii=False))
+            f.write(',\n"preferences": ')
+            f.write(json.dumps(self.profile.items(PREFERENCES), ensure_ascii=False))
+            f.write("\n}\n")
+
+    # ------------- Προφίλ / facts -------------
+    def get_user_name(self):
+        return self.profile.get_user_name()
+
+    def set_user_name(self, name):
+        self.profile.set_user_name(name)
+
+    def get_preference(self, key, default=None):
+        return self.profile.get_preference(key, default)
+
+    def set_preference(self, key, value):
+        self.profile.set_preference(key, value)
+
+    def add_fact(self, text, weight=0.5, tags=None, source=None):
+        return self.profile.add_fact(text, weight, tags, source)
+
+    def list_facts(self, limit=20):
+        return self.profile.list_facts(limit)
+
+    def _exec(self, sql, params=()):
+        """Ανάγνωση με raw SQL στη zenia_memory.db (για εργαλεία όπως το memory_viewer)."""
+        with self.conversation.storage.reader() as conn:
+            cur = conn.cursor()
+            rows = cur.execute(sql, params).fetchall()
+        return _Rows(rows)
+
+    def wipe_all(self, confirm=False):
+        """Διαγράφει ΟΛΗ τη μνήμη (γεγονότα, έννοιες, συναισθήματα, συνομιλίες, προφίλ)."""
+        if not confirm:
+            return False
+        self.flush()
+        self.storage.executescript("""
+            DELETE FROM episodic_memory;
+            DELETE FROM semantic_memory;
+            DELETE FROM emotional_memory;
+            DELETE FROM episodic_rollup;
+            DELETE FROM emotion_stats;
+            DELETE FROM memory_meta;
+        """)
+        self.emotional.rebuild_stats()
+        self.vectors.clear()
+        self.conversation.clear()
+        self.profile.wipe_all(confirm=True)
+        return True
+
+    # ------------- Backup -------------
+    def backup(self, dest_dir=None):
+        """Online backup όλων των βάσεων και των διανυσμάτων τους (βλ. memory_backup.backup_all)."""
+        self.flush()
+        self.vectors.flush()
+        own = [self.storage.db_path, self.conversation.storage.db_path]
+        names = {os.path.basename(p) for p in own}
+        others = [p for p in memory_backup.DEFAULT_DATABASES if os.path.basename(p) not in names]
+        return memory_backup.backup_all(dest_dir, own + others)
+
+    def export_episodic(self, out_dir, chunk_rows=100_000):
+        """Εξαγωγή episodic μνήμης σε συμπιεσμένα .npz chunks για offline ανάλυση."""
+        self.flush()
+        return memory_backup.export_episodic_npz(self.storage.db_path, out_dir, chunk_rows)
+
+    def restore_episodic(self, src_dir, replace=False):
+        """Μαζική επαναφορά από .npz chunks· ενημερώνει και τα embeddings."""
+        self.flush()
+        loaded = memory_backup.restore_episodic_npz(src_dir, storage=self.storage, replace=replace)
+        if replace:
+            self.vectors.clear()
+        self._sync_vectors(missing_only=not replace)
+        return loaded
+
+    # ------------- Embeddings -------------
+    def _sync_vectors(self, batch=1000, missing_only=False):
+        """
+        Embeddings για γεγονότα που γράφτηκαν χωρίς αυτά (π.χ. πριν υπάρξει το αρχείο).
+        Με missing_only ελέγχει όλα τα ids (π.χ. μετά από restore με παλιά ids).
+        """
+        last_id = 0 if missing_only else self.vectors.max_ref_id
+        while True:
+            rows = self.storage.query(
+                "SELECT id, content FROM episodic_memory WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch)
+            )
+            if not rows:
+                break
+            self.indexer.index([r for r in rows if r[0] not in self.vectors])
+            last_id = rows[-1][0]
+
+    # ------------- Αναζήτηση -------------
+    def search(self, query, top_k=10):
+        """
+        Αναζήτηση πλήρους κειμένου (BM25) σε episodic και semantic μνήμη·
+        αν δεν φτάνουν τα αποτελέσματα, συμπληρώνει με σημασιολογικά κοντινά (embeddings).
+        """
+        self.flush()
+        hits = memory_search.search(self.storage, query, top_k=top_k)
+        if len(hits) < top_k:
+            seen = {h["id"] for h in hits if h["kind"] == "episodic"}
+            for h in self.recall_similar(query, top_k=top_k):
+                if h["id"] not in seen and h["score"] >= self.SIMILAR_MIN_SCORE and len(hits) < top_k:
+                    hits.append(h)
+        return hits
+
+    def recall_similar(self, text, top_k=5):
+        """Τα top_k γεγονότα με το πιο κοντινό embedding στο κείμενο."""
+        self.flush()
+        return memory_search.similar(self.storage, self.vectors, self.embedder, text, top_k=top_k)
+
+    def flush(self):
+        """Γράφει στον δίσκο ό,τι εκκρεμεί στα write-behind buffers και περιμένει τα embeddings τους."""
+        self.episodic.flush()
+        self.indexer.join()
+
+    def compact(self):
+        """Εκτελεί αμέσως έναν κύκλο διατήρησης· επιστρέφει πόσα γεγονότα κλαδεύτηκαν."""
+        self.flush()
+        return self.retention.run()
+
+    def learn(self, background=False):
+        """
+        Εκτελεί ενοποίηση μνήμης (σαν 'ύπνος' για τη Ζένια).
+        Με background=True απλώς ξυπνά την εργασία παρασκηνίου και επιστρέφει αμέσως.
+        """
+        self.flush()
+        if background:
+            self.consolidator.start()
+            self.consolidator.job.trigger()
+            return 0
+        return self.consolidator.consolidate()
 
     def shutdown(self):
+        self._jobs.close()
+        self.flush()
         self.episodic.close()
         self.semantic.close()
         self.emotional.close()
+        self.indexer.close()
+        self.vectors.close()
+        self.profile.close()
+        self.conversation.close()
+        self.storage.close()
+
+
+class _SharedJobs:
+    """
+    Consolidator + retention ανά βάση, με μέτρηση αναφορών (όπως το MemoryStorage.open):
+    όσοι MemoryManager κι αν ανοίξουν την ίδια βάση, τρέχει ένα ζευγάρι εργασιών.
+    Ο consolidator έχει δικές του υπομνήμες, ώστε να μην εξαρτάται από τον MemoryManager
+    που τον δημιούργησε· το τελευταίο close σταματά τις εργασίες.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, storage, vectors):
+        self.key = storage.db_path
+        # Περιοδική ενοποίηση (μόνο νέα γεγονότα, βλ. watermark)
+        self.consolidator = MemoryConsolidator(storage=storage)
+        # Διατήρηση: φθορά σημαντικότητας, ημερήσια rollups, incremental vacuum
+        self.retention = RetentionPolicy(storage, on_pruned=vectors.remove)
+        self._refs = 0
+        self._closed = False
+
+    @classmethod
+    def open(cls, storage, vectors):
+        with cls._instances_lock:
+            jobs = cls._instances.get(storage.db_path)
+            if jobs is None or jobs._closed:
+                jobs = cls(storage, vectors)
+                cls._instances[storage.db_path] = jobs
+                jobs.consolidator.start()
+                jobs.retention.start()
+            jobs._refs += 1
+            return jobs
+
+    def close(self):
+        with _SharedJobs._instances_lock:
+            if self._closed:
+                return
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            self._closed = True
+            if _SharedJobs._instances.get(self.key) is self:
+                del _SharedJobs._instances[self.key]
+        self.retention.stop()
+        self.consolidator.shutdown()
+
+
+class _Rows:
+    """Αποτελέσματα ερωτήματος με διεπαφή cursor (fetchall / fetchone / iteration)."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self._pos = 0
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        self._pos += 1
+        return self._rows[self._pos - 1]
+
+    def fetchall(self):
+        rest, self._pos = self._rows[self._pos:], len(self._rows)
+        return rest
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_profile.py
+-----------------------------
+Προφίλ, προτιμήσεις και γεγονότα (facts) του χρήστη (zenia_memory.db).
+- profile / preferences: key → JSON τιμή, με updated_at
+- Write-through LRU cache στη μνήμη: οι συχνές αναγνώσεις (π.χ. όνομα χρήστη)
+  δεν αγγίζουν τη βάση· κάθε εγγραφή ενημερώνει βάση ΚΑΙ cache μαζί
+- Typed getters (get_str / get_int / get_float / get_bool) με default
+"""
+
+import json
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_schema import ZENIA_MEMORY_MIGRATIONS
+from core.memory.conversation_memory import DEFAULT_CONVERSATION_DB
+
+PROFILE = "profile"
+PREFERENCES = "preferences"
+_SECTIONS = (PROFILE, PREFERENCES)
+_MISSING = object()     # αρνητική καταχώριση: «το κλειδί δεν υπάρχει στη βάση»
+
+USER_NAME_KEY = "user_name"
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode(raw: Optional[str]) -> Any:
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        # Παλιές εγγραφές μπορεί να έχουν σκέτο κείμενο
+        return raw
+
+
+class ProfileStore:
+    """Στοιχεία χρήστη με cache· όλες οι εγγραφές είναι write-through."""
+
+    def __init__(self, db_path: str = DEFAULT_CONVERSATION_DB, storage: Optional[MemoryStorage] = None,
+                 cache_size: int = 256):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open(db_path, migrations=ZENIA_MEMORY_MIGRATIONS)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _check_section(section: str):
+        if section not in _SECTIONS:
+            raise ValueError(f"Άγνωστη ενότητα προφίλ: {section}")
+
+    def _remember(self, ck: tuple, value: Any):
+        self._cache[ck] = value
+        self._cache.move_to_end(ck)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------- Key / value -------------
+    def get(self, key: str, default: Any = None, section: str = PROFILE) -> Any:
+        """Η τιμή του κλειδιού (από τη cache αν υπάρχει), αλλιώς default."""
+        self._check_section(section)
+        ck = (section, key)
+        with self._lock:
+            if ck in self._cache:
+                self._cache.move_to_end(ck)
+                value = self._cache[ck]
+                self.hits += 1
+            else:
+                # Το lock κρατιέται κατά την ανάγνωση ώστε να μη «γυρίσει» παλιά τιμή
+                # πάνω από ταυτόχρονο set()
+                self.misses += 1
+                row = self.storage.query_one(f"SELECT value FROM {section} WHERE key = ?", (key,))
+                value = _decode(row[0]) if row else _MISSING
+                self._remember(ck, value)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, section: str = PROFILE):
+        self._check_section(section)
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self.storage.execute(
+                f"INSERT INTO {section} (key, value, updated_at) VALUES (?, ?, ?) "
+                f"ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                (key, _encode(value), now),
+            )
+            self._remember((section, key), value)
+
+    def delete(self, key: str, section: str = PROFILE):
+        self._check_section(section)
+        with self._lock:
+            self.storage.execute(f"DELETE FROM {section} WHERE key = ?", (key,))
+            self._remember((section, key), _MISSING)
+
+    def items(self, section: str = PROFILE) -> Dict[str, Any]:
+        """Όλα τα κλειδιά της ενότητας (απευθείας από τη βάση)."""
+        self._check_section(section)
+        return {k: _decode(v) for k, v in self.storage.query(f"SELECT key, value FROM {section} ORDER BY key")}
+
+    # ------------- Typed getters -------------
+    def get_str(self, key: str, default: Optional[str] = None, section: str = PROFILE) -> Optional[str]:
+        value = self.get(key, None, section)
+        return default if value is None else str(value)
+
+    def get_int(self, key: str, default: Optional[int] = None, section: str = PROFILE) -> Optional[int]:
+        try:
+            return int(self.get(key, default, section))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: Optional[float] = None, section: str = PROFILE) -> Optional[float]:
+        try:
+            return float(self.get(key, default, section))
+        except (TypeError, ValueError):
+            return default
+
+    def get_bool(self, key: str, default: bool = False, section: str = PROFILE) -> bool:
+        value = self.get(key, None, section)
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on", "ναι")
+        return bool(value)
+
+    # ------------- Προτιμήσεις / όνομα -------------
+    def get_preference(self, key: str, default: Any = None) -> Any:
+        return self.get(key, default, PREFERENCES)
+
+    def set_preference(self, key: str, value: Any):
+        self.set(key, value, PREFERENCES)
+
+    def get_user_name(self) -> Optional[str]:
+        return self.get_str(USER_NAME_KEY)
+
+    def set_user_name(self, name: str):
+        self.set(USER_NAME_KEY, (name or "").strip())
+
+    # ------------- Facts -------------
+    def add_fact(self, text: str, weight: float = 0.5, tags: Optional[Iterable[str]] = None,
+                 source: Optional[str] = None) -> int:
+        ts = datetime.datetime.now().isoformat(timespec="seconds")
+        tags_json = _encode(list(tags)) if tags else None
+        return self.storage.execute(
+            "INSERT INTO facts (ts, text, weight, tags, source) VALUES (?, ?, ?, ?, ?)",
+            (ts, text, float(weight), tags_json, source),
+        )
+
+    def list_facts(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Τα πιο πρόσφατα facts (dicts με id, ts, text, weight, tags, source)."""
+        rows = self.storage.query(
+            "SELECT id, ts, text, weight, tags, source FROM facts ORDER BY id DESC LIMIT ?", (limit,)
+        )
+        facts = []
+        for fact_id, ts, text, weight, tags, source in rows:
+            tags = _decode(tags) or []
+            facts.append({
+                "id": fact_id, "ts": ts, "text": text,
+                "weight": 0.5 if weight is None else weight,
+                "tags": tags if isinstance(tags, list) else [str(tags)],
+                "source": source,
+            })
+        return facts
+
+    # ------------- Συντήρηση -------------
+    def wipe_all(self, confirm: bool = False) -> bool:
+        """Διαγράφει προφίλ, προτιμήσεις και facts (μόνο με confirm=True)."""
+        if not confirm:
+            return False
+        with self._lock:
+            self.storage.executescript("DELETE FROM facts; DELETE FROM profile; DELETE FROM preferences;")
+            self._cache.clear()
+        return True
+
+    def close(self):
+        if self._owns_storage:
+            self.storage.close()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_retention.py
+-------------------------------
+Πολιτική διατήρησης για την episodic μνήμη.
+- Η σημαντικότητα κάθε γεγονότος φθίνει εκθετικά με τον χρόνο (half-life)
+- Γεγονότα παλαιότερα από min_age με φθαρμένη σημαντικότητα κάτω από το όριο
+  συνοψίζονται σε ημερήσια rollups (episodic_rollup) και διαγράφονται — μόνο όσα
+  έχει ήδη ενοποιήσει ο consolidator (id ≤ watermark του)
+- incremental_vacuum σε κάθε κύκλο ώστε το αρχείο να μη μεγαλώνει
+"""
+
+import datetime
+import sqlite3
+from typing import Callable, List, Optional
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_jobs import PeriodicJob
+from core.memory.memory_consolidator import WATERMARK_KEY
+
+
+def decayed_importance(importance, timestamp, now_ts: float, half_life_days: float) -> Optional[float]:
+    """importance · 0.5^(ηλικία / half-life) — None αν δεν υπάρχει έγκυρο timestamp."""
+    if not timestamp:
+        return None
+    try:
+        ts = datetime.datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return None
+    age_days = max(0.0, now_ts - ts) / 86400.0
+    base = 0.5 if importance is None else float(importance)
+    return base * 0.5 ** (age_days / half_life_days)
+
+
+class RetentionPolicy:
+    """Κλαδεύει/συνοψίζει γεγονότα χαμηλής αξίας και συμπιέζει το αρχείο της βάσης."""
+
+    def __init__(self, storage: MemoryStorage,
+                 half_life_days: float = 30.0,
+                 min_age_days: float = 7.0,
+                 threshold: float = 0.1,
+                 batch_size: int = 5000,
+                 vacuum_pages: int = 2000,
+                 interval: float = 3600.0,
+                 on_pruned: Optional[Callable[[List[int]], None]] = None):
+        self.storage = storage
+        self.half_life_days = half_life_days
+        self.min_age_days = min_age_days
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self.on_pruned = on_pruned
+        self.job = PeriodicJob("MemoryRetention", self.run, interval)
+
+    # ------------- Κύκλος -------------
+    def run(self) -> int:
+        """Ένας πλήρης κύκλος διατήρησης· επιστρέφει πόσα γεγονότα κλαδεύτηκαν."""
+        now = datetime.datetime.now()
+        cutoff = (now - datetime.timedelta(days=self.min_age_days)).isoformat()
+        now_ts = now.timestamp()
+
+        pruned = 0
+        last_id = 0
+        while True:
+            ids, last_id = self.storage.run(
+                lambda conn, after=last_id: self._prune_batch(conn, cutoff, now_ts, after)
+            )
+            if ids:
+                pruned += len(ids)
+                if self.on_pruned:
+                    self.on_pruned(ids)
+            if last_id is None:
+                break
+
+        self.vacuum()
+        return pruned
+
+    def _prune_batch(self, conn, cutoff: str, now_ts: float, after_id: int):
+        """Ένα batch: επιλέγει, συνοψίζει και διαγράφει. Επιστρέφει (ids, επόμενο id ή None)."""
+        conn.create_function("decayed_importance", 4, decayed_importance, deterministic=True)
+        # Ό,τι δεν έχει ενοποιηθεί ακόμα δεν σβήνεται, αλλιώς ο consolidator δεν θα το δει ποτέ
+        row = conn.execute("SELECT value FROM memory_meta WHERE key=?", (WATERMARK_KEY,)).fetchone()
+        watermark = int(row[0]) if row else 0
+        scanned = conn.execute("""
+            SELECT id, decayed_importance(importance, timestamp, ?, ?) < ?
+            FROM episodic_memory
+            WHERE timestamp < ? AND id > ? AND id <= ?
+            ORDER BY id LIMIT ?
+        """, (now_ts, self.half_life_days, self.threshold, cutoff, after_id, watermark,
+              self.batch_size)).fetchall()
+        if not scanned:
+            return [], None
+        ids = [row_id for row_id, low in scanned if low]
+        next_id = scanned[-1][0] if len(scanned) == self.batch_size else None
+        if not ids:
+            return [], next_id
+
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS _prune_ids (id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM _prune_ids")
+        conn.executemany("INSERT INTO _prune_ids (id) VALUES (?)", [(i,) for i in ids])
+        conn.execute("""
+            INSERT INTO episodic_rollup (day, event_type, events, importance_sum, max_importance, first_ts, last_ts)
+            SELECT substr(timestamp, 1, 10), coalesce(event_type, ''), count(*),
+                   sum(coalesce(importance, 0.5)), max(coalesce(importance, 0.5)), min(timestamp), max(timestamp)
+            FROM episodic_memory WHERE id IN (SELECT id FROM _prune_ids)
+            GROUP BY substr(timestamp, 1, 10), coalesce(event_type, '')
+            ON CONFLICT(day, event_type) DO UPDATE SET
+                events = events + excluded.events,
+                importance_sum = importance_sum + excluded.importance_sum,
+                max_importance = MAX(max_importance, excluded.max_importance),
+                first_ts = MIN(first_ts, excluded.first_ts),
+                last_ts = MAX(last_ts, excluded.last_ts)
+        """)
+        conn.execute("DELETE FROM episodic_memory WHERE id IN (SELECT id FROM _prune_ids)")
+        return ids, next_id
+
+    # ------------- Συμπίεση -------------
+    def vacuum(self):
+        """
+        incremental_vacuum στις ελεύθερες σελίδες (το πολύ vacuum_pages, στο writer thread).
+        Την πρώτη φορά γυρίζει τη βάση σε auto_vacuum=INCREMENTAL, βλ. _enable_incremental.
+        """
+        if self.storage.query_one("PRAGMA auto_vacuum")[0] != 2 and not self._enable_incremental():
+            return
+
+        def work(conn):
+            conn.commit()
+            conn.execute(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})").fetchall()
+
+        self.storage.run(work)
+
+    def _enable_incremental(self, busy_timeout: float = 1.0) -> bool:
+        """
+        Το πλήρες VACUUM της μετατροπής τρέχει σε δική του σύνδεση, στο thread του
+        κύκλου και όχι στο κοινό writer thread, ώστε η ουρά εγγραφών να μην περιμένει
+        πίσω του. Αν η βάση είναι απασχολημένη, δοκιμάζει ξανά στον επόμενο κύκλο.
+        """
+        conn = sqlite3.connect(self.storage.db_path, timeout=busy_timeout, isolation_level=None)
+        try:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+        except sqlite3.OperationalError:
+            return False
+        finally:
+            conn.close()
+
+    # ------------- Ερωτήματα -------------
+    def daily_rollups(self, days: int = 30) -> List[tuple]:
+        since = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+        return self.storage.query("""
+            SELECT day, event_type, events, importance_sum / events, max_importance
+            FROM episodic_rollup WHERE day >= ? ORDER BY day, event_type
+        """, (since,))
+
+    # ------------- Background -------------
+    def start(self):
+        self.job.start()
+
+    def stop(self):
+        self.job.stop()
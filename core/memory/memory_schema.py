@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_schema.py
+----------------------------
+Εκδόσεις σχήματος (migrations) για τη βάση μνήμης της Ζένιας.
+Η τρέχουσα έκδοση κρατιέται στο PRAGMA user_version· κάθε migration
+εφαρμόζεται μία φορά, μέσα σε δικό της transaction.
+"""
+
+import sqlite3
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from core.utils.text_tools import fold_accents_sql
+
+Step = Union[str, Callable[[sqlite3.Connection], None]]
+Migration = Tuple[int, str, Sequence[Step]]
+
+
+# ------------- memory_system.db3 -------------
+MEMORY_SYSTEM_MIGRATIONS: List[Migration] = [
+    (1, "Βασικοί πίνακες μνήμης", [
+        """
+        CREATE TABLE IF NOT EXISTS episodic_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT,
+            user TEXT,
+            event_type TEXT,
+            content TEXT,
+            emotion TEXT,
+            importance REAL
+        )""",
+        """
+        CREATE TABLE IF NOT EXISTS semantic_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            concept TEXT,
+            category TEXT,
+            description TEXT
+        )""",
+        """
+        CREATE TABLE IF NOT EXISTS emotional_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_ref TEXT,
+            emotion TEXT,
+            intensity REAL,
+            timestamp TEXT
+        )""",
+    ]),
+    (2, "Indexes και μοναδικές έννοιες", [
+        "CREATE INDEX IF NOT EXISTS idx_episodic_timestamp ON episodic_memory(timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_episodic_event_type ON episodic_memory(event_type)",
+        "CREATE INDEX IF NOT EXISTS idx_emotional_emotion ON emotional_memory(emotion)",
+        # Κρατάμε την πιο πρόσφατη εγγραφή από κάθε διπλότυπο πριν το UNIQUE
+        """
+        DELETE FROM semantic_memory WHERE id NOT IN (
+            SELECT MAX(id) FROM semantic_memory GROUP BY concept, category
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_semantic_concept_category ON semantic_memory(concept, category)",
+    ]),
+    (3, "FTS5 αναζήτηση σε episodic.content και semantic.description", [
+        # Το κείμενο αποθηκεύεται χωρίς τόνους ("μουσική" → "μουσικη")·
+        # ο unicode61 κάνει τα υπόλοιπα (πεζά, λατινικά διακριτικά).
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS episodic_fts USING fts5(
+            content, tokenize='unicode61 remove_diacritics 2'
+        )""",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS semantic_fts USING fts5(
+            concept, description, tokenize='unicode61 remove_diacritics 2'
+        )""",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_episodic_fts_insert AFTER INSERT ON episodic_memory BEGIN
+            INSERT INTO episodic_fts(rowid, content) VALUES (new.id, {fold_accents_sql("new.content")});
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_episodic_fts_delete AFTER DELETE ON episodic_memory BEGIN
+            DELETE FROM episodic_fts WHERE rowid = old.id;
+        END""",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_episodic_fts_update AFTER UPDATE OF content ON episodic_memory BEGIN
+            DELETE FROM episodic_fts WHERE rowid = old.id;
+            INSERT INTO episodic_fts(rowid, content) VALUES (new.id, {fold_accents_sql("new.content")});
+        END""",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_semantic_fts_insert AFTER INSERT ON semantic_memory BEGIN
+            INSERT INTO semantic_fts(rowid, concept, description)
+            VALUES (new.id, {fold_accents_sql("new.concept")}, {fold_accents_sql("new.description")});
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_semantic_fts_delete AFTER DELETE ON semantic_memory BEGIN
+            DELETE FROM semantic_fts WHERE rowid = old.id;
+        END""",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_semantic_fts_update AFTER UPDATE OF concept, description ON semantic_memory BEGIN
+            DELETE FROM semantic_fts WHERE rowid = old.id;
+            INSERT INTO semantic_fts(rowid, concept, description)
+            VALUES (new.id, {fold_accents_sql("new.concept")}, {fold_accents_sql("new.description")});
+        END""",
+        # Υπάρχοντα δεδομένα
+        f"INSERT INTO episodic_fts(rowid, content) SELECT id, {fold_accents_sql('content')} FROM episodic_memory",
+        f"""
+        INSERT INTO semantic_fts(rowid, concept, description)
+        SELECT id, {fold_accents_sql('concept')}, {fold_accents_sql('description')} FROM semantic_memory""",
+    ]),
+    (4, "Μεταδεδομένα μνήμης (π.χ. watermark ενοποίησης)", [
+        """
+        CREATE TABLE IF NOT EXISTS memory_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )""",
+    ]),
+    (5, "Ημερήσια rollups για γεγονότα που κλάδεψε η πολιτική διατήρησης", [
+        """
+        CREATE TABLE IF NOT EXISTS episodic_rollup (
+            day TEXT,
+            event_type TEXT,
+            events INTEGER,
+            importance_sum REAL,
+            max_importance REAL,
+            first_ts TEXT,
+            last_ts TEXT,
+            PRIMARY KEY (day, event_type)
+        )""",
+    ]),
+    (6, "Κυλιόμενα στατιστικά ανά συναίσθημα (ενημερώνονται σε κάθε record_emotion)", [
+        """
+        CREATE TABLE IF NOT EXISTS emotion_stats (
+            emotion TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0,
+            intensity_sum REAL NOT NULL DEFAULT 0,
+            ewma_hour REAL,
+            ewma_day REAL,
+            recent_hour REAL NOT NULL DEFAULT 0,
+            recent_day REAL NOT NULL DEFAULT 0,
+            updated_at REAL,
+            last_ts TEXT
+        )""",
+    ]),
+]
+
+
+# ------------- zenia_memory.db -------------
+ZENIA_MEMORY_MIGRATIONS: List[Migration] = [
+    (1, "Ιστορικό συνομιλίας (append-only, id = turn id)", [
+        """
+        CREATE TABLE IF NOT EXISTS interactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts TEXT NOT NULL,
+            role TEXT NOT NULL,
+            text TEXT NOT NULL,
+            meta TEXT
+        )""",
+    ]),
+    (2, "Προφίλ, προτιμήσεις και γεγονότα (facts) του χρήστη", [
+        """
+        CREATE TABLE IF NOT EXISTS facts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts TEXT NOT NULL,
+            text TEXT NOT NULL,
+            weight REAL DEFAULT 0.5,
+            tags TEXT,
+            source TEXT
+        )""",
+        """
+        CREATE TABLE IF NOT EXISTS profile (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TEXT
+        )""",
+        """
+        CREATE TABLE IF NOT EXISTS preferences (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TEXT
+        )""",
+    ]),
+]
+
+
+# ------------- Ανά αποθήκη του storage_catalog -------------
+STORE_MIGRATIONS: Dict[str, List[Migration]] = {
+    "memory_system": MEMORY_SYSTEM_MIGRATIONS,
+    "conversation": ZENIA_MEMORY_MIGRATIONS,
+}
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: Sequence[Migration]) -> int:
+    """Εφαρμόζει όσες migrations λείπουν· επιστρέφει την τελική έκδοση."""
+    current = schema_version(conn)
+    for version, _description, steps in sorted(migrations, key=lambda m: m[0]):
+        if version <= current:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current = version
+    return current
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_search.py
+----------------------------
+Αναζήτηση στη μνήμη της Ζένιας:
+- πλήρους κειμένου (FTS5 + BM25) στην episodic και semantic μνήμη
+- σημασιολογική (cosine) στα embeddings της episodic μνήμης
+Τα ερωτήματα κανονικοποιούνται όπως και τα ευρετήρια (χωρίς τόνους),
+οπότε το "μουσικη" βρίσκει το "μουσική" και αντίστροφα.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_vectors import HashingEmbedder, VectorStore
+from core.utils.text_tools import fold_accents
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(text: str, prefix: bool = False, column: Optional[str] = None) -> str:
+    """
+    Μετατρέπει ελεύθερο κείμενο σε ασφαλές FTS5 MATCH (όροι σε εισαγωγικά, OR).
+    Επιστρέφει "" αν δεν υπάρχει κανένας όρος.
+    """
+    terms = _TOKEN_RE.findall(fold_accents(text).lower())
+    if not terms:
+        return ""
+    star = "*" if prefix else ""
+    expr = " OR ".join(f'"{t}"{star}' for t in dict.fromkeys(terms))
+    return f"{column} : ({expr})" if column else expr
+
+
+def similar(storage: MemoryStorage, vectors: VectorStore, embedder: HashingEmbedder,
+            query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+    """Episodic γεγονότα πιο κοντινά στο query (cosine), στη μορφή του search()."""
+    scored = vectors.search(embedder.embed(query), top_k=top_k)
+    if not scored:
+        return []
+    placeholders = ",".join("?" * len(scored))
+    rows = {r[0]: r for r in storage.query(
+        f"SELECT id, timestamp, content FROM episodic_memory WHERE id IN ({placeholders})",
+        [ref for ref, _ in scored],
+    )}
+    return [
+        {"kind": "vector", "id": ref, "score": score, "text": rows[ref][2], "ts": rows[ref][1] or ""}
+        for ref, score in scored if ref in rows
+    ]
+
+
+def _normalize(hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Min–max των BM25 μιας πηγής στο [0, 1] (όλα 1.0 αν είναι ίσα)."""
+    if not hits:
+        return hits
+    low = min(h["bm25"] for h in hits)
+    span = max(h["bm25"] for h in hits) - low
+    for h in hits:
+        h["score"] = (h["bm25"] - low) / span if span > 0 else 1.0
+    return hits
+
+
+def search(storage: MemoryStorage, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+    """
+    Επιστρέφει τα top_k αποτελέσματα (episodic + semantic) ταξινομημένα κατά BM25.
+    Κάθε αποτέλεσμα: {"kind", "id", "score", "bm25", "text", "ts"} — μεγαλύτερο score = καλύτερο.
+    Τα BM25 δύο διαφορετικών πινάκων FTS δεν συγκρίνονται (άλλα IDF, άλλα μήκη),
+    οπότε το score είναι το BM25 κανονικοποιημένο ανά πηγή πριν από τη συγχώνευση.
+    """
+    match = build_match_query(query)
+    if not match or top_k <= 0:
+        return []
+
+    episodic: List[Dict[str, Any]] = []
+    for mem_id, ts, content, rank in storage.query("""
+        SELECT e.id, e.timestamp, e.content, bm25(episodic_fts) AS rank
+        FROM episodic_fts JOIN episodic_memory e ON e.id = episodic_fts.rowid
+        WHERE episodic_fts MATCH ?
+        ORDER BY rank LIMIT ?
+    """, (match, top_k)):
+        episodic.append({"kind": "episodic", "id": mem_id, "bm25": -rank, "text": content, "ts": ts or ""})
+
+    semantic: List[Dict[str, Any]] = []
+
+    for mem_id, concept, description, rank in storage.query("""
+        SELECT s.id, s.concept, s.description, bm25(semantic_fts) AS rank
+        FROM semantic_fts JOIN semantic_memory s ON s.id = semantic_fts.rowid
+        WHERE semantic_fts MATCH ?
+        ORDER BY rank LIMIT ?
+    """, (match, top_k)):
+        semantic.append({"kind": "semantic", "id": mem_id, "bm25": -rank,
+                         "text": f"{concept}: {description}", "ts": ""})
+
+    hits = _normalize(episodic) + _normalize(semantic)
+    hits.sort(key=lambda h: (h["score"], h["bm25"]), reverse=True)
+    return hits[:top_k]
@@ -1,40 +1,34 @@
-import sqlite3
-import os
+from typing import Optional
+
+from core.memory.memory_storage import MemoryStorage, DEFAULT_DB_PATH
+from core.memory.memory_search import build_match_query
 
 class SemanticMemory:
     """
     Αποθηκεύει γενική γνώση και σημασιολογικές έννοιες.
     Π.χ. “Η Αθήνα είναι πόλη”, “Ο υπολογιστής έχει CPU”.
     """
-    def __init__(self, db_path="data/memory_system.db3"):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
-        self._init_db()
-
-    def _init_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS semantic_memory (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            concept TEXT,
-            category TEXT,
-            description TEXT
-        );
-        """)
-        self.conn.commit()
+    def __init__(self, db_path=DEFAULT_DB_PATH, storage: Optional[MemoryStorage] = None):
+        self._owns_storage = storage is None
+        self.storage = storage or MemoryStorage.open(db_path)
 
     def add_concept(self, concept, category, description):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-        INSERT OR REPLACE INTO semantic_memory (concept, category, description)
+        self.storage.execute("""
+        INSERT INTO semantic_memory (concept, category, description)
         VALUES (?, ?, ?)
+        ON CONFLICT(concept, category) DO UPDATE SET description=excluded.description
         """, (concept, category, description))
-        self.conn.commit()
 
     def search_concept(self, keyword):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM semantic_memory WHERE concept LIKE ?", (f"%{keyword}%",))
-        return cursor.fetchall()
+        """Έννοιες που ξεκινούν με τις λέξεις του keyword (FTS5, χωρίς τόνους)."""
+        match = build_match_query(keyword, prefix=True, column="concept")
+        if not match:
+            return self.storage.query("SELECT * FROM semantic_memory")
+        return self.storage.query("""
+        SELECT s.* FROM semantic_fts JOIN semantic_memory s ON s.id = semantic_fts.rowid
+        WHERE semantic_fts MATCH ? ORDER BY bm25(semantic_fts)
+        """, (match,))
 
     def close(self):
-        self.conn.close()
+        if self._owns_storage:
+            self.storage.close()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_storage.py
+-----------------------------
+Κοινή μηχανή αποθήκευσης για τις μνήμες της Ζένιας.
+- Ένα μοναδικό instance ανά αρχείο βάσης (ref-counted)
+- Μικρό pool συνδέσεων ανάγνωσης
+- WAL journaling, synchronous=NORMAL, cached prepared statements
+- Ένα writer thread που σειριοποιεί όλες τις εγγραφές (χωρίς lock contention)
+- Εφαρμογή migrations σχήματος στο πρώτο άνοιγμα (βλ. memory_schema.py)· αν δεν
+  δοθούν, επιλέγονται από το όνομα της αποθήκης στο storage_catalog
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from core.memory.memory_schema import MEMORY_SYSTEM_MIGRATIONS, STORE_MIGRATIONS, Migration, apply_migrations
+from core.memory.storage_catalog import store_name, store_path
+
+DEFAULT_DB_PATH = store_path("memory_system")
+
+# Default του `migrations`: λύνεται από το όνομα της αποθήκης (βλ. migrations_for)
+FROM_CATALOG: Any = object()
+
+
+def migrations_for(db_path: str) -> Sequence[Migration]:
+    """Οι migrations της αποθήκης του storage_catalog με αυτή τη διαδρομή (default: memory_system)."""
+    return STORE_MIGRATIONS.get(store_name(db_path), MEMORY_SYSTEM_MIGRATIONS)
+
+
+class MemoryStorage:
+    """
+    Μηχανή SQLite που μοιράζονται Episodic / Semantic / Emotional μνήμη.
+    Οι αναγνώσεις γίνονται από το pool, οι εγγραφές περνούν από το writer thread.
+    """
+
+    _instances: Dict[str, "MemoryStorage"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, pool_size: int = 4, cached_statements: int = 256,
+                 migrations: Optional[Sequence[Migration]] = FROM_CATALOG):
+        self.db_path = os.path.abspath(db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.pool_size = max(1, pool_size)
+        self.cached_statements = cached_statements
+        if migrations is FROM_CATALOG:
+            migrations = migrations_for(self.db_path)
+        self.migrations = migrations
+
+        self._refs = 0
+        self._closed = False
+
+        # Writer: μία σύνδεση, ένα thread
+        self._writer_conn = self._connect()
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="MemoryWriter", daemon=True)
+        self._writer.start()
+        if migrations:
+            self.run(lambda conn: apply_migrations(conn, migrations))
+
+        # Readers: δημιουργούνται κατ' απαίτηση μέχρι pool_size
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    # ------------- Shared instances -------------
+    @classmethod
+    def open(cls, db_path: str = DEFAULT_DB_PATH, **kwargs) -> "MemoryStorage":
+        """
+        Επιστρέφει το κοινό storage για το αρχείο (το δημιουργεί αν χρειάζεται).
+        Οι ρυθμίσεις (kwargs) ισχύουν από το πρώτο άνοιγμα· ένα επόμενο open με
+        διαφορετικές ρυθμίσεις για το ίδιο αρχείο σηκώνει ValueError.
+        """
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            storage = cls._instances.get(key)
+            if storage is None or storage._closed:
+                storage = cls(key, **kwargs)
+                cls._instances[key] = storage
+            else:
+                storage._check_options(kwargs)
+            storage._refs += 1
+            return storage
+
+    def _check_options(self, options: Dict[str, Any]):
+        current = {"pool_size": self.pool_size, "cached_statements": self.cached_statements,
+                   "migrations": self.migrations}
+        for name, value in options.items():
+            if name == "pool_size":
+                value = max(1, value)
+            elif name == "migrations" and value is FROM_CATALOG:
+                value = migrations_for(self.db_path)
+            if name not in current:
+                raise TypeError(f"MemoryStorage.open() got an unexpected keyword argument '{name}'")
+            if value != current[name]:
+                raise ValueError(f"MemoryStorage already open for {self.db_path} with different {name}")
+
+    def close(self):
+        """Απελευθερώνει μία αναφορά· το τελευταίο close κλείνει τις συνδέσεις."""
+        with MemoryStorage._instances_lock:
+            if self._closed:
+                return
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            self._closed = True
+            if MemoryStorage._instances.get(self.db_path) is self:
+                del MemoryStorage._instances[self.db_path]
+
+        self._jobs.put(None)
+        self._writer.join(timeout=5.0)
+        for conn in [self._writer_conn] + self._all_readers:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    # ------------- Connections -------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def reader(self):
+        """Δανείζει μια σύνδεση ανάγνωσης από το pool."""
+        conn = None
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                if len(self._all_readers) < self.pool_size:
+                    conn = self._connect()
+                    self._all_readers.append(conn)
+            if conn is None:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    # ------------- Reads -------------
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    # ------------- Writes -------------
+    def submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Στέλνει μια εργασία στο writer thread.
+        Η fn(conn) εκτελείται σε transaction· commit αν πετύχει, rollback αν αποτύχει.
+        """
+        if self._closed:
+            raise RuntimeError(f"MemoryStorage is closed: {self.db_path}")
+        future: Future = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Σαν το submit, αλλά περιμένει το commit και επιστρέφει το αποτέλεσμα."""
+        return self.submit(fn).result()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Μία εγγραφή· επιστρέφει το lastrowid."""
+        return self.run(lambda conn: conn.execute(sql, params).lastrowid)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Πολλές εγγραφές σε ένα transaction· επιστρέφει το πλήθος γραμμών."""
+        return self.run(lambda conn: conn.executemany(sql, rows).rowcount)
+
+    def executescript(self, script: str):
+        self.run(lambda conn: conn.executescript(script))
+
+    def _writer_loop(self):
+        conn = self._writer_conn
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            fn, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(conn)
+                conn.commit()
+            except BaseException as e:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                future.set_exception(e)
+            else:
+                future.set_result(result)
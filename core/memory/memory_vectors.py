@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/memory_vectors.py
+-----------------------------
+Διανυσματική μνήμη της Ζένιας για σημασιολογική ανάκληση.
+- HashingEmbedder: ντετερμινιστικά embeddings από n-grams χαρακτήρων (CPU, χωρίς μοντέλο)
+- VectorStore: float32 διανύσματα σε memory-mapped αρχείο NumPy δίπλα στη βάση
+- Brute-force cosine top-k· IVF ευρετήριο όταν ο πίνακας ξεπεράσει τις ~100k γραμμές
+- VectorIndexer: embeddings νέων γεγονότων σε δικό του thread, με περιοδικό flush του memmap
+"""
+
+import os
+import json
+import time
+import zlib
+import queue
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.utils.text_tools import fold_accents
+
+
+class HashingEmbedder:
+    """
+    Feature hashing λέξεων και 3-grams χαρακτήρων σε διάνυσμα σταθερής διάστασης.
+    Χρησιμοποιεί crc32 (όχι hash()) ώστε τα διανύσματα να είναι ίδια σε κάθε εκτέλεση.
+    """
+
+    def __init__(self, dim: int = 256, ngram: int = 3):
+        self.dim = dim
+        self.ngram = ngram
+
+    def _features(self, text: str) -> List[str]:
+        words = fold_accents(text).lower().split()
+        feats = [f"w:{w}" for w in words]
+        for w in words:
+            padded = f" {w} "
+            feats.extend(padded[i:i + self.ngram] for i in range(max(1, len(padded) - self.ngram + 1)))
+        return feats
+
+    def embed(self, text: str) -> np.ndarray:
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for feat in self._features(text):
+            h = zlib.crc32(feat.encode("utf-8"))
+            vec[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else vec
+
+    def embed_many(self, texts: Iterable[str]) -> np.ndarray:
+        rows = [self.embed(t) for t in texts]
+        return np.vstack(rows) if rows else np.zeros((0, self.dim), dtype=np.float32)
+
+
+class _IVFIndex:
+    """Inverted-file ευρετήριο: k-means centroids + λίστες γραμμών ανά centroid."""
+
+    def __init__(self, vectors: np.ndarray, nlist: int, iters: int = 8, sample: int = 50000, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        n = vectors.shape[0]
+        train = vectors[rng.choice(n, size=min(sample, n), replace=False)]
+        centroids = train[rng.choice(train.shape[0], size=nlist, replace=False)].copy()
+        for _ in range(iters):
+            assign = np.argmax(train @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = train[assign == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        self.centroids = centroids.astype(np.float32)
+        self.lists: List[List[int]] = [[] for _ in range(nlist)]
+        for start in range(0, n, 65536):
+            chunk = vectors[start:start + 65536]
+            for offset, c in enumerate(np.argmax(chunk @ self.centroids.T, axis=1)):
+                self.lists[c].append(start + offset)
+
+    def add(self, row: int, vec: np.ndarray):
+        self.lists[int(np.argmax(self.centroids @ vec))].append(row)
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        nprobe = min(nprobe, len(self.lists))
+        probe = np.argpartition(self.centroids @ query, -nprobe)[-nprobe:]
+        rows = [r for c in probe for r in self.lists[c]]
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+
+class VectorStore:
+    """
+    Διανύσματα episodic μνήμης σε memory-mapped αρχεία:
+      <base>.vectors.f32 (float32, capacity × dim), <base>.vectors.ids (int64), <base>.vectors.json (meta)
+    Το ref id 0 σημαίνει κενή θέση, το -1 διαγραμμένη.
+    Ένα store ανά αρχείο σε κάθε process (βλ. open()), ώστε δύο αντικείμενα να μη
+    γράφουν τις ίδιες γραμμές του memmap.
+    """
+
+    _instances: Dict[str, "VectorStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, base_path: str, dim: int = 256, ivf_threshold: int = 100_000, nprobe: int = 8):
+        self.base_path = base_path
+        self.dim = dim
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._meta_path = f"{base_path}.vectors.json"
+        self._vec_path = f"{base_path}.vectors.f32"
+        self._ids_path = f"{base_path}.vectors.ids"
+
+        self.count = 0
+        self.capacity = 0
+        self._ivf: Optional[_IVFIndex] = None
+        self._refs = 0
+        self._closed = False
+        self._dirty = False
+        self._load()
+        self._row_of = {int(ref): row for row, ref in enumerate(self._ids[:self.count]) if ref > 0}
+
+    @classmethod
+    def open(cls, base_path: str, dim: int = 256, **kwargs) -> "VectorStore":
+        """Επιστρέφει το κοινό store για τα αρχεία <base_path>.vectors.* (το δημιουργεί αν χρειάζεται)."""
+        key = os.path.abspath(base_path)
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None or store._closed:
+                store = cls(key, dim=dim, **kwargs)
+                cls._instances[key] = store
+            store._refs += 1
+            return store
+
+    def close(self):
+        """Απελευθερώνει μία αναφορά· το τελευταίο close γράφει τα αρχεία στον δίσκο."""
+        with VectorStore._instances_lock:
+            if self._closed:
+                return
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            self._closed = True
+            if VectorStore._instances.get(self.base_path) is self:
+                del VectorStore._instances[self.base_path]
+        self.flush()
+
+    # ------------- Αρχεία -------------
+    def _load(self):
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self.dim = int(meta["dim"])
+            self.count = int(meta["count"])
+            self.capacity = int(meta["capacity"])
+        self._open_maps(max(self.capacity, 1024))
+
+    def _open_maps(self, capacity: int):
+        os.makedirs(os.path.dirname(os.path.abspath(self._vec_path)), exist_ok=True)
+        for path, itemsize in ((self._vec_path, 4 * self.dim), (self._ids_path, 8)):
+            with open(path, "ab") as f:
+                if f.tell() < capacity * itemsize:
+                    f.truncate(capacity * itemsize)
+        self.capacity = capacity
+        self._vecs = np.memmap(self._vec_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._ids = np.memmap(self._ids_path, dtype=np.int64, mode="r+", shape=(capacity,))
+
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        self._vecs.flush()
+        self._ids.flush()
+        del self._vecs, self._ids
+        self._open_maps(capacity)
+
+    def _save_meta(self):
+        tmp = f"{self._meta_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "count": self.count, "capacity": self.capacity}, f)
+        os.replace(tmp, self._meta_path)
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._vecs.flush()
+            self._ids.flush()
+            self._save_meta()
+            self._dirty = False
+
+    # ------------- Εγγραφές -------------
+    def __contains__(self, ref_id: int) -> bool:
+        with self._lock:
+            return int(ref_id) in self._row_of
+
+    @property
+    def max_ref_id(self) -> int:
+        # Με το lock: το _row_of αλλάζει από το thread του VectorIndexer
+        with self._lock:
+            return max(self._row_of) if self._row_of else 0
+
+    def add(self, ref_ids: Sequence[int], vectors: np.ndarray):
+        """Προσθέτει διανύσματα (ήδη κανονικοποιημένα) για τα αντίστοιχα ref ids· όσα υπάρχουν ήδη αγνοούνται."""
+        if not len(ref_ids):
+            return
+        with self._lock:
+            # Το store είναι κοινό: κάποιος άλλος μπορεί να έχει ήδη γράψει τα ίδια ids
+            keep = [i for i, ref in enumerate(ref_ids) if int(ref) not in self._row_of]
+            if len(keep) < len(ref_ids):
+                if not keep:
+                    return
+                ref_ids = [ref_ids[i] for i in keep]
+                vectors = vectors[keep]
+            start = self.count
+            end = start + len(ref_ids)
+            if end > self.capacity:
+                self._grow(end)
+            self._vecs[start:end] = vectors
+            self._ids[start:end] = ref_ids
+            for offset, ref in enumerate(ref_ids):
+                self._row_of[int(ref)] = start + offset
+            self.count = end
+
+            if self._ivf is not None:
+                for row in range(start, end):
+                    self._ivf.add(row, self._vecs[row])
+            elif self.count >= self.ivf_threshold:
+                self.build_index()
+            # Όχι flush ανά add: το memmap γράφεται περιοδικά (VectorIndexer) και στο close
+            self._dirty = True
+
+    def remove(self, ref_ids: Iterable[int]):
+        with self._lock:
+            for ref in ref_ids:
+                row = self._row_of.pop(int(ref), None)
+                if row is not None:
+                    self._ids[row] = -1
+                    self._dirty = True
+            # Αν οι διαγραμμένες θέσεις είναι οι μισές, συμπτύσσουμε για να μη μεγαλώνει το αρχείο
+            if self.count and len(self._row_of) < self.count // 2:
+                self.compact()
+            # Όπως στο add: χωρίς flush εδώ, γράφεται με το περιοδικό flush και στο close
+
+    def clear(self):
+        """Αδειάζει το store (τα αρχεία μένουν με την ίδια χωρητικότητα)."""
+        with self._lock:
+            self._vecs[:self.count] = 0
+            self._ids[:self.count] = 0
+            self.count = 0
+            self._row_of = {}
+            self._ivf = None
+            self._dirty = True
+            self.flush()
+
+    def compact(self):
+        """Μετακινεί τα ζωντανά διανύσματα στην αρχή και αφαιρεί τις διαγραμμένες θέσεις."""
+        with self._lock:
+            n = self.count
+            live = np.flatnonzero(np.asarray(self._ids[:n]) > 0)
+            kept = len(live)
+            self._vecs[:kept] = self._vecs[live]
+            self._ids[:kept] = self._ids[live]
+            self._vecs[kept:n] = 0
+            self._ids[kept:n] = 0
+            self.count = kept
+            self._row_of = {int(ref): row for row, ref in enumerate(self._ids[:kept])}
+            self._ivf = None
+            self._dirty = True
+            self.flush()
+
+    def build_index(self, nlist: Optional[int] = None):
+        """Χτίζει IVF ευρετήριο (≈√n λίστες) για υπο-γραμμική αναζήτηση."""
+        with self._lock:
+            n = self.count
+            if n == 0:
+                return
+            nlist = nlist or max(16, int(np.sqrt(n)))
+            self._ivf = _IVFIndex(np.asarray(self._vecs[:n]), nlist=min(nlist, n))
+
+    # ------------- Αναζήτηση -------------
+    def search(self, query: np.ndarray, top_k: int = 10) -> List[Tuple[int, float]]:
+        """Επιστρέφει [(ref_id, cosine)] με τα top_k πιο κοντινά διανύσματα."""
+        with self._lock:
+            n = self.count
+            if n == 0 or top_k <= 0:
+                return []
+            if self._ivf is None and n >= self.ivf_threshold:
+                self.build_index()
+
+            if self._ivf is not None:
+                rows = self._ivf.candidates(query, self.nprobe)
+                sims = self._vecs[rows] @ query
+            else:
+                rows = None
+                sims = np.asarray(self._vecs[:n]) @ query
+            refs = self._ids[rows] if rows is not None else np.asarray(self._ids[:n])
+
+        sims = np.where(refs > 0, sims, -np.inf)
+        k = min(top_k, len(sims))
+        if k == 0:
+            return []
+        best = np.argpartition(sims, -k)[-k:]
+        best = best[np.argsort(sims[best])[::-1]]
+        return [(int(refs[i]), float(sims[i])) for i in best if np.isfinite(sims[i])]
+
+
+class VectorIndexer:
+    """
+    Embeddings και εισαγωγή στο VectorStore σε δικό του thread.
+    submit() απλώς βάζει το batch [(id, content)] σε ουρά — καλείται από το thread
+    του writer, που έτσι δεν περιμένει embed_many / add / build_index.
+    Το memmap γράφεται στον δίσκο το πολύ κάθε `flush_interval` δευτερόλεπτα.
+    """
+
+    def __init__(self, store: VectorStore, embedder: HashingEmbedder, flush_interval: float = 5.0):
+        self.store = store
+        self.embedder = embedder
+        self.flush_interval = flush_interval
+        self.last_error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="VectorIndexer", daemon=True)
+        self._thread.start()
+
+    def index(self, events: Sequence[Tuple[int, str]]):
+        """Σύγχρονη εισαγωγή (π.χ. συγχρονισμός στην εκκίνηση)."""
+        if events:
+            self.store.add([i for i, _ in events], self.embedder.embed_many(c or "" for _, c in events))
+
+    def submit(self, events: Sequence[Tuple[int, str]]):
+        if events:
+            self._queue.put(list(events))
+
+    def join(self):
+        """Περιμένει να ευρετηριαστούν όσα έχουν ήδη υποβληθεί."""
+        self._queue.join()
+
+    def _loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                events = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                events = ()
+            else:
+                if events is None:
+                    self._queue.task_done()
+                    break
+                try:
+                    self.index(events)
+                    self.last_error = None
+                except Exception as e:
+                    # Τα ids που λείπουν συμπληρώνονται στον επόμενο συγχρονισμό (MemoryManager._sync_vectors)
+                    self.last_error = e
+                finally:
+                    self._queue.task_done()
+            if time.monotonic() - last_flush >= self.flush_interval:
+                try:
+                    self.store.flush()
+                except Exception as e:
+                    self.last_error = e
+                last_flush = time.monotonic()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+        self.store.flush()
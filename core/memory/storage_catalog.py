@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+core/memory/storage_catalog.py
+------------------------------
+Κατάλογος των βάσεων SQLite της Ζένιας (storage.yaml).
+- Κάθε αποθήκη έχει όνομα (memory_system, conversation, world_model, …) και
+  η διαδρομή της λύνεται από ΕΝΑ σημείο: ρίζα project + data_dir, όχι από το CWD
+- connect(): μία σύνδεση με όλες τις αποθήκες συνδεδεμένες (ATTACH DATABASE)
+  ώστε ερωτήματα που διασχίζουν βάσεις να γίνονται με ένα SQL
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import yaml
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "storage.yaml")
+
+# Αν λείπει το storage.yaml
+_FALLBACK = {
+    "data_dir": "data",
+    "stores": {
+        "memory_system": "memory_system.db3",
+        "memory": "memory.db",
+        "conversation": "zenia_memory.db",
+        "world_model": "db/world_model.db3",
+    },
+}
+
+
+class StorageCatalog:
+    """Όνομα αποθήκης → απόλυτη διαδρομή, και συνδέσεις με όλες τις αποθήκες attached."""
+
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = config_path or os.environ.get("ZENIA_STORAGE_CONFIG") or DEFAULT_CONFIG_PATH
+        config = _FALLBACK
+        if os.path.exists(self.config_path):
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or _FALLBACK
+
+        data_dir = os.environ.get("ZENIA_DATA_DIR") or config.get("data_dir") or "data"
+        self.data_dir = data_dir if os.path.isabs(data_dir) else os.path.join(PROJECT_ROOT, data_dir)
+        self.stores: Dict[str, str] = {}
+        for name, path in (config.get("stores") or {}).items():
+            path = os.environ.get(f"ZENIA_DB_{name.upper()}") or path
+            self.stores[name] = os.path.normpath(path if os.path.isabs(path) else os.path.join(self.data_dir, path))
+
+        self._shared: Optional[sqlite3.Connection] = None
+        self._shared_attached: set = set()
+        self._shared_lock = threading.Lock()
+
+    # ------------- Διαδρομές -------------
+    def path(self, name: str) -> str:
+        try:
+            return self.stores[name]
+        except KeyError:
+            raise KeyError(f"Άγνωστη αποθήκη: {name} (διαθέσιμες: {', '.join(self.stores)})") from None
+
+    def names(self) -> List[str]:
+        return list(self.stores)
+
+    def name_of(self, path: str) -> Optional[str]:
+        """Το όνομα της αποθήκης με αυτή τη διαδρομή (None αν δεν είναι στον κατάλογο)."""
+        path = os.path.abspath(path)
+        for name, store_path_ in self.stores.items():
+            if os.path.abspath(store_path_) == path:
+                return name
+        return None
+
+    # ------------- Συνδέσεις -------------
+    def connect(self, main: str = "memory_system", attach: Optional[Iterable[str]] = None,
+                readonly: bool = False) -> sqlite3.Connection:
+        """
+        Ανοίγει την αποθήκη `main` και κάνει ATTACH τις υπόλοιπες με το όνομά τους
+        (π.χ. world_model.states). Αποθήκες που δεν υπάρχουν ακόμα παραλείπονται.
+        """
+        main_path = self.path(main)
+        os.makedirs(os.path.dirname(main_path), exist_ok=True)
+        conn = sqlite3.connect(main_path, timeout=30.0, check_same_thread=False)
+        self._attach_existing(conn, main, self.names() if attach is None else attach)
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _attach_existing(self, conn: sqlite3.Connection, main: str, names: Iterable[str],
+                         attached: Iterable[str] = ()) -> List[str]:
+        """ATTACH όσες από τις αποθήκες υπάρχουν και δεν είναι ήδη attached· επιστρέφει ποιες."""
+        done = []
+        for name in names:
+            path = self.path(name)
+            if name != main and name not in attached and os.path.exists(path):
+                conn.execute("ATTACH DATABASE ? AS " + _quote(name), (path,))
+                done.append(name)
+        return done
+
+    @contextmanager
+    def attached(self, main: str = "memory_system", attach: Optional[Iterable[str]] = None,
+                 readonly: bool = True):
+        conn = self.connect(main, attach, readonly)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """
+        Ερώτημα (μόνο ανάγνωση) στην κοινή σύνδεση όπου είναι attached όλες οι αποθήκες.
+        Αποθήκες που δημιουργήθηκαν μετά το άνοιγμα της σύνδεσης γίνονται attach εδώ.
+        """
+        with self._shared_lock:
+            if self._shared is None:
+                self._shared = self.connect(readonly=True)
+                self._shared_attached = {r[1] for r in self._shared.execute("PRAGMA database_list")}
+            self._shared_attached.update(
+                self._attach_existing(self._shared, "memory_system", self.names(), self._shared_attached))
+            return self._shared.execute(sql, params).fetchall()
+
+    def close(self):
+        with self._shared_lock:
+            if self._shared is not None:
+                self._shared.close()
+                self._shared = None
+                self._shared_attached = set()
+
+    # ------------- Ερωτήματα μεταξύ αποθηκών -------------
+    def events_with_states(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Τα πιο πρόσφατα γεγονότα μαζί με τις καταστάσεις του world model που
+        αναφέρονται σε αυτά (π.χ. last_input / last_action) — ένα JOIN αντί για N ερωτήματα.
+        Ευρετική: τα states δεν κρατούν id γεγονότος, οπότε η σύνδεση γίνεται με
+        ισότητα κειμένου (s.value = e.content), χωρίς ευρετήριο — σαρώνει τον πίνακα
+        states για καθένα από τα `limit` γεγονότα και ταιριάζει μόνο ό,τι είναι ακόμα
+        η τρέχουσα τιμή ενός state με ακριβώς το ίδιο κείμενο.
+        """
+        if not os.path.exists(self.path("world_model")):
+            return [{"id": i, "ts": ts, "event_type": t, "content": c, "emotion": em, "states": {}}
+                    for i, ts, t, c, em in self.query(
+                        "SELECT id, timestamp, event_type, content, emotion FROM episodic_memory "
+                        "ORDER BY id DESC LIMIT ?", (limit,))]
+        rows = self.query("""
+            SELECT e.id, e.timestamp, e.event_type, e.content, e.emotion, s.key, s.updated_at
+            FROM (SELECT * FROM main.episodic_memory ORDER BY id DESC LIMIT ?) AS e
+            LEFT JOIN world_model.states AS s ON s.value = e.content
+            ORDER BY e.id DESC
+        """, (limit,))
+        events: Dict[int, Dict[str, Any]] = {}
+        for event_id, ts, event_type, content, emotion, key, updated_at in rows:
+            event = events.setdefault(event_id, {
+                "id": event_id, "ts": ts, "event_type": event_type,
+                "content": content, "emotion": emotion, "states": {},
+            })
+            if key is not None:
+                event["states"][key] = updated_at
+        return list(events.values())
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+_default: Optional[StorageCatalog] = None
+
+
+def default_catalog() -> StorageCatalog:
+    global _default
+    if _default is None:
+        _default = StorageCatalog()
+    return _default
+
+
+def store_path(name: str) -> str:
+    """Η απόλυτη διαδρομή μιας αποθήκης από τον προεπιλεγμένο κατάλογο."""
+    return default_catalog().path(name)
+
+
+def store_name(path: str) -> Optional[str]:
+    """Το όνομα της αποθήκης μιας διαδρομής στον προεπιλεγμένο κατάλογο (ή None)."""
+    return default_catalog().name_of(path)
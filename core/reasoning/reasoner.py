@@ -1,5 +1,7 @@
 import torch
 
+from core.utils.intent_lexicon import scan
+
 class Reasoner:
     """
     Πυρήνας Λογικής της Ζένια.
@@ -25,18 +27,19 @@ class Reasoner:
     # 🧭 Πρόβλεψη πρόθεσης (intent)
     # ------------------------------------------------------------
     def predict_intent(self, text: str) -> str:
-        t = (text or "").lower()
-        if any(w in t for w in ["άνοιξε", "open "]):
+        # Μία σάρωση με το κοινό λεξικό (cache: οι υπόλοιποι reasoners την ξαναχρησιμοποιούν)
+        s = scan(text)
+        if s.has("open", "open_en"):
             return "open_app"
-        if any(w in t for w in ["κλείσε", "close "]):
+        if s.has("close", "close_en"):
             return "close_app"
-        if any(w in t for w in ["παίξε", "βάλε"]) and "μουσ" in t:
+        if s.has("play") and s.has("music_stem"):
             return "play_music"
-        if "ώρα" in t:
+        if s.has("time"):
             return "query_time"
-        if "ημερομηνία" in t or "μέρα" in t:
+        if s.has("date"):
             return "query_date"
-        if "www." in t or "http" in t:
+        if s.has("url"):
             return "open_url"
         return "general_reasoning"
 
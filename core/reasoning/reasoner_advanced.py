@@ -5,12 +5,15 @@ import webbrowser
 from typing import Any
 
 from core.action.action_executor import ActionExecutor
+from core.utils.intent_lexicon import scan
 
 
 class ReasonerAdvanced:
     """
     Advanced Reasoner της Ζένια: απλά intents + αξιοποίηση WorldModel.
     Χρησιμοποιείται από ReasoningManager.process_input(user_text).
+    Το world_model μπορεί να είναι και η AsyncMemory: τότε οι εγγραφές
+    (set_state, ensure_entity) γίνονται στο παρασκήνιο.
     """
 
     def __init__(self, online_mode: bool = True):
@@ -21,24 +24,25 @@ class ReasonerAdvanced:
         t = (user_text or "").strip().lower()
         if not t:
             return "Δεν σε άκουσα καθαρά. Μπορείς να το επαναλάβεις;"
+        s = scan(t)
 
         # Μικρά κοινωνικά
-        if any(x in t for x in ["γεια", "καλημέρα", "καλησπέρα"]):
+        if s.has("greeting"):
             world_model.set_state("last_greeting", datetime.datetime.utcnow().isoformat())
             return "Γεια! Πώς μπορώ να βοηθήσω;"
 
         # Χρόνος/Ημερομηνία
-        if "ώρα" in t:
+        if s.has("time"):
             now = datetime.datetime.now().strftime("%H:%M")
             world_model.set_state("last_time_check", now)
             return f"Η ώρα είναι {now}."
-        if "ημερομηνία" in t or "μέρα" in t:
+        if s.has("date"):
             today = datetime.datetime.now().strftime("%d/%m/%Y")
             world_model.set_state("last_date_check", today)
             return f"Σήμερα είναι {today}."
 
         # Αναζήτηση
-        if any(x in t for x in ["ψάξε", "bρες", "αναζήτησε", "τι είναι", "googl", "google"]):
+        if s.has("search"):
             query = re.sub(r"(ψάξε|βρες|αναζήτησε|τι είναι|google|googl)", "", t).strip()
             if self.online_mode and query:
                 webbrowser.open(f"https://www.google.com/search?q={query.replace(' ', '+')}")
@@ -46,27 +50,25 @@ class ReasonerAdvanced:
             return "Πες μου τι να ψάξω."
 
         # Άνοιγμα/Κλείσιμο εφαρμογών
-        if any(x in t for x in ["άνοιξε", "ξεκίνα", "open", "launch"]):
+        if s.has("open", "start", "launch_en"):
             app = re.sub(r"(άνοιξε|ξεκίνα|open|launch|το|την|τον)", "", t).strip()
             return self.executor.open_app(app) if app else "Ποια εφαρμογή να ανοίξω;"
-        if any(x in t for x in ["κλείσε", "τερμάτισε", "shutdown", "σταμάτα", "σβήσε"]):
+        if s.has("close", "terminate", "shutdown_en", "stop", "switch_off"):
             app = re.sub(r"(κλείσε|τερμάτισε|shutdown|σταμάτα|σβήσε|το|την|τον)", "", t).strip()
             return self.executor.close_app(app) if app else "Ποια εφαρμογή να κλείσω;"
 
         # Μουσική
-        if any(x in t for x in ["παίξε", "βάλε", "μουσική", "youtube", "τραγούδι"]):
+        if s.has("play", "music", "youtube", "song"):
             song = re.sub(r"(παίξε|βάλε|μουσική|youtube|τραγούδι|στο)", "", t).strip()
             return self.executor.play_music(song)
 
         # Ταυτότητα
-        if any(x in t for x in ["πως σε λένε", "όνομά σου", "ποιο είναι το όνομά σου"]):
+        if s.has("assistant_name"):
             world_model.set_state("assistant_name", "Ζένια")
             return "Με λένε Ζένια — ο ψηφιακός σου άνθρωπος."
 
-        if any(x in t for x in ["πως με λένε", "το όνομά μου", "ποιος είμαι"]):
-            e = world_model.get_entity("Angelos")
-            if not e:
-                world_model.upsert_entity("Angelos", type_="person", attrs_json='{"role":"owner"}')
+        if s.has("user_name"):
+            world_model.ensure_entity("Angelos", type_="person", attrs_json='{"role":"owner"}')
             return "Σε λένε Άγγελο — είσαι ο δημιουργός μου. 😊"
 
         return "Το σημείωσα. Πες μου αν θες να το ψάξω ή να εκτελέσω κάτι."
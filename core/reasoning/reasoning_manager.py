@@ -10,11 +10,11 @@ core/reasoning/reasoning_manager.py
 import re
 import webbrowser
 import datetime
-import threading
 
 from core.action.action_executor import ActionExecutor
 from core.memory.memory_manager import MemoryManager
-from core.learning.adaptive_learner import AdaptiveLearner
+from core.memory.async_memory import AsyncMemory
+from core.learning.adaptive_learner import shared_learner
 from core.emotion.emotion_engine import EmotionEngine
 from core.reasoning.world_model import WorldModel
 from .reasoner import Reasoner
@@ -28,14 +28,15 @@ class ReasoningManager:
         # Υποσυστήματα
         self.reasoner = Reasoner(device=self.device)
         self.memory = MemoryManager()
-        self.learner = AdaptiveLearner()
+        self.learner = shared_learner()
         self.emotion_engine = EmotionEngine()
         self.executor = ActionExecutor()
         self.world_model = WorldModel()
+        # Οι εγγραφές της διαδρομής απάντησης γίνονται στο παρασκήνιο (καμία I/O στο process)
+        self.async_memory = AsyncMemory(self.memory, self.world_model, self.learner)
 
         # Κατάσταση λειτουργίας
         self._is_running = False
-        self._loop_thread = None
 
         print("✅ [ReasoningManager] Υποσυστήματα φόρτωσαν επιτυχώς.")
 
@@ -43,28 +44,39 @@ class ReasoningManager:
     # 🧠 Εκκίνηση reasoning loop (ώστε να είναι συμβατό με start_zenia.py)
     # ------------------------------------------------------------
     def start(self):
-        """Εκκινεί το reasoning loop (προαιρετικά background λογική)."""
+        """
+        Εκκινεί το reasoning. Δεν υπάρχει πλέον background loop (δεν έκανε τίποτα)·
+        όποια λογική πρέπει να αντιδρά σε αλλαγές του κόσμου εγγράφεται με watch().
+        """
         if not self._is_running:
             self._is_running = True
-            self._loop_thread = threading.Thread(target=self._loop, daemon=True)
-            self._loop_thread.start()
             print("🧠 [ReasoningManager] Το reasoning ξεκίνησε.")
 
-    def _loop(self):
-        """Background loop αν χρειαστεί μελλοντική συνεχή λογική."""
-        while self._is_running:
-            # Εδώ μπορεί να μπει μελλοντικά monitoring, world updates κ.λπ.
-            # Προς το παρόν δεν κάνει κάτι.
-            import time
-            time.sleep(0.1)
+    def watch(self, callback, key=None, entity_type=None):
+        """Συνδρομή σε αλλαγές του κόσμου (state key ή τύπος οντότητας)· επιστρέφει token."""
+        return self.world_model.subscribe(callback, key=key, entity_type=entity_type)
+
+    def unwatch(self, token):
+        self.world_model.unsubscribe(token)
 
     # ------------------------------------------------------------
     # 🛑 Τερματισμός reasoning
     # ------------------------------------------------------------
     def shutdown(self):
         self._is_running = False
-        if self._loop_thread and self._loop_thread.is_alive():
-            self._loop_thread.join(timeout=1.0)
+        # Πρώτα αδειάζει η ουρά εγγραφών, μετά κλείνει η μνήμη
+        self.async_memory.close()
+        try:
+            self.memory.shutdown()
+        except Exception:
+            pass
+        # Γράφει τα states που εκκρεμούν (βλ. WorldModel.state_flush_interval)
+        self.world_model.close()
+        # Compaction του journal μάθησης στο learning_memory.json
+        try:
+            self.learner.close()
+        except Exception:
+            pass
         print("🧠 [ReasoningManager] Το reasoning τερματίστηκε.")
 
     def is_running(self):
@@ -77,6 +89,17 @@ class ReasoningManager:
         if not text or not text.strip():
             return "⚠️ Δεν δόθηκε είσοδος προς ανάλυση."
 
+        reply = self._respond(text)
+
+        # Ιστορικό συνομιλίας (για prompts / memory viewer)
+        try:
+            self.async_memory.add_turn("user", text)
+            self.async_memory.add_turn("assistant", reply)
+        except Exception:
+            pass
+        return reply
+
+    def _respond(self, text: str) -> str:
         # 1) Intent + ανάλυση
         intent = self.reasoner.predict_intent(text)
         analysis = self.reasoner.analyze(text)
@@ -86,27 +109,22 @@ class ReasoningManager:
 
         # 3) Ενέργειες
         action_result = self._handle_action(text, intent)
+
+        # 4) Μάθηση (journal append/compaction στον writer του παρασκηνίου)
+        self.async_memory.learn(text, intent, action_result or "")
+
         if action_result:
-            self.memory.store_event(
+            self.async_memory.store_event(
                 event_type="action_result",
                 content=f"{text} -> {action_result}",
                 emotion=emotion,
                 importance=0.7
             )
-            self.world_model.set_state("last_action", action_result)
+            self.async_memory.set_state("last_action", action_result)
             return f"{prefix}{action_result}"
 
-        # 4) Μάθηση
-        try:
-            if hasattr(self.learner, "learn_from"):
-                self.learner.learn_from(text)
-            else:
-                self.learner.learn()
-        except Exception:
-            pass
-
         # 5) Καταγραφή στη μνήμη
-        self.memory.store_event(
+        self.async_memory.store_event(
             event_type="user_input",
             content=text,
             emotion=emotion,
@@ -115,8 +133,8 @@ class ReasoningManager:
 
         # 6) World state
         try:
-            self.world_model.set_state("last_input", text)
-            self.world_model.set_state("last_intent", intent)
+            self.async_memory.set_state("last_input", text)
+            self.async_memory.set_state("last_intent", intent)
         except Exception:
             pass
 
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+core/reasoning/world_changes.py
+-------------------------------
+Ροή αλλαγών (change feed) του WorldModel.
+Κάθε αλλαγή (state / entity / relation) παίρνει αύξοντα αριθμό (seq),
+γράφεται στον πίνακα changes και παραδίδεται στους συνδρομητές από
+ένα thread διανομής — οι callbacks δεν καθυστερούν ποτέ τον writer.
+Συνδρομές ανά key (states), ανά τύπο οντότητας ή ανά είδος αλλαγής.
+"""
+
+import itertools
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Change = Dict[str, Any]     # {seq, ts, kind, key, entity_type, value}
+
+STATE = "state"
+ENTITY = "entity"
+RELATION = "relation"
+
+
+class ChangeFeed:
+    """In-process pub/sub για αλλαγές του world model."""
+
+    def __init__(self):
+        self._subs: Dict[int, tuple] = {}
+        self._by_key: Dict[str, set] = {}
+        self._by_type: Dict[str, set] = {}
+        self._wildcard: set = set()
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[List[Change]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+
+    # ------------- Συνδρομές -------------
+    def subscribe(self, callback: Callable[[Change], Any], key: Optional[str] = None,
+                  entity_type: Optional[str] = None, kind: Optional[str] = None) -> int:
+        """
+        Καλεί callback(change) για κάθε αλλαγή που ταιριάζει:
+        key → μόνο αυτό το state, entity_type → οντότητες αυτού του τύπου,
+        kind → μόνο αυτό το είδος ("state" / "entity" / "relation"), τίποτα → όλες.
+        Επιστρέφει token για το unsubscribe.
+        """
+        token = next(self._tokens)
+        with self._lock:
+            self._subs[token] = (callback, key, entity_type, kind)
+            if key is not None:
+                self._by_key.setdefault(key, set()).add(token)
+            elif entity_type is not None:
+                self._by_type.setdefault(entity_type, set()).add(token)
+            else:
+                self._wildcard.add(token)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch_loop, name="WorldChangeFeed", daemon=True)
+                self._thread.start()
+        return token
+
+    def unsubscribe(self, token: int):
+        with self._lock:
+            sub = self._subs.pop(token, None)
+            if sub is None:
+                return
+            _, key, entity_type, _ = sub
+            for index, value in ((self._by_key, key), (self._by_type, entity_type)):
+                if value is not None and token in index.get(value, ()):
+                    index[value].discard(token)
+                    if not index[value]:
+                        del index[value]
+            self._wildcard.discard(token)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subs)
+
+    # ------------- Διανομή -------------
+    def publish(self, changes: Iterable[Change]):
+        """Βάζει τις αλλαγές στην ουρά διανομής (επιστρέφει αμέσως)."""
+        changes = list(changes)
+        if changes and self._subs:
+            self._queue.put(changes)
+
+    def _targets(self, change: Change) -> List[Callable[[Change], Any]]:
+        with self._lock:
+            tokens = set(self._wildcard)
+            if change.get("key") is not None:
+                tokens |= self._by_key.get(change["key"], set())
+            if change.get("entity_type") is not None:
+                tokens |= self._by_type.get(change["entity_type"], set())
+            subs = [self._subs[t] for t in sorted(tokens) if t in self._subs]
+        return [cb for cb, key, _, kind in subs
+                if (kind is None or kind == change["kind"]) and (key is None or change["kind"] == STATE)]
+
+    def _dispatch_loop(self):
+        while True:
+            changes = self._queue.get()
+            if changes is None:
+                break
+            for change in changes:
+                for callback in self._targets(change):
+                    try:
+                        callback(change)
+                    except Exception as e:
+                        # Ένας συνδρομητής που σκάει δεν σταματά τη ροή για τους υπόλοιπους
+                        self.errors += 1
+                        self.last_error = e
+
+    def close(self, timeout: float = 2.0):
+        """Σταματά το thread διανομής αφού παραδώσει ό,τι έχει ήδη μπει στην ουρά."""
+        if self._thread is not None:
+            self._queue.put(None)
+            if self._thread is not threading.current_thread():
+                self._thread.join(timeout=timeout)
+            self._thread = None
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+core/reasoning/world_graph.py
+-----------------------------
+Αντίγραφο του γράφου entities/relations του WorldModel στη μνήμη (adjacency lists).
+Φορτώνεται μία φορά και ενημερώνεται σε κάθε upsert, ώστε γείτονες, BFS και
+διαδρομές να μη χρειάζονται ένα SQL ερώτημα ανά βήμα.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+Edge = Tuple[int, str, int]     # (src_id, rel_type, dst_id)
+
+OUT = "out"
+IN = "in"
+BOTH = "both"
+
+
+class WorldGraph:
+    """Κατευθυνόμενος γράφος με ετικέτες ακμών· οι κόμβοι είναι entity ids."""
+
+    def __init__(self):
+        self.names: Dict[int, str] = {}
+        self.types: Dict[int, str] = {}
+        self.ids: Dict[str, int] = {}
+        self._out: Dict[int, Dict[str, Set[int]]] = {}
+        self._in: Dict[int, Dict[str, Set[int]]] = {}
+        self._by_type: Dict[str, Set[int]] = {}
+        self.edge_count = 0
+        self.version = 0                # αυξάνεται σε κάθε αλλαγή (για caches αποτελεσμάτων)
+
+    # ------------- Ενημερώσεις -------------
+    def add_entity(self, entity_id: int, name: str, type_: Optional[str]):
+        old_type = self.types.get(entity_id)
+        if old_type is not None and old_type != type_:
+            self._by_type.get(old_type, set()).discard(entity_id)
+        old_name = self.names.get(entity_id)
+        if old_name is not None and old_name != name:
+            self.ids.pop(old_name, None)
+        self.names[entity_id] = name
+        self.types[entity_id] = type_ or ""
+        self.ids[name] = entity_id
+        self._by_type.setdefault(type_ or "", set()).add(entity_id)
+        self.version += 1
+
+    def add_relation(self, src_id: int, rel_type: str, dst_id: int):
+        targets = self._out.setdefault(src_id, {}).setdefault(rel_type, set())
+        if dst_id in targets:
+            return
+        targets.add(dst_id)
+        self._in.setdefault(dst_id, {}).setdefault(rel_type, set()).add(src_id)
+        self.edge_count += 1
+        self.version += 1
+
+    # ------------- Αναζητήσεις -------------
+    def entities_of_type(self, type_: str) -> Set[int]:
+        return set(self._by_type.get(type_, ()))
+
+    def degree(self, entity_id: int, rel_type: Optional[str] = None, direction: str = OUT) -> int:
+        return sum(1 for _ in self._edges(entity_id, rel_type, direction))
+
+    def _edges(self, node: int, rel_types: Optional[Iterable[str]], direction: str) -> Iterable[Tuple[str, int, bool]]:
+        """(rel_type, γείτονας, forward) για κάθε ακμή του κόμβου."""
+        if isinstance(rel_types, str):
+            rel_types = (rel_types,)
+        for forward, table in ((True, self._out), (False, self._in)):
+            if direction == (IN if forward else OUT):
+                continue
+            by_rel = table.get(node)
+            if not by_rel:
+                continue
+            for rel in (rel_types if rel_types is not None else by_rel):
+                for other in by_rel.get(rel, ()):
+                    yield rel, other, forward
+
+    def neighbors(self, entity_id: int, rel_type: Optional[str] = None, direction: str = OUT) -> Set[int]:
+        return {other for _, other, _ in self._edges(entity_id, rel_type, direction)}
+
+    def bfs(self, start: int, max_depth: int = 2, rel_types: Optional[Iterable[str]] = None,
+            direction: str = OUT) -> Dict[int, int]:
+        """{entity_id: απόσταση} για όσους κόμβους απέχουν έως max_depth βήματα."""
+        if start not in self.names:
+            return {}
+        depth = {start: 0}
+        frontier = deque([start])
+        while frontier:
+            node = frontier.popleft()
+            if depth[node] >= max_depth:
+                continue
+            for _, other, _ in self._edges(node, rel_types, direction):
+                if other not in depth:
+                    depth[other] = depth[node] + 1
+                    frontier.append(other)
+        return depth
+
+    def shortest_path(self, src: int, dst: int, rel_types: Optional[Iterable[str]] = None,
+                      max_depth: int = 6, direction: str = OUT) -> Optional[List[Edge]]:
+        """Η συντομότερη διαδρομή ως λίστα ακμών (src, rel, dst), ή None."""
+        if src not in self.names or dst not in self.names:
+            return None
+        if src == dst:
+            return []
+        parent: Dict[int, Tuple[int, str, bool]] = {src: (src, "", True)}
+        frontier = deque([(src, 0)])
+        while frontier:
+            node, d = frontier.popleft()
+            if d >= max_depth:
+                continue
+            for rel, other, forward in self._edges(node, rel_types, direction):
+                if other in parent:
+                    continue
+                parent[other] = (node, rel, forward)
+                if other == dst:
+                    path = []
+                    while other != src:
+                        prev, rel, forward = parent[other]
+                        path.append((prev, rel, other) if forward else (other, rel, prev))
+                        other = prev
+                    return path[::-1]
+                frontier.append((other, d + 1))
+        return None
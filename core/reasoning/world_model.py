@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
 import os
 import sqlite3
-from typing import Optional, Dict, Any, List, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from datetime import datetime
 
+from core.memory.storage_catalog import store_path
+from core.memory.memory_jobs import PeriodicJob
+from core.reasoning.world_graph import WorldGraph, OUT
+from core.reasoning import world_query
+from core.reasoning.world_changes import ChangeFeed, Change, STATE, ENTITY, RELATION
+
 
 class WorldModel:
     """
@@ -11,17 +21,54 @@ class WorldModel:
     - entities(id, name, type, attrs_json)
     - relations(id, src_id, rel_type, dst_id, attrs_json)
     - states(id, key, value, updated_at)
+    Ο γράφος entities/relations έχει και αντίγραφο στη μνήμη (WorldGraph) που
+    φορτώνεται με την πρώτη χρήση και ενημερώνεται σε κάθε upsert.
+    Μέσα σε `with world_model.transaction():` οι εγγραφές γίνονται commit μία φορά στο τέλος.
+    Τα states σερβίρονται από τη μνήμη· οι αλλαγές γράφονται μαζεμένες κάθε
+    state_flush_interval δευτερόλεπτα (το «παράθυρο» απώλειας σε crash) και στο close().
+    Με state_flush_interval=0 κάθε set_state γράφεται αμέσως.
+    Κάθε αλλαγή παίρνει seq, γράφεται στον πίνακα changes και δημοσιεύεται στο
+    self.feed (subscribe ανά key / τύπο οντότητας) μόνο αφού γίνει commit· βλ. world_changes.py.
+    Ο πίνακας changes κρατά περίπου τις τελευταίες max_changes αλλαγές.
+    Οι εγγραφές περνούν από το self.conn υπό το self._lock· οι αναγνώσεις (get_entity,
+    list_entities, get_relations, changes_since) από δεύτερη σύνδεση (WAL), οπότε
+    βλέπουν μόνο ό,τι έχει γίνει commit και δεν περιμένουν ένα ανοιχτό transaction.
     """
+    BATCH_SIZE = 5000
 
-    def __init__(self, db_path: Optional[str] = None):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        # default: <project_root>/data/db/world_model.db3
-        default_db = os.path.join(base_dir, "data", "db", "world_model.db3")
-        self.db_path = db_path or default_db
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+    def __init__(self, db_path: Optional[str] = None, state_flush_interval: float = 1.0,
+                 max_changes: int = 100_000):
+        # default: <project_root>/data/db/world_model.db3 (βλ. core/memory/storage.yaml)
+        self.db_path = db_path or store_path("world_model")
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._graph: Optional[WorldGraph] = None
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        # Μετρητής αλλαγών του γράφου· ακυρώνει τη cache των ερωτημάτων μοτίβων
+        self.version = 0
+        self._query_cache: "OrderedDict[tuple, Tuple[int, Any]]" = OrderedDict()
+        self.query_cache_size = 256
+        # States: cache στη μνήμη + dirty keys (η τελευταία τιμή ανά key κερδίζει)
+        self.state_flush_interval = state_flush_interval
+        # Το _state_lock φυλάει μόνο την cache των states, ώστε το get_state να μην περιμένει το _lock
+        self._state_lock = threading.RLock()
+        self._states: Optional[Dict[str, Tuple[str, str]]] = None
+        self._dirty_states: Dict[str, Tuple[str, str]] = {}
+        self._tx_dirty_states: Dict[str, Tuple[str, str]] = {}
+        self._state_job: Optional[PeriodicJob] = None
+        # Change feed
+        self.feed = ChangeFeed()
+        self._tx_changes: List[Change] = []
+        self.max_changes = max_changes
         self._init_schema()
+        self._reader = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._reader.row_factory = sqlite3.Row
+        self._read_lock = threading.Lock()
+        # Αλλαγές που γράφτηκαν από το τελευταίο κλάδεμα του log
+        self._since_trim = 0
 
     def _init_schema(self):
         cur = self.conn.cursor()
@@ -48,51 +95,267 @@ class WorldModel:
             value TEXT,
             updated_at TEXT
         )""")
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS changes(
+            seq INTEGER PRIMARY KEY,
+            ts TEXT,
+            kind TEXT,
+            key TEXT,
+            entity_type TEXT,
+            value TEXT
+        )""")
+        # Το UNIQUE(src_id, rel_type, dst_id) καλύπτει ήδη τις αναζητήσεις με src_id
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_relations_dst ON relations(dst_id, rel_type)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_relations_type ON relations(rel_type)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(type)")
         self.conn.commit()
 
+    # ------------- Transactions -------------
+    @contextmanager
+    def transaction(self):
+        """
+        Ομαδοποιεί εγγραφές σε ένα commit· εμφωλευμένα scopes ενώνονται με το εξωτερικό.
+        Το rollback αναιρεί και τα set_state του scope (και όσα states γράφτηκαν μέσα του).
+        """
+        with self._lock:
+            if self._tx_depth == 0:
+                # Τα dirty states πριν από το transaction: ό,τι μπει ή γραφτεί μέσα του αναιρείται στο rollback
+                with self._state_lock:
+                    self._tx_dirty_states = dict(self._dirty_states)
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                    self._tx_changes = []
+                    with self._state_lock:
+                        self._dirty_states = self._tx_dirty_states
+                    self._invalidate_graph()
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.commit()
+                    changes, self._tx_changes = self._tx_changes, []
+                    self.feed.publish(changes)
+
+    def _commit(self):
+        if self._tx_depth == 0:
+            self.conn.commit()
+
+    def _read(self, sql: str, args: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
+        """Ανάγνωση από τη δεύτερη σύνδεση: μόνο δεδομένα που έχουν γίνει commit."""
+        with self._read_lock:
+            return self._reader.execute(sql, args).fetchall()
+
+    # ------------- Change log -------------
+    def _change(self, kind: str, key: str, entity_type: Optional[str], value: Optional[str],
+                ts: Optional[str] = None) -> Change:
+        # Το seq το δίνει η SQLite (INTEGER PRIMARY KEY) στο _log_changes
+        return {"seq": None, "ts": ts or datetime.utcnow().isoformat(), "kind": kind,
+                "key": key, "entity_type": entity_type, "value": value}
+
+    def _log_changes(self, changes: List[Change]):
+        """
+        Γράφει τις αλλαγές στο τρέχον transaction· δημοσιεύονται μετά το commit.
+        Το seq κάθε αλλαγής είναι το lastrowid της, ώστε δύο WorldModel (ή διεργασίες)
+        στο ίδιο αρχείο να μη συγκρούονται σε διπλά seq.
+        """
+        cur = self.conn.cursor()
+        for c in changes:
+            cur.execute("INSERT INTO changes(ts, kind, key, entity_type, value) VALUES(?,?,?,?,?)",
+                        (c["ts"], c["kind"], c["key"], c["entity_type"], c["value"]))
+            c["seq"] = int(cur.lastrowid)
+        # Φραγμένο log: κάθε ~max_changes/10 αλλαγές σβήνονται οι παλαιότερες (στο ίδιο transaction)
+        self._since_trim += len(changes)
+        if changes and self.max_changes and self._since_trim >= max(1, self.max_changes // 10):
+            cur.execute("DELETE FROM changes WHERE seq <= ?", (changes[-1]["seq"] - self.max_changes,))
+            self._since_trim = 0
+
+    def _publish(self, changes: List[Change]):
+        if self._tx_depth:
+            self._tx_changes.extend(changes)
+        else:
+            self.feed.publish(changes)
+
+    def subscribe(self, callback, key: Optional[str] = None, entity_type: Optional[str] = None,
+                  kind: Optional[str] = None) -> int:
+        return self.feed.subscribe(callback, key=key, entity_type=entity_type, kind=kind)
+
+    def unsubscribe(self, token: int):
+        self.feed.unsubscribe(token)
+
+    def changes_since(self, seq: int = 0, limit: int = 1000, kind: Optional[str] = None) -> List[Change]:
+        """
+        Οι αλλαγές με seq > seq από τον πίνακα (για catch-up μετά από επανεκκίνηση).
+        Για τα states καταγράφεται μόνο η τελευταία αλλαγή κάθε flush ανά key.
+        """
+        self.flush_states()
+        query = "SELECT seq, ts, kind, key, entity_type, value FROM changes WHERE seq > ?"
+        args: Tuple[Any, ...] = (seq,)
+        if kind is not None:
+            query += " AND kind = ?"
+            args += (kind,)
+        return [dict(r) for r in self._read(query + " ORDER BY seq LIMIT ?", args + (limit,))]
+
+    def trim_changes(self, keep: Optional[int] = None) -> int:
+        """
+        Σβήνει τις αλλαγές με seq <= μέγιστο seq του πίνακα - keep (default: max_changes)·
+        τα states έχουν κενά στην αρίθμηση. Γίνεται και αυτόματα από το _log_changes.
+        """
+        keep = self.max_changes if keep is None else keep
+        with self._lock:
+            cur = self.conn.execute(
+                "DELETE FROM changes WHERE seq <= (SELECT coalesce(max(seq), 0) FROM changes) - ?", (keep,))
+            self._commit()
+            return cur.rowcount
+
+    def _invalidate_graph(self):
+        """Μετά από rollback ο γράφος (και τα states) στη μνήμη ξαναφορτώνονται από τη βάση."""
+        self._graph = None
+        with self._state_lock:
+            self._states = None
+        self.version += 1
+
     # ------------- Entities -------------
     def upsert_entity(self, name: str, type_: str = "", attrs_json: str = "{}") -> int:
-        cur = self.conn.cursor()
-        cur.execute("SELECT id FROM entities WHERE name=?", (name,))
-        row = cur.fetchone()
-        if row:
-            cur.execute("UPDATE entities SET type=?, attrs_json=? WHERE id=?", (type_, attrs_json, row["id"]))
-            self.conn.commit()
-            return int(row["id"])
-        cur.execute("INSERT INTO entities(name, type, attrs_json) VALUES(?,?,?)", (name, type_, attrs_json))
-        self.conn.commit()
-        return int(cur.lastrowid)
+        # Ένα transaction: αν αποτύχει το log, αναιρείται και η εγγραφή της οντότητας
+        with self.transaction():
+            cur = self.conn.cursor()
+            cur.execute("SELECT id FROM entities WHERE name=?", (name,))
+            row = cur.fetchone()
+            if row:
+                cur.execute("UPDATE entities SET type=?, attrs_json=? WHERE id=?", (type_, attrs_json, row["id"]))
+                entity_id = int(row["id"])
+            else:
+                cur.execute("INSERT INTO entities(name, type, attrs_json) VALUES(?,?,?)", (name, type_, attrs_json))
+                entity_id = int(cur.lastrowid)
+            changes = [self._change(ENTITY, name, type_, attrs_json)]
+            self._log_changes(changes)
+            self._graph_entity(entity_id, name, type_)
+            self._publish(changes)
+            return entity_id
+
+    def ensure_entity(self, name: str, type_: str = "", attrs_json: str = "{}") -> int:
+        """Όπως το upsert_entity, αλλά αφήνει ανέγγιχτη μια οντότητα που υπάρχει ήδη."""
+        with self.transaction():
+            row = self.conn.execute("SELECT id FROM entities WHERE name=?", (name,)).fetchone()
+            if row:
+                return int(row["id"])
+            return self.upsert_entity(name, type_, attrs_json)
+
+    def upsert_entities(self, entities: Iterable[Union[Dict[str, Any], Tuple]]) -> int:
+        """
+        Μαζικό upsert: dicts {name, type, attrs_json} ή πλειάδες (name, type, attrs_json).
+        executemany με ON CONFLICT σε batches, ένα commit στο τέλος. Επιστρέφει το πλήθος.
+        """
+        total = 0
+        rows = (self._entity_row(e) for e in entities)
+        with self.transaction():
+            while True:
+                batch = list(islice(rows, self.BATCH_SIZE))
+                if not batch:
+                    break
+                self.conn.executemany("""
+                    INSERT INTO entities(name, type, attrs_json) VALUES(?,?,?)
+                    ON CONFLICT(name) DO UPDATE SET type=excluded.type, attrs_json=excluded.attrs_json
+                """, batch)
+                total += len(batch)
+                changes = [self._change(ENTITY, name, type_, attrs_json) for name, type_, attrs_json in batch]
+                self._log_changes(changes)
+                self._publish(changes)
+                if self._graph is not None:
+                    for entity_id, name, type_ in self._lookup_entities([r[0] for r in batch]):
+                        self._graph.add_entity(entity_id, name, type_)
+                self.version += 1
+        return total
+
+    @staticmethod
+    def _entity_row(entity) -> Tuple[str, str, str]:
+        if isinstance(entity, dict):
+            return (entity["name"], entity.get("type", entity.get("type_", "")) or "", entity.get("attrs_json", "{}"))
+        name, type_, attrs_json = (tuple(entity) + ("", "{}"))[:3]
+        return (name, type_ or "", attrs_json or "{}")
+
+    def _lookup_entities(self, names: List[str]) -> List[Tuple[int, str, str]]:
+        found = []
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            found.extend(tuple(r) for r in self.conn.execute(
+                f"SELECT id, name, type FROM entities WHERE name IN ({','.join('?' * len(chunk))})", chunk))
+        return found
 
     def get_entity(self, name: str) -> Optional[Dict[str, Any]]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT * FROM entities WHERE name=?", (name,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        rows = self._read("SELECT * FROM entities WHERE name=?", (name,))
+        return dict(rows[0]) if rows else None
 
     def list_entities(self, type_: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
-        cur = self.conn.cursor()
         if type_:
-            cur.execute("SELECT * FROM entities WHERE type=? LIMIT ?", (type_, limit))
+            rows = self._read("SELECT * FROM entities WHERE type=? LIMIT ?", (type_, limit))
         else:
-            cur.execute("SELECT * FROM entities LIMIT ?", (limit,))
-        return [dict(r) for r in cur.fetchall()]
+            rows = self._read("SELECT * FROM entities LIMIT ?", (limit,))
+        return [dict(r) for r in rows]
 
     # ------------- Relations -------------
     def upsert_relation(self, src_id: int, rel_type: str, dst_id: int, attrs_json: str = "{}") -> int:
-        cur = self.conn.cursor()
-        cur.execute("SELECT id FROM relations WHERE src_id=? AND rel_type=? AND dst_id=?", (src_id, rel_type, dst_id))
-        row = cur.fetchone()
-        if row:
-            cur.execute("UPDATE relations SET attrs_json=? WHERE id=?", (attrs_json, row["id"]))
-            self.conn.commit()
-            return int(row["id"])
-        cur.execute("INSERT INTO relations(src_id, rel_type, dst_id, attrs_json) VALUES(?,?,?,?)",
-                    (src_id, rel_type, dst_id, attrs_json))
-        self.conn.commit()
-        return int(cur.lastrowid)
+        with self.transaction():
+            cur = self.conn.cursor()
+            cur.execute("SELECT id FROM relations WHERE src_id=? AND rel_type=? AND dst_id=?", (src_id, rel_type, dst_id))
+            row = cur.fetchone()
+            changes = [self._change(RELATION, f"{src_id}:{rel_type}:{dst_id}", None, attrs_json)]
+            if row:
+                cur.execute("UPDATE relations SET attrs_json=? WHERE id=?", (attrs_json, row["id"]))
+                self._log_changes(changes)
+                self._publish(changes)
+                return int(row["id"])
+            cur.execute("INSERT INTO relations(src_id, rel_type, dst_id, attrs_json) VALUES(?,?,?,?)",
+                        (src_id, rel_type, dst_id, attrs_json))
+            relation_id = int(cur.lastrowid)
+            self._log_changes(changes)
+            self.version += 1
+            if self._graph is not None:
+                self._graph.add_relation(src_id, rel_type, dst_id)
+            self._publish(changes)
+            return relation_id
+
+    def upsert_relations(self, relations: Iterable[Tuple]) -> int:
+        """
+        Μαζικό upsert σχέσεων (src, rel_type, dst[, attrs_json]). Τα src/dst μπορεί
+        να είναι ids ή ονόματα οντοτήτων (σχέσεις με άγνωστα ονόματα παραλείπονται).
+        """
+        total = 0
+        rows = iter(relations)
+        with self.transaction():
+            while True:
+                batch = [tuple(r) + ("{}",) * (4 - len(r)) for r in islice(rows, self.BATCH_SIZE)]
+                if not batch:
+                    break
+                names = list({n for r in batch for n in (r[0], r[2]) if not isinstance(n, int)})
+                ids = {name: entity_id for entity_id, name, _ in self._lookup_entities(names)} if names else {}
+                resolved = []
+                for src, rel_type, dst, attrs_json in batch:
+                    src = src if isinstance(src, int) else ids.get(src)
+                    dst = dst if isinstance(dst, int) else ids.get(dst)
+                    if src is not None and dst is not None:
+                        resolved.append((src, rel_type, dst, attrs_json or "{}"))
+                self.conn.executemany("""
+                    INSERT INTO relations(src_id, rel_type, dst_id, attrs_json) VALUES(?,?,?,?)
+                    ON CONFLICT(src_id, rel_type, dst_id) DO UPDATE SET attrs_json=excluded.attrs_json
+                """, resolved)
+                total += len(resolved)
+                changes = [self._change(RELATION, f"{src}:{rel_type}:{dst}", None, attrs_json)
+                           for src, rel_type, dst, attrs_json in resolved]
+                self._log_changes(changes)
+                self._publish(changes)
+                if self._graph is not None:
+                    for src, rel_type, dst, _ in resolved:
+                        self._graph.add_relation(src, rel_type, dst)
+                self.version += 1
+        return total
 
     def get_relations(self, src_id: Optional[int] = None, rel_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        cur = self.conn.cursor()
         query = "SELECT * FROM relations WHERE 1=1"
         args: Tuple[Any, ...] = tuple()
         if src_id is not None:
@@ -101,21 +364,180 @@ class WorldModel:
         if rel_type is not None:
             query += " AND rel_type=?"
             args += (rel_type,)
-        cur.execute(query, args)
-        return [dict(r) for r in cur.fetchall()]
+        return [dict(r) for r in self._read(query, args)]
+
+    # ------------- Γράφος (στη μνήμη) -------------
+    @property
+    def graph(self) -> WorldGraph:
+        """Ο γράφος entities/relations· φορτώνεται από τη βάση την πρώτη φορά."""
+        with self._lock:
+            if self._graph is None:
+                graph = WorldGraph()
+                for r in self.conn.execute("SELECT id, name, type FROM entities"):
+                    graph.add_entity(r["id"], r["name"], r["type"])
+                for r in self.conn.execute("SELECT src_id, rel_type, dst_id FROM relations"):
+                    graph.add_relation(r["src_id"], r["rel_type"], r["dst_id"])
+                self._graph = graph
+            return self._graph
+
+    def _graph_entity(self, entity_id: int, name: str, type_: str):
+        with self._lock:
+            self.version += 1
+            if self._graph is not None:
+                self._graph.add_entity(entity_id, name, type_)
+
+    def _entity_id(self, entity) -> Optional[int]:
+        """Δέχεται id ή όνομα οντότητας."""
+        if isinstance(entity, int):
+            return entity
+        return self.graph.ids.get(entity)
+
+    def neighbors(self, entity, rel_type: Optional[str] = None, direction: str = OUT) -> List[int]:
+        """Τα ids των γειτόνων (direction: "out", "in" ή "both")."""
+        entity_id = self._entity_id(entity)
+        if entity_id is None:
+            return []
+        with self._lock:
+            return sorted(self.graph.neighbors(entity_id, rel_type, direction))
+
+    def traverse(self, start, max_depth: int = 2, rel_types=None, direction: str = OUT) -> Dict[int, int]:
+        """BFS: {entity_id: απόσταση} έως max_depth βήματα από την αρχή."""
+        start_id = self._entity_id(start)
+        if start_id is None:
+            return {}
+        with self._lock:
+            return self.graph.bfs(start_id, max_depth, rel_types, direction)
+
+    def find_path(self, src, dst, rel_types=None, max_depth: int = 6,
+                  direction: str = OUT) -> Optional[List[Tuple[int, str, int]]]:
+        """Η συντομότερη διαδρομή από src σε dst ως [(src_id, rel_type, dst_id)], ή None."""
+        src_id, dst_id = self._entity_id(src), self._entity_id(dst)
+        if src_id is None or dst_id is None:
+            return None
+        with self._lock:
+            return self.graph.shortest_path(src_id, dst_id, rel_types, max_depth, direction)
+
+    # ------------- Ερωτήματα μοτίβων -------------
+    def _resolve_name(self, name: str) -> Optional[int]:
+        if self._graph is not None:
+            return self._graph.ids.get(name)
+        rows = self._read("SELECT id FROM entities WHERE name=?", (name,))
+        return int(rows[0]["id"]) if rows else None
+
+    def plan_query(self, hops) -> str:
+        """Η στρατηγική που θα διάλεγε το match ("memory" ή "sql")."""
+        hops = [world_query.normalize_hop(h, self._resolve_name) for h in hops]
+        edge_count = self._read("SELECT coalesce(max(rowid), 0) FROM relations")[0][0]
+        return world_query.plan(hops, self._graph is not None, edge_count)
+
+    def match(self, start, hops, limit: int = 1000, strategy: Optional[str] = None,
+              select: Optional[int] = None) -> List[Any]:
+        """
+        Διαδρομές που ξεκινούν από `start` και ακολουθούν τα βήματα `hops`
+        (βλ. world_query). Π.χ. ό,τι αρέσει στον Angelos και βρίσκεται στην Αθήνα:
+            match("Angelos", ["likes", {"rel": "located_in", "to": "Αθήνα"}], select=1)
+        select=i επιστρέφει μόνο τα (μοναδικά) ids στη θέση i κάθε διαδρομής.
+        Τα αποτελέσματα κρατιούνται σε cache μέχρι την επόμενη αλλαγή του γράφου.
+        """
+        start_id = start if isinstance(start, int) else self._resolve_name(start)
+        if start_id is None:
+            return []
+        hops = [world_query.normalize_hop(h, self._resolve_name) for h in hops]
+        key = world_query.cache_key(start_id, hops, limit)
+
+        with self._lock:
+            cached = self._query_cache.get(key)
+            if cached is not None and cached[0] == self.version:
+                self._query_cache.move_to_end(key)
+                paths = cached[1]
+            else:
+                version = self.version
+                strategy = strategy or self.plan_query(hops)
+                if strategy == world_query.MEMORY:
+                    paths = world_query.match_memory(self.graph, start_id, hops, limit)
+                else:
+                    sql, params = world_query.build_sql(start_id, hops, limit)
+                    paths = [tuple(r) for r in self.conn.execute(sql, params).fetchall()]
+                self._query_cache[key] = (version, paths)
+                self._query_cache.move_to_end(key)
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+
+        if select is None:
+            return list(paths)
+        return sorted({p[select] for p in paths})
 
     # ------------- States -------------
+    def _load_states(self) -> Dict[str, Tuple[str, str]]:
+        # Καλείται με το _state_lock
+        if self._states is None:
+            self._states = {r["key"]: (r["value"], r["updated_at"])
+                            for r in self._read("SELECT key, value, updated_at FROM states")}
+            self._states.update((k, (v, ts)) for k, (v, ts, _) in self._dirty_states.items())
+        return self._states
+
     def set_state(self, key: str, value: str):
-        cur = self.conn.cursor()
         now = datetime.utcnow().isoformat()
-        cur.execute("INSERT INTO states(key, value, updated_at) VALUES(?,?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at", (key, value, now))
-        self.conn.commit()
+        with self._state_lock:
+            self._load_states()[key] = (value, now)
+            change = self._change(STATE, key, None, value, now)
+            # Log και ειδοποίηση συνδρομητών γίνονται με το flush, όταν η τιμή γραφτεί
+            self._dirty_states[key] = (value, now, change)
+            if self.state_flush_interval > 0:
+                if self._state_job is None:
+                    self._state_job = PeriodicJob("WorldStateFlusher", self._flush_job, self.state_flush_interval)
+                self._state_job.start()
+                return
+        self.flush_states()
 
     def get_state(self, key: str) -> Optional[str]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT value FROM states WHERE key=?", (key,))
-        row = cur.fetchone()
-        return row["value"] if row else None
+        with self._state_lock:
+            entry = self._load_states().get(key)
+        return entry[0] if entry else None
+
+    def _flush_job(self):
+        # Αν άλλο νήμα έχει ανοιχτό transaction, το flush περιμένει τον επόμενο κύκλο
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self.flush_states()
+        finally:
+            self._lock.release()
+
+    def flush_states(self) -> int:
+        """Γράφει τα αλλαγμένα states σε ένα executemany· επιστρέφει πόσα γράφτηκαν."""
+        # Σειρά κλειδωμάτων: πρώτα _lock (σύνδεση εγγραφής), μετά _state_lock (cache)
+        with self._lock:
+            with self._state_lock:
+                if not self._dirty_states:
+                    return 0
+                dirty, self._dirty_states = self._dirty_states, {}
+            # Savepoint: τα states και το log τους γράφονται μαζί ή καθόλου (και μέσα σε transaction).
+            # Το BEGIN πρώτα, αλλιώς το RELEASE του εξωτερικότερου savepoint θα έκανε commit.
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self.conn.execute("SAVEPOINT flush_states")
+            try:
+                self.conn.executemany(
+                    "INSERT INTO states(key, value, updated_at) VALUES(?,?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at",
+                    [(k, v, ts) for k, (v, ts, _) in dirty.items()],
+                )
+                changes = [change for _, _, change in dirty.values()]
+                self._log_changes(changes)
+                self.conn.execute("RELEASE flush_states")
+                self._commit()
+            except Exception:
+                self.conn.execute("ROLLBACK TO flush_states")
+                self.conn.execute("RELEASE flush_states")
+                self._commit()
+                # Ξαναμπαίνουν στην ουρά (χωρίς να πατήσουν νεότερες τιμές) για τον επόμενο κύκλο
+                with self._state_lock:
+                    for k, entry in dirty.items():
+                        self._dirty_states.setdefault(k, entry)
+                raise
+            # Μέσα σε transaction η δημοσίευση περιμένει το commit του (βλ. _publish)
+            self._publish(changes)
+            return len(dirty)
 
     def snapshot(self) -> Dict[str, Any]:
         return {
@@ -125,13 +547,19 @@ class WorldModel:
         }
 
     def _all_states(self) -> List[Dict[str, Any]]:
-        cur = self.conn.cursor
-        cur = self.conn.cursor()
-        cur.execute("SELECT * FROM states")
-        return [dict(r) for r in cur.fetchall()]
+        self.flush_states()
+        return [dict(r) for r in self._read("SELECT * FROM states")]
 
     def close(self):
+        if self._state_job is not None:
+            self._state_job.stop()
+        self.feed.close()
         try:
-            self.conn.close()
+            self.flush_states()
         except Exception:
             pass
+        for conn in (self._reader, self.conn):
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+core/reasoning/world_query.py
+-----------------------------
+Ερωτήματα μοτίβων/διαδρομών πάνω στον γράφο του WorldModel.
+
+Ένα μοτίβο είναι αφετηρία + αλυσίδα βημάτων (hops). Κάθε βήμα:
+    "likes"                                           → μία ακμή likes προς τα έξω
+    {"rel": "located_in", "to": "Αθήνα"}              → …που καταλήγει στην Αθήνα
+    {"rel": "part_of", "max_hops": 3, "type": "place"} → 1..3 ακμές part_of, κόμβος τύπου place
+    {"rel": None, "direction": "both"}                → οποιαδήποτε ακμή, προς όποια κατεύθυνση
+Αποτέλεσμα: οι διαδρομές (αφετηρία, κόμβος βήματος 1, …) που ταιριάζουν.
+
+Δύο στρατηγικές με την ίδια σημασιολογία:
+- "memory": επέκταση επιπέδων στο WorldGraph
+- "sql": ένα ερώτημα WITH RECURSIVE (JOIN ανά βήμα, αναδρομή για μεταβλητό μήκος)
+"""
+
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+from core.reasoning.world_graph import WorldGraph, OUT, IN, BOTH
+
+# (rel_type, direction, type_, to_id, min_hops, max_hops)
+Hop = Tuple[Optional[str], str, Optional[str], Optional[int], int, int]
+Path = Tuple[int, ...]
+
+MEMORY = "memory"
+SQL = "sql"
+
+
+def normalize_hop(hop: Any, resolve=None) -> Hop:
+    """Μετατρέπει str/dict σε κανονική πλειάδα (hashable, κατάλληλη για κλειδί cache)."""
+    if isinstance(hop, str) or hop is None:
+        return (hop, OUT, None, None, 1, 1)
+    if isinstance(hop, tuple):
+        return hop
+    direction = hop.get("direction", OUT)
+    if direction not in (OUT, IN, BOTH):
+        raise ValueError(f"Άγνωστη κατεύθυνση: {direction}")
+    to = hop.get("to")
+    if to is not None and not isinstance(to, int):
+        to = resolve(to) if resolve else None
+        if to is None:
+            to = -1                 # άγνωστη οντότητα: το βήμα δεν ταιριάζει με τίποτα
+    min_hops = int(hop.get("min_hops", 1))
+    max_hops = int(hop.get("max_hops", min_hops))
+    if min_hops < 1 or max_hops < min_hops:
+        raise ValueError(f"Μη έγκυρο εύρος βημάτων: {min_hops}..{max_hops}")
+    return (hop.get("rel"), direction, hop.get("type"), to, min_hops, max_hops)
+
+
+# ------------- Στρατηγική: μνήμη -------------
+def match_memory(graph: WorldGraph, start: int, hops: Sequence[Hop], limit: int) -> List[Path]:
+    paths: Set[Path] = {(start,)} if start in graph.names else set()
+    for rel, direction, type_, to, lo, hi in hops:
+        next_paths: Set[Path] = set()
+        for path in paths:
+            level = {path[-1]}
+            reached: Set[int] = set()
+            for depth in range(1, hi + 1):
+                level = {n for node in level for n in graph.neighbors(node, rel, direction)}
+                if depth >= lo:
+                    reached |= level
+                if not level:
+                    break
+            for node in reached:
+                if to is not None and node != to:
+                    continue
+                if type_ is not None and graph.types.get(node) != type_:
+                    continue
+                next_paths.add(path + (node,))
+        paths = next_paths
+        if not paths:
+            break
+    return sorted(paths)[:limit]
+
+
+# ------------- Στρατηγική: SQL -------------
+_EDGES = {
+    OUT: "(SELECT src_id AS a, rel_type AS rel, dst_id AS b FROM relations)",
+    IN: "(SELECT dst_id AS a, rel_type AS rel, src_id AS b FROM relations)",
+    BOTH: "(SELECT src_id AS a, rel_type AS rel, dst_id AS b FROM relations "
+          "UNION ALL SELECT dst_id, rel_type, src_id FROM relations)",
+}
+
+
+def build_sql(start: int, hops: Sequence[Hop], limit: int) -> Tuple[str, List[Any]]:
+    """Ένα WITH RECURSIVE ερώτημα: CTE h<i>(p0..p<i>) για κάθε βήμα."""
+    ctes: List[Tuple[str, List[Any]]] = [("h0(p0) AS (SELECT ?)", [start])]
+    cols = ["p0"]
+    for i, (rel, direction, type_, to, lo, hi) in enumerate(hops, 1):
+        prev, edges = f"h{i - 1}", _EDGES[direction]
+        rel_sql, rel_params = ("AND e.rel = ?", [rel]) if rel is not None else ("", [])
+        if lo == hi == 1:
+            new = "e.b"
+            body = (f"SELECT {', '.join('p.' + c for c in cols)}, e.b FROM {prev} AS p "
+                    f"JOIN {edges} AS e ON e.a = p.{cols[-1]} {rel_sql} WHERE 1=1")
+            params = list(rel_params)
+        else:
+            walk = f"w{i}"
+            ctes.append((
+                f"{walk}({', '.join(cols)}, node, depth) AS ("
+                f"SELECT {', '.join(cols)}, {cols[-1]}, 0 FROM {prev} "
+                f"UNION SELECT {', '.join('w.' + c for c in cols)}, e.b, w.depth + 1 FROM {walk} AS w "
+                f"JOIN {edges} AS e ON e.a = w.node {rel_sql} WHERE w.depth < ?)",
+                rel_params + [hi],
+            ))
+            new = "node"
+            body = f"SELECT {', '.join(cols)}, node FROM {walk} WHERE depth >= ?"
+            params = [lo]
+        if to is not None:
+            body += f" AND {new} = ?"
+            params.append(to)
+        if type_ is not None:
+            body += f" AND {new} IN (SELECT id FROM entities WHERE type = ?)"
+            params.append(type_)
+        cols.append(f"p{i}")
+        ctes.append((f"h{i}({', '.join(cols)}) AS ({body})", params))
+
+    sql = (f"WITH RECURSIVE {', '.join(c for c, _ in ctes)} "
+           f"SELECT DISTINCT {', '.join(cols)} FROM h{len(hops)} ORDER BY {', '.join(cols)} LIMIT ?")
+    params = [p for _, ps in ctes for p in ps] + [limit]
+    return sql, params
+
+
+# ------------- Planner -------------
+def plan(hops: Sequence[Hop], graph_loaded: bool, edge_count: int, sql_max_edges: int = 50_000) -> str:
+    """
+    Φορτωμένος γράφος → πάντα μνήμη. Αλλιώς SQL όταν το μοτίβο είναι φθηνό
+    με indexes (έως 2 σταθερά βήματα προς μία κατεύθυνση) ή ο γράφος είναι
+    τόσο μεγάλος που δεν αξίζει να φορτωθεί για ένα ερώτημα.
+    """
+    if graph_loaded:
+        return MEMORY
+    simple = len(hops) <= 2 and all(h[4] == h[5] == 1 and h[1] != BOTH for h in hops)
+    return SQL if simple or edge_count > sql_max_edges else MEMORY
+
+
+def cache_key(start: int, hops: Sequence[Hop], limit: int) -> Tuple:
+    return (start, tuple(hops), limit)
+
@@ -1,17 +1,20 @@
 import time
 
+from core.utils.history_buffer import HistoryBuffer
+
 class ContextManager:
     def __init__(self, max_history: int = 20):
         self.max_history = max_history
-        self.history = []
+        self.history = HistoryBuffer(max_history, key=lambda h: h["text"])
 
     def add(self, role: str, text: str):
         self.history.append({"role": role, "text": text, "ts": time.time()})
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
 
     def get_history(self):
-        return list(self.history)
+        return self.history.to_list()
+
+    def find_recent(self, keyword: str):
+        return self.history.find_recent(keyword)
 
     def clear(self):
-        self.history = []
+        self.history.clear()
@@ -1,6 +1,8 @@
 # core/entity_extractor.py
 import re
 
+from core.utils.intent_lexicon import LEXICON, scan
+
 
 class EntityExtractor:
     """
@@ -9,27 +11,18 @@ class EntityExtractor:
     """
 
     def __init__(self):
-        # Προκαθορισμένες οντότητες για apps, websites και κατηγορίες
-        self.known_entities = {
-            "apps": [
-                "youtube", "spotify", "chrome", "browser", "vlc", "word",
-                "excel", "notepad", "explorer", "photoshop", "obs"
-            ],
-            "actions": [
-                "άνοιξε", "κλείσε", "τερμάτισε", "παίξε", "βάλε", "σταμάτα", "γράψε"
-            ],
-            "media": ["μουσική", "τραγούδι", "ταινία", "βίντεο"]
-        }
+        # Προκαθορισμένες οντότητες για apps, websites και κατηγορίες (από το κοινό λεξικό)
+        self.known_entities = {category: list(LEXICON[category]) for category in ("apps", "actions", "media")}
 
     def extract(self, text: str):
         text = text.lower().strip()
 
         entities = {"apps": [], "actions": [], "media": [], "other": []}
 
-        for category, items in self.known_entities.items():
-            for item in items:
-                if item in text:
-                    entities[category].append(item)
+        # Μία σάρωση για όλες τις κατηγορίες
+        s = scan(text)
+        for category in self.known_entities:
+            entities[category].extend(s.keywords(category))
 
         # Αν δεν βρεθεί τίποτα, προσπαθεί να πιάσει τίτλους τραγουδιών
         match = re.search(r"(παίξε|βάλε)\s+(.*)", text)
@@ -0,0 +1,84 @@
+# core/utils/history_buffer.py
+"""Κυκλικό buffer ιστορικού σταθερής χωρητικότητας με ευρετήριο λέξεων-κλειδιών."""
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class HistoryBuffer:
+    """
+    Ring buffer: O(1) append και αποβολή του παλαιότερου στοιχείου.
+    Αν δοθεί key(item) -> str, κρατά το κείμενο αναζήτησης ήδη σε πεζά και
+    ένα ευρετήριο λέξη → πιο πρόσφατη εγγραφή για το find_recent.
+    """
+
+    __slots__ = ("capacity", "_key", "_items", "_keys", "_seq", "_tokens")
+
+    def __init__(self, capacity: int, key: Optional[Callable[[Any], str]] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._key = key
+        self._items: List[Any] = [None] * capacity
+        self._keys: List[str] = [""] * capacity
+        self._seq = 0                       # πλήθος στοιχείων που μπήκαν ποτέ
+        self._tokens: Dict[str, int] = {}   # λέξη → seq της πιο πρόσφατης εγγραφής
+
+    # ------------- Εγγραφή -------------
+    def append(self, item: Any):
+        slot = self._seq % self.capacity
+        if self._seq >= self.capacity:
+            self._forget(self._seq - self.capacity, self._keys[slot])
+        self._items[slot] = item
+        if self._key is not None:
+            text = (self._key(item) or "").lower()
+            self._keys[slot] = text
+            for token in text.split():
+                self._tokens[token] = self._seq
+        self._seq += 1
+
+    def _forget(self, seq: int, text: str):
+        for token in text.split():
+            if self._tokens.get(token) == seq:
+                del self._tokens[token]
+
+    def clear(self):
+        self._items = [None] * self.capacity
+        self._keys = [""] * self.capacity
+        self._seq = 0
+        self._tokens.clear()
+
+    # ------------- Ανάγνωση -------------
+    def __len__(self) -> int:
+        return min(self._seq, self.capacity)
+
+    def __bool__(self) -> bool:
+        return self._seq > 0
+
+    def _seqs(self, newest_first: bool = False) -> range:
+        oldest = max(0, self._seq - self.capacity)
+        return range(self._seq - 1, oldest - 1, -1) if newest_first else range(oldest, self._seq)
+
+    def __iter__(self) -> Iterator[Any]:
+        for seq in self._seqs():
+            yield self._items[seq % self.capacity]
+
+    def __reversed__(self) -> Iterator[Any]:
+        for seq in self._seqs(newest_first=True):
+            yield self._items[seq % self.capacity]
+
+    def last(self) -> Optional[Any]:
+        return self._items[(self._seq - 1) % self.capacity] if self._seq else None
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def find_recent(self, keyword: str) -> Optional[Any]:
+        """Το πιο πρόσφατο στοιχείο που περιέχει το keyword (χωρίς διάκριση πεζών)."""
+        needle = (keyword or "").lower()
+        # Αν το keyword είναι ολόκληρη λέξη, αρκεί να ελεγχθούν μόνο οι νεότερες εγγραφές
+        known = self._tokens.get(needle)
+        for seq in self._seqs(newest_first=True):
+            if known is not None and seq <= known:
+                return self._items[known % self.capacity]
+            if needle in self._keys[seq % self.capacity]:
+                return self._items[seq % self.capacity]
+        return None
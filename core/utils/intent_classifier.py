@@ -1,52 +1,109 @@
 # core/intent_classifier.py
-import yaml
+import threading
 from pathlib import Path
-from core.cognitive_intent_learner import CognitiveIntentLearner
+from core.learning.cognitive_intent_learner import CognitiveIntentLearner
+from core.learning.adaptive_learner import shared_learner
+from core.learning.intent_model import IntentModel, collect_examples
+from core.learning.intent_registry import intent_registry
 from core.reasoning.reasoner import Reasoner
 
 
 class IntentClassifier:
     """Αναγνωρίζει ή μαθαίνει προθέσεις του χρήστη (intents)."""
 
-    def __init__(self, yaml_path="core/intents.yaml"):
+    def __init__(self, yaml_path="core/intents.yaml", min_confidence=0.5, learner=None):
         self.yaml_path = Path(yaml_path)
+        # Κοινό μητρώο intents (ένα parsed αντίγραφο ανά process, hot reload με mtime)
+        self.registry = intent_registry(self.yaml_path)
+        self.cognitive = CognitiveIntentLearner(self.yaml_path)
         self.reasoner = Reasoner()
-        self.intents = self._load_yaml()
+        # Ο ίδιος learner με τον ReasoningManager: ό,τι μαθαίνεται εκεί φτάνει στο μοντέλο
+        self.learner = learner or shared_learner()
+        self.min_confidence = min_confidence
+        # Το πρώτο μοντέλο εκπαιδεύεται εδώ· οι επόμενες εκδόσεις στο παρασκήνιο
+        version = self._data_version()
+        self.model = self._train(self.registry.snapshot().intents)
+        self._model_version = version
+        self._train_lock = threading.Lock()
+        self._training = False
+        self.last_train_error = None
         print(f"✅ [IntentClassifier] Φορτώθηκαν {len(self.intents)} προθέσεις από YAML.")
 
-    def _load_yaml(self):
-        if not self.yaml_path.exists():
-            return {}
-        with open(self.yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data if isinstance(data, dict) else {}
+    @property
+    def intents(self):
+        return self.registry.snapshot().intents
 
     def _save_yaml(self):
-        with open(self.yaml_path, "w", encoding="utf-8") as f:
-            yaml.dump(self.intents, f, allow_unicode=True)
+        self.registry.compact()
+
+    def _data_version(self):
+        """(έκδοση μητρώου, έκδοση learner): αλλάζει με κάθε νέο intent ή νέο παράδειγμα."""
+        return self.registry.snapshot().version, self.learner.version
+
+    def _train(self, intents):
+        """IntentModel από τα παραδείγματα του YAML και τη μνήμη του AdaptiveLearner."""
+        texts, labels = collect_examples(intents, self.learner.examples())
+        return IntentModel().fit(texts, labels) if texts else None
+
+    def _refresh_model(self):
+        """
+        Το τρέχον μοντέλο. Αν άλλαξε το μητρώο ή ο learner, ξεκινά επανεκπαίδευση
+        στο παρασκήνιο· ως τότε απαντά το προηγούμενο μοντέλο (το classify δεν περιμένει).
+        """
+        if self._data_version() != self._model_version:
+            with self._train_lock:
+                if not self._training:
+                    self._training = True
+                    threading.Thread(target=self._retrain, name="IntentModelTrainer", daemon=True).start()
+        return self.model
+
+    def _retrain(self):
+        """Εκπαιδεύει μέχρι να φτάσει την τρέχουσα έκδοση (αλλαγές κατά την εκπαίδευση ενώνονται)."""
+        try:
+            while True:
+                version = self._data_version()
+                if version == self._model_version:
+                    break
+                model = self._train(self.registry.snapshot().intents)
+                # Ατομική αντικατάσταση: οι αναγνώστες βλέπουν είτε το παλιό είτε το νέο μοντέλο
+                self.model = model
+                self._model_version = version
+        except Exception as e:
+            self.last_train_error = e
+        finally:
+            with self._train_lock:
+                self._training = False
+
+    def predict(self, texts):
+        """Batch: [(intent, confidence)] για κάθε φράση (χωρίς εκτέλεση)."""
+        model = self._refresh_model()
+        if model is None:
+            return [("unknown", 0.0) for _ in texts]
+        return model.predict([t.lower().strip() for t in texts])
 
     # -----------------------------------------------------------
     def classify(self, text: str):
         """Αναγνωρίζει ή μαθαίνει και εκτελεί αυτόματα το intent."""
         t = text.lower().strip()
 
-        # === 1️⃣ Έλεγχος γνωστής πρόθεσης ===
-        for intent, data in self.intents.items():
-            examples = data.get("examples", []) if isinstance(data, dict) else []
-            for ex in examples:
-                if ex in t:
-                    reasoned_response = self.reasoner.reason(t)
-                    return {
-                        "name": intent,
-                        "response": reasoned_response,
-                        "confidence": 0.95,
-                    }
+        # === 1️⃣ Έλεγχος γνωστής πρόθεσης (μοντέλο, ανεξάρτητο από το πλήθος των παραδειγμάτων) ===
+        model = self._refresh_model()
+        if model is not None:
+            intent, confidence = model.predict_one(t)
+            if confidence >= self.min_confidence:
+                reasoned_response = self.reasoner.reason(t)
+                return {
+                    "name": intent,
+                    "response": reasoned_response,
+                    "confidence": confidence,
+                }
 
         # === 2️⃣ Αν δεν υπάρχει, προσπάθησε να τη μάθεις ===
-        learner = CognitiveIntentLearner(self.yaml_path)
-        new_intent, message = learner.analyze_and_learn(t)
+        new_intent, message = self.cognitive.analyze_and_learn(t)
         if new_intent:
             print(f"🧩 [AutoLearn] {message}")
+            # Νέο intent στο μητρώο → νέα έκδοση → επανεκπαίδευση στο παρασκήνιο
+            self._refresh_model()
             reasoned_response = self.reasoner.reason(t)
             return {
                 "name": new_intent,
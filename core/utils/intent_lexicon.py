@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+core/utils/intent_lexicon.py
+----------------------------
+Κοινό λεξικό λέξεων-κλειδιών για intents και οντότητες.
+• Όλες οι ομάδες (ρήματα ενεργειών, χρόνος, μουσική, εφαρμογές κ.λπ.)
+  μεταγλωττίζονται ΜΙΑ φορά σε έναν MultiPatternMatcher.
+• scan(text) περνά το κείμενο μία φορά και επιστρέφει κάθε λέξη-κλειδί με το
+  span της, ομαδοποιημένες· το αποτέλεσμα κρατιέται σε LRU cache, οπότε
+  Reasoner, ReasonerAdvanced, SmartLogic και EntityExtractor μοιράζονται την
+  ίδια σάρωση για την ίδια φράση.
+Το ταίριασμα είναι υποσυμβολοσειράς (όπως το `w in text`), χωρίς τόνους/κεφαλαία·
+εξαίρεση οι STRICT_KEYWORDS, που χωρίς τόνους είναι κομμάτι άλλων λέξεων.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.utils.pattern_matcher import MultiPatternMatcher, normalize
+
+# (λέξη-κλειδί, αρχή, τέλος) στο κανονικοποιημένο κείμενο· στις ομάδες η λέξη
+# δίνεται όπως γράφτηκε στο λεξικό (με τόνους)
+Hit = Tuple[str, int, int]
+
+# Ομάδα → λέξεις-κλειδιά. Η σειρά μέσα σε κάθε ομάδα είναι σειρά προτίμησης.
+LEXICON: Dict[str, List[str]] = {
+    # Ενέργειες
+    "open": ["άνοιξε"],
+    "open_en": ["open "],
+    "start": ["ξεκίνα"],
+    "launch": ["εκκίνησε"],
+    "launch_en": ["open", "launch"],
+    "close": ["κλείσε"],
+    "close_en": ["close "],
+    "terminate": ["τερμάτισε"],
+    "stop": ["σταμάτα"],
+    "switch_off": ["σβήσε"],
+    "shutdown_en": ["shutdown"],
+    "play": ["παίξε", "βάλε"],
+    "pause": ["σταμάτησε", "παύση", "παύσε"],
+    "write": ["γράψε", "ντοκουμέντο", "κείμενο"],
+    "search": ["ψάξε", "βρες", "αναζήτησε", "τι είναι", "googl", "google"],
+    # Μουσική / μέσα
+    "music_stem": ["μουσ"],
+    "music": ["μουσική"],
+    "song": ["τραγούδι"],
+    "youtube": ["youtube"],
+    "web": ["browser", "διαδίκτυο"],
+    # Χρόνος
+    "time": ["ώρα"],
+    "date": ["ημερομηνία", "μέρα"],
+    "url": ["www.", "http"],
+    # Κοινωνικά / ταυτότητα
+    "greeting": ["γεια", "καλημέρα", "καλησπέρα"],
+    "assistant_name": ["πως σε λένε", "όνομά σου", "ποιο είναι το όνομά σου"],
+    "user_name": ["πως με λένε", "το όνομά μου", "ποιος είμαι"],
+    # Αντικείμενα ενεργειών
+    "computer": ["υπολογιστή"],
+    "everything": ["όλα", "ό,τι άνοιξες"],
+    # Οντότητες (EntityExtractor)
+    "apps": ["youtube", "browser", "chrome", "spotify", "vlc", "word",
+             "excel", "notepad", "explorer", "photoshop", "obs"],
+    "actions": ["άνοιξε", "κλείσε", "τερμάτισε", "παίξε", "βάλε", "σταμάτα", "γράψε"],
+    "media": ["μουσική", "τραγούδι", "ταινία", "βίντεο"],
+}
+
+
+# Χωρίς τόνους είναι κομμάτι άλλων λέξεων ("ωρα" ⊂ "ωραία", "μερα" ⊂ "σήμερα"):
+# ταιριάζουν μόνο αυτούσιες (με τόνους, όπως το `w in text`) ή ως ολόκληρη λέξη ("τι ωρα ειναι")
+STRICT_KEYWORDS = ("ώρα", "μέρα")
+
+
+def _whole_word(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+
+class LexiconScan:
+    """Το αποτέλεσμα μιας σάρωσης: όλα τα ταιριάσματα, ανά θέση και ανά ομάδα."""
+
+    __slots__ = ("text", "hits", "_groups")
+
+    def __init__(self, text: str, hits: Tuple[Hit, ...], groups: Dict[str, Tuple[Hit, ...]]):
+        self.text = text
+        self.hits = hits
+        self._groups = groups
+
+    def has(self, *groups: str) -> bool:
+        """True αν ταιριάζει οποιαδήποτε από τις ομάδες."""
+        return any(g in self._groups for g in groups)
+
+    def spans(self, group: str) -> Tuple[Hit, ...]:
+        return self._groups.get(group, ())
+
+    def keywords(self, group: str) -> List[str]:
+        """Οι λέξεις της ομάδας που βρέθηκαν, με τη σειρά του λεξικού."""
+        return list(dict.fromkeys(k for k, _, _ in self._groups.get(group, ())))
+
+    def first(self, group: str) -> Optional[str]:
+        found = self.keywords(group)
+        return found[0] if found else None
+
+    def groups(self) -> List[str]:
+        return list(self._groups)
+
+    def __repr__(self):
+        return f"LexiconScan({self.text!r}, groups={self.groups()})"
+
+
+class IntentLexicon:
+    """Μεταγλωττισμένο λεξικό: ένα πέρασμα ανά φράση, αποτελέσματα σε LRU cache."""
+
+    def __init__(self, groups: Dict[str, Sequence[str]], cache_size: int = 256,
+                 strict: Sequence[str] = STRICT_KEYWORDS):
+        self._strict = {normalize(w): w.lower() for w in strict}
+        self._by_keyword: Dict[str, List[Tuple[int, str, str]]] = {}
+        for group, words in groups.items():
+            for rank, word in enumerate(words):
+                self._by_keyword.setdefault(normalize(word), []).append((rank, group, word))
+        self.matcher = MultiPatternMatcher(self._by_keyword)
+        self._scan_cached = lru_cache(maxsize=cache_size)(self._scan)
+
+    def scan(self, text: str) -> LexiconScan:
+        # Η cache κρατά τους τόνους: τους χρειάζονται οι STRICT_KEYWORDS
+        return self._scan_cached((text or "").strip().lower())
+
+    def _accept(self, text: str, folded: str, keyword: str, start: int, end: int) -> bool:
+        accented = self._strict.get(keyword)
+        return accented is None or text[start:end] == accented or _whole_word(folded, start, end)
+
+    def _scan(self, text: str) -> LexiconScan:
+        folded = normalize(text)    # ίδιο μήκος με το text (ένας χαρακτήρας ανά χαρακτήρα)
+        hits = tuple(sorted((h for h in self.matcher.finditer(folded) if self._accept(text, folded, *h)),
+                            key=lambda h: (h[1], -h[2])))
+        ranked: Dict[str, List[Tuple[int, Hit]]] = {}
+        for keyword, start, end in hits:
+            for rank, group, word in self._by_keyword[keyword]:
+                ranked.setdefault(group, []).append((rank, (word, start, end)))
+        groups = {g: tuple(h for _, h in sorted(items, key=lambda x: (x[0], x[1][1])))
+                  for g, items in ranked.items()}
+        return LexiconScan(folded, hits, groups)
+
+    def cache_info(self):
+        return self._scan_cached.cache_info()
+
+
+# ------------- Κοινόχρηστο λεξικό -------------
+_default: Optional[IntentLexicon] = None
+_default_lock = threading.Lock()
+
+
+def default_lexicon() -> IntentLexicon:
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = IntentLexicon(LEXICON)
+    return _default
+
+
+def scan(text: str) -> LexiconScan:
+    """Σαρώνει τη φράση με το κοινό λεξικό (μία φορά ανά φράση χάρη στην cache)."""
+    return default_lexicon().scan(text)
@@ -0,0 +1,68 @@
+# core/utils/pattern_matcher.py
+"""
+Ταίριασμα πολλών λέξεων-κλειδιών σε ένα πέρασμα.
+
+Όλα τα μοτίβα συμπιέζονται σε ένα trie και μεταγλωττίζονται σε ΕΝΑ regex
+(lookahead σε κάθε θέση, μακρύτερο ταίριασμα πρώτο). Τα μοτίβα που είναι
+προθέματα του μακρύτερου ταιριάσματος προστίθενται από πίνακα, οπότε
+βρίσκονται ΟΛΕΣ οι εμφανίσεις όλων των μοτίβων — όπως με Aho-Corasick —
+με κόστος ανά θέση ανάλογο του βάθους του trie, όχι του πλήθους των μοτίβων.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from core.utils.text_tools import fold_accents
+
+
+def normalize(text: str) -> str:
+    """Πεζά και χωρίς τόνους — η ίδια μορφή για μοτίβα και κείμενο."""
+    return fold_accents(text).lower()
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # Κόμβος που τελειώνει λέξη: το υπόλοιπο είναι προαιρετικό (greedy → μακρύτερο)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class MultiPatternMatcher:
+    """Βρίσκει όλες τις εμφανίσεις ενός συνόλου λέξεων/φράσεων σε ένα πέρασμα."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(dict.fromkeys(normalize(p) for p in patterns if p))
+        known = set(self.patterns)
+        # Για κάθε μοτίβο: τα μοτίβα που είναι προθέματά του (μαζί με το ίδιο)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            p: tuple(p[:i] for i in range(len(p), 0, -1) if p[:i] in known) for p in self.patterns
+        }
+        self._regex = re.compile(f"(?=({_trie_regex(self.patterns)}))") if self.patterns else None
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Δίνει (μοτίβο, αρχή, τέλος) για κάθε εμφάνιση, με σειρά θέσης."""
+        if self._regex is None or not text:
+            return
+        for m in self._regex.finditer(normalize(text)):
+            longest = m.group(1)
+            if not longest:
+                continue
+            start = m.start(1)
+            for pattern in self._prefixes[longest]:
+                yield pattern, start, start + len(pattern)
+
+    def matches(self, text: str) -> Set[str]:
+        """Το σύνολο των μοτίβων που εμφανίζονται στο κείμενο."""
+        return {pattern for pattern, _, _ in self.finditer(text)}
@@ -5,3 +5,7 @@ class PromptBuilder:
     def build(self, user_text: str, intent, history):
         history_text = "\n".join([f"{h['role']}: {h['text']}" for h in history[-10:]])
         return f"{self.system_instruction}\n\nConversation history:\n{history_text}\n\nUser: {user_text}\nIntent: {intent}\nResponse:"
+
+    def build_from_memory(self, user_text: str, intent, conversation, turns: int = 10):
+        """Σαν το build, με ιστορικό από ConversationMemory (cache, χωρίς βάση)."""
+        return self.build(user_text, intent, conversation.history(turns))
@@ -1,6 +1,7 @@
 # core/smart_logic.py
 import re
 from core.action_executor import ActionExecutor
+from core.utils.intent_lexicon import scan
 
 
 class SmartLogic:
@@ -12,28 +13,29 @@ class SmartLogic:
 
     def interpret(self, text: str):
         text = text.lower().strip()
+        s = scan(text)
 
         # === 1️⃣ Γενικές λογικές κατηγορίες ===
-        if any(w in text for w in ["άνοιξε", "ξεκίνα", "εκκίνησε"]):
+        if s.has("open", "start", "launch"):
             app = self._extract_app_name(text)
             if not app:
-                if "μουσική" in text or "τραγούδι" in text:
+                if s.has("music", "song"):
                     return self.executor.play_music("")
-                if "browser" in text or "διαδίκτυο" in text:
+                if s.has("web"):
                     return self.executor.open_app("browser")
                 return "Τι θέλεις να ανοίξω;"
 
             self.last_action = ("open", app)
             return self.executor.open_app(app)
 
-        elif any(w in text for w in ["κλείσε", "τερμάτισε", "σταμάτα"]):
-            if "όλα" in text or "ό,τι άνοιξες" in text:
+        elif s.has("close", "terminate", "stop"):
+            if s.has("everything"):
                 if self.last_action:
                     kind, app = self.last_action
                     if kind == "open":
                         return self.executor.close_app(app)
                 return "Δεν θυμάμαι να έχω κάτι ανοιχτό."
-            elif "μουσική" in text or "youtube" in text:
+            elif s.has("music", "youtube"):
                 return self.executor.close_youtube()
 
             app = self._extract_app_name(text)
@@ -41,19 +43,19 @@ class SmartLogic:
                 return self.executor.close_app(app)
             return "Δεν κατάλαβα τι να κλείσω."
 
-        elif any(w in text for w in ["παίξε", "βάλε"]):
+        elif s.has("play"):
             query = self._extract_music_query(text)
             self.last_action = ("music", query)
             return self.executor.play_music(query)
 
-        elif any(w in text for w in ["σταμάτησε", "παύση", "παύσε"]):
+        elif s.has("pause"):
             return self.executor.close_youtube()
 
-        elif any(w in text for w in ["γράψε", "ντοκουμέντο", "κείμενο"]):
+        elif s.has("write"):
             self.last_action = ("open", "word")
             return self.executor.open_app("word")
 
-        elif "υπολογιστή" in text and any(w in text for w in ["κλείσε", "τερμάτισε", "σβήσε"]):
+        elif s.has("computer") and s.has("close", "terminate", "switch_off"):
             return self.executor.shutdown()
 
         # === 2️⃣ Αν δεν ξέρει, απαντά φυσικά ===
@@ -61,14 +63,8 @@ class SmartLogic:
 
     # === Εξαγωγή ονόματος εφαρμογής ===
     def _extract_app_name(self, text: str):
-        apps = [
-            "youtube", "browser", "chrome", "spotify", "vlc",
-            "word", "excel", "notepad", "explorer", "photoshop", "obs"
-        ]
-        for app in apps:
-            if app in text:
-                return app
-        return None
+        # Η πρώτη εφαρμογή με τη σειρά του λεξικού (η σάρωση είναι ήδη στην cache)
+        return scan(text).first("apps")
 
     # === Εξαγωγή τίτλου τραγουδιού ===
     def _extract_music_query(self, text: str):
@@ -1,2 +1,31 @@
+# core/utils/text_tools.py
+"""Βοηθητικά κειμένου: κανονικοποίηση ελληνικών (τόνοι/διαλυτικά) για αναζήτηση."""
+
+# Τονισμένα/διαλυτικά ελληνικά → άτονα (πεζά και κεφαλαία)
+GREEK_ACCENTS = {
+    "ά": "α", "έ": "ε", "ή": "η", "ί": "ι", "ό": "ο", "ύ": "υ", "ώ": "ω",
+    "ϊ": "ι", "ϋ": "υ", "ΐ": "ι", "ΰ": "υ",
+    "Ά": "Α", "Έ": "Ε", "Ή": "Η", "Ί": "Ι", "Ό": "Ο", "Ύ": "Υ", "Ώ": "Ω",
+    "Ϊ": "Ι", "Ϋ": "Υ",
+}
+_ACCENT_TABLE = str.maketrans(GREEK_ACCENTS)
+
+
+def fold_accents(text: str) -> str:
+    """Αφαιρεί τόνους/διαλυτικά από ελληνικό κείμενο ("μουσική" → "μουσικη")."""
+    return (text or "").translate(_ACCENT_TABLE)
+
+
+def fold_accents_sql(expr: str) -> str:
+    """
+    Η ίδια κανονικοποίηση ως έκφραση SQL (εμφωλευμένα replace()), ώστε
+    triggers να τη χρησιμοποιούν χωρίς Python συναρτήσεις στη σύνδεση.
+    """
+    sql = f"coalesce({expr}, '')"
+    for accented, plain in GREEK_ACCENTS.items():
+        sql = f"replace({sql}, '{accented}', '{plain}')"
+    return sql
+
+
 class TextTools:
     pass
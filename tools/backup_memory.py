@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+tools/backup_memory.py
+----------------------
+Backup / εξαγωγή / επαναφορά της μνήμης της Ζένιας από τη γραμμή εντολών.
+• backup  : online αντίγραφα των βάσεων (memory_system, memory, zenia_memory, world_model)
+• export  : episodic μνήμη σε συμπιεσμένα .npz chunks (στηλοθετημένα)
+• restore : μαζική φόρτωση των .npz chunks πίσω στη βάση
+
+Χρήση:
+    python tools/backup_memory.py backup [--dest DIR]
+    python tools/backup_memory.py export OUT_DIR [--db PATH] [--chunk 100000]
+    python tools/backup_memory.py restore SRC_DIR [--db PATH] [--replace]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.memory import memory_backup
+from core.memory.storage_catalog import store_path
+
+DEFAULT_DB = store_path("memory_system")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backup μνήμης Ζένιας")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_backup = sub.add_parser("backup", help="Online backup όλων των βάσεων")
+    p_backup.add_argument("--dest", default=None)
+
+    p_export = sub.add_parser("export", help="Episodic μνήμη σε .npz chunks")
+    p_export.add_argument("out_dir")
+    p_export.add_argument("--db", default=DEFAULT_DB)
+    p_export.add_argument("--chunk", type=int, default=100_000)
+
+    p_restore = sub.add_parser("restore", help="Μαζική επαναφορά από .npz chunks")
+    p_restore.add_argument("src_dir")
+    p_restore.add_argument("--db", default=DEFAULT_DB)
+    p_restore.add_argument("--replace", action="store_true")
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+
+    if args.command == "backup":
+        for src, dest in memory_backup.backup_all(args.dest).items():
+            print(f"✅ {src} → {dest}")
+    elif args.command == "export":
+        manifest = memory_backup.export_episodic_npz(args.db, args.out_dir, args.chunk)
+        print(f"✅ {manifest['rows']} γεγονότα σε {len(manifest['chunks'])} chunks → {args.out_dir}")
+    elif args.command == "restore":
+        rows = memory_backup.restore_episodic_npz(args.src_dir, db_path=args.db, replace=args.replace)
+        print(f"✅ {rows} γεγονότα φορτώθηκαν στο {args.db}")
+
+    print(f"⏱️ {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+tools/benchmark_intents.py
+--------------------------
+Μετρήσεις απόδοσης για την αναγνώριση προθέσεων με συνθετικά intents.
+• substring: ο παλιός έλεγχος `ex in t` σε όλα τα παραδείγματα (IntentClassifier)
+• IntentModel: χρόνος εκπαίδευσης, ms/φράση (μία-μία και σε batch), ακρίβεια
+  σε φράσεις με ορθογραφικά λάθη που δεν υπάρχουν αυτούσιες στα παραδείγματα
+
+Χρήση:
+    python tools/benchmark_intents.py [--intents 3000] [--examples 5] [--queries 2000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.learning.intent_model import IntentModel
+
+LETTERS = "αβγδεζηθικλμνξοπρστυφχψω"
+VERBS = ["άνοιξε το", "κλείσε το", "παίξε", "βάλε", "δείξε μου", "ψάξε για", "τι είναι"]
+
+
+def synthetic_intents(n_intents: int, n_examples: int, n_queries: int, seed: int = 0):
+    """Κάθε intent: ένα ρήμα + δύο λέξεις-κλειδιά· ερωτήματα με ένα τυπογραφικό λάθος."""
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 8))) for _ in range(20000)]
+
+    def typo(word):
+        i = rng.randrange(len(word))
+        return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+
+    intents, texts, labels = {}, [], []
+    for i in range(n_intents):
+        verb, kw1, kw2 = rng.choice(VERBS), *rng.sample(vocab, 2)
+        intents[f"intent_{i}"] = (verb, kw1, kw2)
+        for _ in range(n_examples):
+            texts.append(f"{verb} {kw1} {rng.choice(vocab)} {kw2}")
+            labels.append(f"intent_{i}")
+    queries = []
+    for _ in range(n_queries):
+        name = rng.choice(list(intents))
+        verb, kw1, kw2 = intents[name]
+        queries.append((f"{verb} {typo(kw1)} {kw2}", name))
+    return texts, labels, queries
+
+
+def bench_substring(texts, labels, queries) -> float:
+    """ms/φράση για τον γραμμικό έλεγχο `ex in t` (όπως το παλιό classify)."""
+    examples = list(zip(texts, labels))
+    start = time.perf_counter()
+    for q, _ in queries:
+        next((label for ex, label in examples if ex in q), None)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark αναγνώρισης προθέσεων")
+    parser.add_argument("--intents", type=int, default=3000)
+    parser.add_argument("--examples", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    texts, labels, queries = synthetic_intents(args.intents, args.examples, args.queries)
+    print(f"📊 {args.intents} intents × {args.examples} παραδείγματα, {len(queries)} ερωτήματα")
+
+    print(f"🔎 substring (ex in t): {bench_substring(texts, labels, queries[:200]):.3f} ms/φράση")
+
+    start = time.perf_counter()
+    model = IntentModel().fit(texts, labels)
+    print(f"🧠 IntentModel εκπαίδευση: {time.perf_counter() - start:.2f}s")
+
+    model.predict_one(queries[0][0])        # ζέσταμα
+    start = time.perf_counter()
+    for q, _ in queries:
+        model.predict_one(q)
+    single = (time.perf_counter() - start) / len(queries) * 1000
+
+    start = time.perf_counter()
+    predictions = model.predict([q for q, _ in queries])
+    batch = (time.perf_counter() - start) / len(queries) * 1000
+
+    accuracy = sum(p == name for (p, _), (_, name) in zip(predictions, queries)) / len(queries)
+    confidence = sum(c for _, c in predictions) / len(predictions)
+    print(f"⚡ predict_one: {single:.3f} ms/φράση | predict(batch): {batch:.3f} ms/φράση")
+    print(f"🎯 ακρίβεια: {accuracy:.1%} | μέση confidence: {confidence:.2f}")
+
+
+if __name__ == "__main__":
+    main()
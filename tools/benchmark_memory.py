@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+tools/benchmark_memory.py
+-------------------------
+Μετρήσεις απόδοσης για τη μνήμη της Ζένιας (σε προσωρινή βάση, όχι στο data/).
+• store_event: events/sec με commit ανά γεγονός vs write-behind batching
+• VectorStore.search: ms/ερώτημα με brute-force και με IVF ευρετήριο
+
+Χρήση:
+    python tools/benchmark_memory.py [--events 5000] [--vectors 100000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.memory.memory_storage import MemoryStorage
+from core.memory.memory_episodic import EpisodicMemory
+from core.memory.memory_vectors import VectorStore
+
+INSERT_SQL = """
+INSERT INTO episodic_memory (timestamp, user, event_type, content, emotion, importance)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def bench_store_event_unbatched(db_path: str, n: int) -> float:
+    """Η παλιά συμπεριφορά: INSERT + commit για κάθε γεγονός."""
+    storage = MemoryStorage.open(db_path)
+    epi = EpisodicMemory(storage=storage)
+    start = time.perf_counter()
+    for i in range(n):
+        storage.execute(INSERT_SQL, ("2025-01-01T00:00:00", "Angelos", "bench", f"event {i}", "neutral", 0.5))
+    elapsed = time.perf_counter() - start
+    epi.close()
+    storage.close()
+    return n / elapsed
+
+
+def bench_store_event_batched(db_path: str, n: int) -> float:
+    """Write-behind: τα γεγονότα γράφονται μαζικά σε ένα transaction."""
+    epi = EpisodicMemory(db_path)
+    start = time.perf_counter()
+    for i in range(n):
+        epi.store_event("Angelos", "bench", f"event {i}")
+    epi.flush()
+    elapsed = time.perf_counter() - start
+    epi.close()
+    return n / elapsed
+
+
+def bench_vector_search(base_path: str, n: int, dim: int = 256, queries: int = 200) -> dict:
+    """Μέσος χρόνος (ms) ανά top-10 ερώτημα σε n τυχαία κανονικοποιημένα διανύσματα."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    store = VectorStore(base_path, dim=dim, ivf_threshold=n + 1)
+    for start in range(0, n, 10000):
+        vecs = rng.standard_normal((min(10000, n - start), dim)).astype(np.float32)
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        store.add(list(range(start + 1, start + 1 + len(vecs))), vecs)
+
+    qs = rng.standard_normal((queries, dim)).astype(np.float32)
+    qs /= np.linalg.norm(qs, axis=1, keepdims=True)
+
+    results = {}
+    for label in ("brute-force", "ivf"):
+        if label == "ivf":
+            store.build_index()
+        start = time.perf_counter()
+        for q in qs:
+            store.search(q, top_k=10)
+        results[label] = (time.perf_counter() - start) * 1000 / queries
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zenia memory benchmarks")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--vectors", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("🧪 EpisodicMemory.store_event")
+        before = bench_store_event_unbatched(os.path.join(tmp, "unbatched.db3"), args.events)
+        after = bench_store_event_batched(os.path.join(tmp, "batched.db3"), args.events)
+        print(f"   commit ανά γεγονός : {before:12,.0f} events/s")
+        print(f"   write-behind batch  : {after:12,.0f} events/s  (x{after / before:.1f})")
+
+        print(f"🧪 VectorStore.search (top-10, {args.vectors:,} διανύσματα)")
+        for label, ms in bench_vector_search(os.path.join(tmp, "vectors"), args.vectors).items():
+            print(f"   {label:<20}: {ms:8.2f} ms/ερώτημα")
+
+
+if __name__ == "__main__":
+    main()